@@ -1,7 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+from analyzers.resume_context import ResumeContext
+
 from analyzers.ats_analyzer import (
     analyze_ats_compatibility,
     check_ats_format_compliance,
     generate_ats_report,
+    clear_ats_cache,
     ATSAnalyzer
 )
 
@@ -28,10 +34,14 @@ from analyzers.content_quality import (
 )
 
 __all__ = [
+    # Shared context
+    'ResumeContext',
+
     # ATS Analyzer
     'analyze_ats_compatibility',
     'check_ats_format_compliance',
     'generate_ats_report',
+    'clear_ats_cache',
     'ATSAnalyzer',
 
     # Skill Analyzer
@@ -54,6 +64,9 @@ __all__ = [
 ]
 
 
+logger = logging.getLogger(__name__)
+
+
 # Convenience function for complete analysis
 def complete_resume_analysis(
         resume_text: str,
@@ -63,11 +76,32 @@ def complete_resume_analysis(
 ) -> dict:
     """
     Perform complete resume analysis.
+    The analyzers only read their inputs, so they run concurrently.
     """
-    return {
-        'ats_analysis': analyze_ats_compatibility(resume_text, resume_skills, job_role),
-        'skill_analysis': analyze_skills(resume_skills, resume_text, job_role),
-        'experience_analysis': analyze_experience(resume_text),
-        'format_analysis': analyze_format(resume_text),
-        'content_quality': analyze_content_quality(resume_text)
-    }
\ No newline at end of file
+    # Lowercase/split the text once and share it
+    ctx = ResumeContext.from_text(resume_text)
+
+    tasks = {
+        'ats_analysis': (analyze_ats_compatibility, (resume_text, resume_skills, job_role)),
+        'skill_analysis': (analyze_skills, (resume_skills, resume_text, job_role)),
+        'experience_analysis': (analyze_experience, (resume_text,)),
+        'format_analysis': (analyze_format, (resume_text, ctx)),
+        'content_quality': (analyze_content_quality, (resume_text,))
+    }
+
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {
+            name: executor.submit(func, *args)
+            for name, (func, args) in tasks.items()
+        }
+
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                # One failing analyzer should not discard the others
+                logger.error(f"Error in {name}: {str(e)}")
+                results[name] = {'error': str(e)}
+
+    return results
\ No newline at end of file
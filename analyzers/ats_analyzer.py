@@ -1,11 +1,58 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional
+from bisect import bisect_right
+from collections import OrderedDict
 import logging
+import re
+import threading
 
+from analyzers.resume_context import ResumeContext
+from nlp.keyword_matcher import count_keywords, keyword_key
 from semantic.hybrid_ats import hybrid_ats_score, get_ats_improvement_suggestions
-from config import EXCELLENT_SCORE, GOOD_SCORE, FAIR_SCORE
+from semantic.cache import disk_memory, scoring_fingerprint, text_digest, trim_disk_cache
+from semantic.ats_cache import default_ats_cache
+from semantic.embeddings import embed_text
+from config import (
+    EXCELLENT_SCORE, GOOD_SCORE, FAIR_SCORE, ATS_CACHE_SIZE, ENABLE_CACHE,
+    ENABLE_NEAR_DUPLICATE_CACHE, ATS_JOB_SKILLS_FILE
+)
 
 logger = logging.getLogger(__name__)
 
+# Score ladders (ascending thresholds -> value for each band)
+_COMPATIBILITY_THRESHOLDS = (FAIR_SCORE, GOOD_SCORE, EXCELLENT_SCORE)
+_COMPATIBILITY_LEVELS = ("Poor", "Fair", "Good", "Excellent")
+
+_PASS_THRESHOLDS = (40, 50, 60, 70, 80)
+_PASS_PROBABILITIES = (15.0, 30.0, 50.0, 70.0, 85.0, 95.0)
+
+_RECOMMENDATION_THRESHOLDS = (40, 60, 80)
+_RECOMMENDATIONS = (
+    "Your resume requires major revisions for ATS compatibility.",
+    "Your resume needs significant improvements for ATS.",
+    "Your resume is ATS-compatible with minor improvements needed.",
+    "Your resume is highly optimized for ATS. Ready to apply!"
+)
+
+# LRU cache of ATS analyses keyed by (text hash, skills, role)
+# (guarded by _ats_cache_lock; the analysis itself runs outside the lock)
+_ats_cache: OrderedDict = OrderedDict()
+_ats_cache_lock = threading.Lock()
+
+# Bullet glyphs that commonly break ATS parsers
+SPECIAL_CHARS = '•◆■●▪'
+_SPECIAL_CHARS_RE = re.compile('[' + re.escape(SPECIAL_CHARS) + ']')
+
+
+def _ats_cache_key(
+        resume_text: str,
+        resume_skills: List[str],
+        job_role: str
+) -> Tuple[str, Tuple[str, ...], str]:
+    """
+    Build a compact cache key from resume content, skills and role.
+    """
+    return text_digest(resume_text), tuple(sorted(resume_skills)), job_role
+
 
 def analyze_ats_compatibility(
         resume_text: str,
@@ -15,13 +62,85 @@ def analyze_ats_compatibility(
     """
     Comprehensive ATS compatibility analysis.
     """
+    key = None
+    if ENABLE_CACHE and isinstance(resume_text, str):
+        key = _ats_cache_key(resume_text, resume_skills, job_role)
+        with _ats_cache_lock:
+            cached = _ats_cache.get(key)
+            if cached is not None:
+                _ats_cache.move_to_end(key)
+        if cached is not None:
+            logger.debug(f"ATS cache hit for {job_role}")
+            return dict(cached)
+
+    # Near-duplicate lookup (e.g. the same resume with formatting tweaks); opt-in
+    resume_vec = None
+    result = None
+    if key is not None and ENABLE_NEAR_DUPLICATE_CACHE:
+        try:
+            resume_vec = embed_text(resume_text)
+            result = default_ats_cache.get(key[1:], resume_vec)
+        except Exception as e:
+            logger.debug(f"Skipping near-duplicate ATS cache: {str(e)}")
+
+    if result is None:
+        result = _analyze_ats_compatibility(resume_text, resume_skills, job_role)
+
+        if resume_vec is not None and 'error' not in result:
+            default_ats_cache.put(key[1:], resume_vec, result)
+
+    # Only cache successful analyses
+    if key is not None and 'error' not in result:
+        with _ats_cache_lock:
+            _ats_cache[key] = result
+            _ats_cache.move_to_end(key)
+            while len(_ats_cache) > ATS_CACHE_SIZE:
+                _ats_cache.popitem(last=False)
+
+    return dict(result)
+
+
+def clear_ats_cache() -> None:
+    """Clear cached ATS analyses."""
+    with _ats_cache_lock:
+        _ats_cache.clear()
+    default_ats_cache.clear()
+
+
+@disk_memory.cache(ignore=['resume_text'])
+def _cached_hybrid_ats_score(
+        resume_text: str,
+        text_hash: str,
+        skills_key: Tuple[str, ...],
+        job_role: str,
+        fingerprint: str
+) -> Tuple[int, Dict[str, any]]:
+    """
+    Hybrid ATS score persisted on disk across restarts.
+    Keyed on text_hash (the resume itself is never stored), skills as a
+    sorted tuple, and a fingerprint of the embedding model and ATS data.
+    """
+    return hybrid_ats_score(resume_text, list(skills_key), job_role)
+
+
+def _analyze_ats_compatibility(
+        resume_text: str,
+        resume_skills: List[str],
+        job_role: str
+) -> Dict[str, any]:
+    """
+    Run the (uncached) hybrid ATS analysis.
+    """
     try:
         # Calculate hybrid ATS score
-        ats_score, breakdown = hybrid_ats_score(
+        ats_score, breakdown = _cached_hybrid_ats_score(
             resume_text,
-            resume_skills,
-            job_role
+            text_digest(resume_text),
+            tuple(sorted(resume_skills)),
+            job_role,
+            scoring_fingerprint(ATS_JOB_SKILLS_FILE)
         )
+        trim_disk_cache()
 
         # Get improvement suggestions
         suggestions = get_ats_improvement_suggestions(breakdown)
@@ -60,49 +179,37 @@ def get_compatibility_level(score: int) -> str:
     """
     Get compatibility level from score.
     """
-    if score >= EXCELLENT_SCORE:
-        return "Excellent"
-    elif score >= GOOD_SCORE:
-        return "Good"
-    elif score >= FAIR_SCORE:
-        return "Fair"
-    else:
-        return "Poor"
+    return _COMPATIBILITY_LEVELS[bisect_right(_COMPATIBILITY_THRESHOLDS, score)]
 
 
 def calculate_pass_probability(score: int) -> float:
     """
     Calculate probability of passing ATS.
     """
-    if score >= 80:
-        return 95.0
-    elif score >= 70:
-        return 85.0
-    elif score >= 60:
-        return 70.0
-    elif score >= 50:
-        return 50.0
-    elif score >= 40:
-        return 30.0
-    else:
-        return 15.0
+    return _PASS_PROBABILITIES[bisect_right(_PASS_THRESHOLDS, score)]
 
 
 def analyze_keyword_density(
         resume_text: str,
-        keywords: List[str]
+        keywords: List[str],
+        ctx: Optional[ResumeContext] = None
 ) -> Dict[str, any]:
     """
     Analyze keyword density in resume.
     """
-    text_lower = resume_text.lower()
-    word_count = len(resume_text.split())
+    if ctx is None:
+        ctx = ResumeContext.from_text(resume_text)
+
+    word_count = ctx.word_count
+
+    # Count every keyword in a single pass over the text
+    hits = count_keywords(ctx.text_lower, keyword_key(keywords))
 
     keyword_counts = {}
     total_keyword_occurrences = 0
 
     for keyword in keywords:
-        count = text_lower.count(keyword.lower())
+        count = hits.get(keyword.lower(), 0)
         if count > 0:
             keyword_counts[keyword] = count
             total_keyword_occurrences += count
@@ -118,25 +225,35 @@ def analyze_keyword_density(
     }
 
 
-def check_ats_format_compliance(resume_text: str) -> Dict[str, any]:
+def check_ats_format_compliance(
+        resume_text: str,
+        ctx: Optional[ResumeContext] = None
+) -> Dict[str, any]:
     """
     Check if resume format is ATS-friendly.
     """
+    if ctx is None:
+        ctx = ResumeContext.from_text(resume_text)
+
     issues = []
     warnings = []
 
-    # Check for special characters that might cause issues
-    special_chars = ['•', '◆', '■', '●', '▪']
-    for char in special_chars:
-        if char in resume_text:
-            warnings.append(f"Found special character '{char}' - may not parse correctly")
+    # Check for special characters that might cause issues.
+    # Fast path: clean resumes stop after one search; otherwise collect the
+    # remaining glyphs starting from the first hit.
+    first = _SPECIAL_CHARS_RE.search(resume_text)
+    if first is not None:
+        found_chars = set(_SPECIAL_CHARS_RE.findall(resume_text, first.start()))
+        for char in SPECIAL_CHARS:
+            if char in found_chars:
+                warnings.append(f"Found special character '{char}' - may not parse correctly")
 
     # Check for tables/complex formatting indicators
     if '\t' in resume_text:
         warnings.append("Detected tab characters - may indicate table formatting")
 
     # Check resume length
-    word_count = len(resume_text.split())
+    word_count = ctx.word_count
     if word_count < 200:
         issues.append("Resume is too short (< 200 words)")
     elif word_count > 2000:
@@ -161,7 +278,8 @@ def check_ats_format_compliance(resume_text: str) -> Dict[str, any]:
 def generate_ats_report(
         resume_text: str,
         resume_skills: List[str],
-        job_role: str
+        job_role: str,
+        ctx: Optional[ResumeContext] = None
 ) -> Dict[str, any]:
     """
     Generate comprehensive ATS report.
@@ -170,7 +288,7 @@ def generate_ats_report(
     ats_analysis = analyze_ats_compatibility(resume_text, resume_skills, job_role)
 
     # Format compliance
-    format_analysis = check_ats_format_compliance(resume_text)
+    format_analysis = check_ats_format_compliance(resume_text, ctx)
 
     # Overall assessment
     overall_score = int(
@@ -189,14 +307,7 @@ def generate_ats_report(
 
 def get_final_recommendation(score: int) -> str:
     """Get final recommendation based on overall score."""
-    if score >= 80:
-        return "Your resume is highly optimized for ATS. Ready to apply!"
-    elif score >= 60:
-        return "Your resume is ATS-compatible with minor improvements needed."
-    elif score >= 40:
-        return "Your resume needs significant improvements for ATS."
-    else:
-        return "Your resume requires major revisions for ATS compatibility."
+    return _RECOMMENDATIONS[bisect_right(_RECOMMENDATION_THRESHOLDS, score)]
 
 
 def get_priority_actions(
@@ -1,21 +1,44 @@
-from typing import Dict
+from typing import Dict, List
+from bisect import bisect_right
+from operator import itemgetter
 import logging
 
-from nlp.text_analyzer import get_content_quality_score, TextAnalyzer
+from nlp.text_analyzer import get_content_quality_score, TextAnalyzer, ACTION_VERBS
 
 logger = logging.getLogger(__name__)
 
+# Shared analyzer instance (avoid re-instantiating per resume)
+_ANALYZER = TextAnalyzer()
+
+# Below this many words, skip the detailed NLP pass
+MIN_WORDS_FOR_ANALYSIS = 100
+SHORT_RESUME_SUGGESTION = "Resume too short for detailed analysis"
+
+_QUALITY_THRESHOLDS = (40, 60, 80)
+_QUALITY_LEVELS = ("Needs Improvement", "Fair", "Good", "Excellent")
+
+_STRENGTH_FIELDS = itemgetter(
+    'action_verbs', 'quantification_score', 'readability_score', 'bullet_points'
+)
+_WEAKNESS_FIELDS = itemgetter(
+    'weak_verbs_count', 'quantification_score', 'passive_voice_count', 'first_person_count'
+)
+
 
 def analyze_content_quality(resume_text: str) -> Dict[str, any]:
     """
     Analyze resume content quality.
     """
-    # Get comprehensive quality score
-    quality_data = get_content_quality_score(resume_text)
+    if len(resume_text.split()) < MIN_WORDS_FOR_ANALYSIS:
+        # Too short for meaningful metrics; return cheap defaults
+        quality_data = _empty_quality_data()
+        suggestions = [SHORT_RESUME_SUGGESTION]
+    else:
+        # Get comprehensive quality score
+        quality_data = get_content_quality_score(resume_text)
 
-    # Get suggestions
-    analyzer = TextAnalyzer()
-    suggestions = analyzer.get_suggestions(resume_text)
+        # Get suggestions (reusing the computed quality data)
+        suggestions = _ANALYZER.get_suggestions(resume_text, quality_data)
 
     return {
         'overall_score': quality_data['overall_score'],
@@ -33,33 +56,49 @@ def analyze_content_quality(resume_text: str) -> Dict[str, any]:
     }
 
 
+def _empty_quality_data() -> Dict[str, any]:
+    """Default quality data for resumes too short to analyze."""
+    action_verbs = dict.fromkeys(ACTION_VERBS, 0)
+    action_verbs['total'] = 0
+
+    return {
+        'overall_score': 0,
+        'action_verbs': action_verbs,
+        'weak_verbs_count': 0,
+        'quantification_score': 0.0,
+        'readability_score': 0.0,
+        'passive_voice_count': 0,
+        'first_person_count': 0,
+        'bullet_points': {
+            'count': 0,
+            'avg_length': 0,
+            'with_action_verbs': 0,
+            'with_quantification': 0
+        }
+    }
+
+
 def get_quality_level(score: float) -> str:
     """Get quality level from score."""
-    if score >= 80:
-        return "Excellent"
-    elif score >= 60:
-        return "Good"
-    elif score >= 40:
-        return "Fair"
-    else:
-        return "Needs Improvement"
+    return _QUALITY_LEVELS[bisect_right(_QUALITY_THRESHOLDS, score)]
 
 
 def identify_strengths(quality_data: Dict) -> list:
     """Identify content strengths."""
     strengths = []
+    action_verbs, quantification, readability, bullets = _STRENGTH_FIELDS(quality_data)
 
-    if quality_data['action_verbs']['total'] >= 10:
+    if action_verbs['total'] >= 10:
         strengths.append("Strong use of action verbs")
 
-    if quality_data['quantification_score'] >= 40:
+    if quantification >= 40:
         strengths.append("Good quantification of achievements")
 
-    if quality_data['readability_score'] >= 70:
+    if readability >= 70:
         strengths.append("Clear and readable content")
 
-    if quality_data['bullet_points'].get('count', 0) > 0:
-        if quality_data['bullet_points']['action_verb_percentage'] >= 70:
+    if bullets.get('count', 0) > 0:
+        if bullets['action_verb_percentage'] >= 70:
             strengths.append("Effective bullet point structure")
 
     return strengths
@@ -68,17 +107,18 @@ def identify_strengths(quality_data: Dict) -> list:
 def identify_weaknesses(quality_data: Dict) -> List[str]:
     """Identify content weaknesses."""
     weaknesses = []
+    weak_verbs, quantification, passive_voice, first_person = _WEAKNESS_FIELDS(quality_data)
 
-    if quality_data['weak_verbs_count'] > 5:
+    if weak_verbs > 5:
         weaknesses.append("Too many weak verbs")
 
-    if quality_data['quantification_score'] < 30:
+    if quantification < 30:
         weaknesses.append("Insufficient quantification")
 
-    if quality_data['passive_voice_count'] > 5:
+    if passive_voice > 5:
         weaknesses.append("Excessive passive voice")
 
-    if quality_data['first_person_count'] > 0:
+    if first_person > 0:
         weaknesses.append("Contains first-person pronouns")
 
     return weaknesses
\ No newline at end of file
@@ -1,11 +1,24 @@
 from typing import Dict, List
+from bisect import bisect_right
 import re
 import logging
 
 from nlp.entity_extractor import extract_years_of_experience, extract_companies
+from nlp.keyword_matcher import scan_keywords, keyword_key
 
 logger = logging.getLogger(__name__)
 
+COMMON_TITLES = (
+    'engineer', 'developer', 'analyst', 'manager', 'lead',
+    'senior', 'junior', 'intern', 'consultant', 'specialist',
+    'architect', 'designer', 'scientist', 'researcher'
+)
+_TITLES_KEY = keyword_key(COMMON_TITLES)
+
+# Years-of-experience ladder (ascending thresholds -> level for each band)
+_EXPERIENCE_THRESHOLDS = (2, 5, 10)
+_EXPERIENCE_LEVELS = ("Entry-level", "Junior", "Mid-level", "Senior")
+
 
 def analyze_experience(resume_text: str) -> Dict[str, any]:
     """
@@ -38,32 +51,15 @@ def get_experience_level(years: int = None) -> str:
     """Determine experience level."""
     if years is None:
         return "Unknown"
-    elif years >= 10:
-        return "Senior"
-    elif years >= 5:
-        return "Mid-level"
-    elif years >= 2:
-        return "Junior"
-    else:
-        return "Entry-level"
+
+    return _EXPERIENCE_LEVELS[bisect_right(_EXPERIENCE_THRESHOLDS, years)]
 
 
 def extract_job_titles(text: str) -> List[str]:
     """Extract job titles from resume."""
-    common_titles = [
-        'engineer', 'developer', 'analyst', 'manager', 'lead',
-        'senior', 'junior', 'intern', 'consultant', 'specialist',
-        'architect', 'designer', 'scientist', 'researcher'
-    ]
-
-    found_titles = []
-    text_lower = text.lower()
-
-    for title in common_titles:
-        if title in text_lower:
-            found_titles.append(title)
+    hits = scan_keywords(text.lower(), _TITLES_KEY)
 
-    return list(set(found_titles))
+    return [title for title in COMMON_TITLES if title in hits]
 
 
 def generate_experience_assessment(years: int = None, company_count: int = 0) -> str:
@@ -1,19 +1,46 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 import re
 import logging
 
-logger = logging.getLogger(__name__)
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy
+    njit = None
 
+from analyzers.resume_context import ResumeContext
+from nlp.keyword_matcher import scan_keywords, keyword_key
+
+logger = logging.getLogger(__name__)
 
-def analyze_format(resume_text: str) -> Dict[str, any]:
+# Keywords that indicate each standard resume section
+SECTION_KEYWORDS = {
+    'contact': ('email', 'phone', '@'),
+    'summary': ('summary', 'objective', 'profile'),
+    'experience': ('experience', 'work history', 'employment'),
+    'education': ('education', 'degree', 'university'),
+    'skills': ('skills', 'technologies', 'proficiencies'),
+    'projects': ('project',)
+}
+_SECTION_KEY = keyword_key(k for kws in SECTION_KEYWORDS.values() for k in kws)
+
+
+def analyze_format(
+        resume_text: str,
+        ctx: Optional[ResumeContext] = None
+) -> Dict[str, any]:
     """
     Analyze resume format and structure.
     """
+    if ctx is None:
+        ctx = ResumeContext.from_text(resume_text)
+
     # Check sections
-    sections_present = check_sections(resume_text)
+    sections_present = check_sections(resume_text, ctx)
 
     # Analyze length
-    length_analysis = analyze_length(resume_text)
+    length_analysis = analyze_length(resume_text, ctx)
 
     # Check formatting
     formatting_score = check_formatting(resume_text)
@@ -32,17 +59,16 @@ def analyze_format(resume_text: str) -> Dict[str, any]:
     }
 
 
-def check_sections(text: str) -> Dict[str, bool]:
+def check_sections(text: str, ctx: Optional[ResumeContext] = None) -> Dict[str, bool]:
     """Check for standard resume sections."""
-    text_lower = text.lower()
+    text_lower = ctx.text_lower if ctx is not None else text.lower()
+
+    # Single automaton pass over the text, then map hits back to sections
+    hits = scan_keywords(text_lower, _SECTION_KEY)
 
     sections = {
-        'contact': any(k in text_lower for k in ['email', 'phone', '@']),
-        'summary': any(k in text_lower for k in ['summary', 'objective', 'profile']),
-        'experience': any(k in text_lower for k in ['experience', 'work history', 'employment']),
-        'education': any(k in text_lower for k in ['education', 'degree', 'university']),
-        'skills': any(k in text_lower for k in ['skills', 'technologies', 'proficiencies']),
-        'projects': 'project' in text_lower
+        section: any(k in hits for k in keywords)
+        for section, keywords in SECTION_KEYWORDS.items()
     }
 
     return sections
@@ -54,10 +80,9 @@ def get_missing_sections(sections: Dict[str, bool]) -> List[str]:
     return [s for s in critical if not sections.get(s, False)]
 
 
-def analyze_length(text: str) -> Dict[str, any]:
+def analyze_length(text: str, ctx: Optional[ResumeContext] = None) -> Dict[str, any]:
     """Analyze resume length."""
-    words = text.split()
-    word_count = len(words)
+    word_count = ctx.word_count if ctx is not None else len(text.split())
 
     return {
         'word_count': word_count,
@@ -70,19 +95,63 @@ def analyze_length(text: str) -> Dict[str, any]:
     }
 
 
+LONG_LINE_LENGTH = 100
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _format_kernel(buf):
+        """Count caps, long lines and total lines in one pass over UTF-8 bytes."""
+        caps = 0
+        long_lines = 0
+        total_lines = 1
+        line_len = 0
+        for b in buf:
+            if b == 10:
+                if line_len > LONG_LINE_LENGTH:
+                    long_lines += 1
+                total_lines += 1
+                line_len = 0
+            elif (b & 0xC0) != 0x80:  # skip UTF-8 continuation bytes
+                line_len += 1
+                if 65 <= b <= 90:
+                    caps += 1
+        if line_len > LONG_LINE_LENGTH:
+            long_lines += 1
+        return caps, long_lines, total_lines
+
+
+def _format_counts(text: str) -> tuple:
+    """Return (caps, long_lines, total_lines) for text."""
+    if njit is not None:
+        buf = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+        caps, long_lines, total_lines = _format_kernel(buf)
+        return int(caps), int(long_lines), int(total_lines)
+
+    # NumPy fallback: vectorized A-Z count over the ASCII bytes
+    buf = np.frombuffer(text.encode('ascii', 'ignore'), dtype=np.uint8)
+    caps = int(((buf >= 0x41) & (buf <= 0x5A)).sum())
+
+    lines = text.split('\n')
+    line_lengths = np.fromiter(map(len, lines), dtype=np.int64, count=len(lines))
+    long_lines = int((line_lengths > LONG_LINE_LENGTH).sum())
+
+    return caps, long_lines, len(lines)
+
+
 def check_formatting(text: str) -> int:
     """Check formatting quality (0-100)."""
     score = 100
 
+    caps, long_lines, total_lines = _format_counts(text)
+
     # Penalize for excessive caps
-    caps_ratio = sum(1 for c in text if c.isupper()) / len(text) if text else 0
+    caps_ratio = caps / len(text) if text else 0
     if caps_ratio > 0.15:
         score -= 10
 
     # Penalize for very long lines (indicates poor formatting)
-    lines = text.split('\n')
-    long_lines = sum(1 for line in lines if len(line) > 100)
-    if long_lines > len(lines) * 0.3:
+    if long_lines > total_lines * 0.3:
         score -= 15
 
     return max(0, score)
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class ResumeContext:
+    """
+    Text derived once per resume and shared across analyzers.
+    """
+    text: str
+    text_lower: str
+    words: List[str]
+    word_count: int
+
+    @classmethod
+    def from_text(cls, text: str) -> 'ResumeContext':
+        """Build context with a single lowercase and split pass."""
+        words = text.split()
+        return cls(
+            text=text,
+            text_lower=text.lower(),
+            words=words,
+            word_count=len(words)
+        )
@@ -1,11 +1,24 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional
+from bisect import bisect_right
+from functools import lru_cache
 import logging
+import numpy as np
 
 from nlp.skill_extractor import categorize_skills, suggest_related_skills
 from semantic.skill_gap import semantic_skill_gap, analyze_skill_coverage
 
 logger = logging.getLogger(__name__)
 
+# Skill-count ladders (ascending thresholds -> value for each band)
+_SKILL_COUNT_THRESHOLDS = (5, 10, 15)
+_SKILL_STRENGTHS = ("Weak", "Fair", "Good", "Strong")
+_SKILL_RECOMMENDATIONS = (
+    "Significantly expand your skill set.",
+    "Add more relevant technical skills.",
+    "Good skill set. Consider adding specialized skills.",
+    "Excellent skill coverage!"
+)
+
 
 def analyze_skills(
         resume_skills: List[str],
@@ -43,26 +56,12 @@ def calculate_skill_strength(skill_count: int) -> str:
     """
     Calculate skill strength level.
     """
-    if skill_count >= 15:
-        return "Strong"
-    elif skill_count >= 10:
-        return "Good"
-    elif skill_count >= 5:
-        return "Fair"
-    else:
-        return "Weak"
+    return _SKILL_STRENGTHS[bisect_right(_SKILL_COUNT_THRESHOLDS, skill_count)]
 
 
 def get_skill_recommendation(skill_count: int) -> str:
     """Get recommendation based on skill count."""
-    if skill_count >= 15:
-        return "Excellent skill coverage!"
-    elif skill_count >= 10:
-        return "Good skill set. Consider adding specialized skills."
-    elif skill_count >= 5:
-        return "Add more relevant technical skills."
-    else:
-        return "Significantly expand your skill set."
+    return _SKILL_RECOMMENDATIONS[bisect_right(_SKILL_COUNT_THRESHOLDS, skill_count)]
 
 
 def analyze_skill_gaps(
@@ -97,21 +96,23 @@ def compare_skill_sets(
     """
     Compare candidate skills against ideal skill set.
     """
-    candidate_set = set(s.lower() for s in candidate_skills)
-    ideal_set = set(s.lower() for s in ideal_skills)
+    candidate_set = frozenset(map(str.casefold, candidate_skills))
+    ideal_set = frozenset(map(str.casefold, ideal_skills))
 
     matched = candidate_set & ideal_set
     missing = ideal_set - candidate_set
     extra = candidate_set - ideal_set
 
-    match_percentage = (len(matched) / len(ideal_set) * 100) if ideal_set else 0
+    n_ideal = len(ideal_set)
+    n_matched = len(matched)
+    match_percentage = (n_matched / n_ideal * 100) if n_ideal else 0
 
     return {
         'match_percentage': round(match_percentage, 2),
-        'matched_skills': sorted(list(matched)),
-        'missing_skills': sorted(list(missing)),
-        'additional_skills': sorted(list(extra)),
-        'matched_count': len(matched),
+        'matched_skills': sorted(matched),
+        'missing_skills': sorted(missing),
+        'additional_skills': sorted(extra),
+        'matched_count': n_matched,
         'missing_count': len(missing),
         'assessment': (
             'Excellent match' if match_percentage >= 80 else
@@ -122,27 +123,45 @@ def compare_skill_sets(
     }
 
 
+@lru_cache(maxsize=32)
+def _role_skill_set(job_role: str) -> frozenset:
+    """
+    Casefolded role keywords for job role (built once per role).
+    """
+    # Import role keywords
+    from ml.model_config import ROLE_KEYWORD_SETS
+
+    return frozenset(map(str.casefold, ROLE_KEYWORD_SETS.get(job_role, ())))
+
+
 def rank_skills_by_importance(
         skills: List[str],
-        job_role: str
+        job_role: str,
+        top_k: Optional[int] = None
 ) -> List[Tuple[str, int]]:
     """
     Rank skills by importance for job role.
+    If top_k is given, only the top_k most important skills are returned.
     """
-    # Import role keywords
-    from ml.model_config import ROLE_KEYWORDS
+    if not skills:
+        return []
+
+    role_skills_set = _role_skill_set(job_role)
 
-    role_skills = ROLE_KEYWORDS.get(job_role, [])
-    role_skills_set = set(s.lower() for s in role_skills)
+    # Parallel arrays: skill names and int8 importance (higher if in role keywords)
+    skills_arr = np.array(skills, dtype=object)
+    scores = np.fromiter(
+        (10 if skill.casefold() in role_skills_set else 5 for skill in skills),
+        dtype=np.int8,
+        count=len(skills)
+    )
 
-    ranked = []
-    for skill in skills:
-        # Higher score if in role keywords
-        importance = 10 if skill.lower() in role_skills_set else 5
-        ranked.append((skill, importance))
+    # Stable sort by importance (radix sort for int8 keys)
+    order = np.argsort(-scores, kind='stable')
+    if top_k is not None:
+        order = order[:top_k]
 
-    # Sort by importance
-    return sorted(ranked, key=lambda x: x[1], reverse=True)
+    return list(zip(skills_arr[order].tolist(), scores[order].tolist()))
 
 
 def generate_skill_report(
@@ -167,12 +186,12 @@ def generate_skill_report(
         )
 
     # Rank skills
-    ranked_skills = rank_skills_by_importance(resume_skills, job_role)
+    ranked_skills = rank_skills_by_importance(resume_skills, job_role, top_k=10)
 
     return {
         'skill_analysis': analysis,
         'gap_analysis': gap_analysis,
-        'ranked_skills': ranked_skills[:10],  # Top 10
+        'ranked_skills': ranked_skills,  # Top 10
         'summary': generate_skill_summary(analysis, gap_analysis)
     }
 
@@ -1,19 +1,49 @@
-import streamlit as st
+import hashlib
 
-from parsers.parser import extract_text
-from nlp.cleaner import clean_text
-from nlp.skill_extractor import load_skills, extract_skills
-from ml.predictor import predict_job_role
+import streamlit as st
 
-from utils.scoring import calculate_resume_score
 from utils.section_checker import check_resume_sections
 from utils.ats_feedback import generate_ats_feedback
 from utils.rewrite_engine import suggest_rewrites
 from utils.improvement_tips import generate_improvement_tips
 from utils.profile_extractor import extract_profile_info
 
-from semantic.hybrid_ats import hybrid_ats_score
-from semantic.semantic_job_matcher_v2 import semantic_recommend_jobs_v2
+from core.pipeline import (
+    load_role_model,
+    load_embedding_model,
+    load_job_corpus,
+    start_warmup,
+    analyze_resume,
+    ats_for_role,
+    recommend_jobs_for
+)
+
+
+# Roles with ATS skill data, in selectbox order
+TARGET_ROLES = ("Data Analyst", "ML Engineer", "Backend Developer", "Software Engineer")
+TARGET_ROLE_INDEX = {role: i for i, role in enumerate(TARGET_ROLES)}
+
+
+# ================= TAB RENDERERS =================
+# st.fragment (Streamlit >= 1.37) reruns a tab on its own; older versions render inline
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+
+@_fragment
+def render_jobs_tab(file_bytes, filename, file_hash):
+    # Jobs depend only on the resume: compute once per upload, not per widget change
+    if st.session_state.get("jobs_hash") == file_hash:
+        jobs = st.session_state["jobs_result"]
+    else:
+        load_job_corpus()
+        jobs = recommend_jobs_for(file_hash, file_bytes, filename)
+        st.session_state["jobs_hash"] = file_hash
+        st.session_state["jobs_result"] = jobs
+
+    if jobs:
+        st.dataframe(jobs, use_container_width=True)
+    else:
+        st.warning("No strong semantic job matches found.")
 
 
 # ================= PAGE CONFIG =================
@@ -23,6 +53,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Load models in the background while the user picks a file
+start_warmup()
+
 st.title("📄 AI Resume Analyzer & Resume Coach")
 st.caption("Profile-based resume analysis with ATS and Semantic AI")
 st.divider()
@@ -34,19 +67,33 @@ uploaded_file = st.file_uploader(
     type=["pdf", "docx"]
 )
 
-skills_db = load_skills()
-
-
 if uploaded_file:
-    with st.spinner("Analyzing resume..."):
-        resume_text = extract_text(uploaded_file)
+    file_bytes = uploaded_file.getvalue()
+    file_hash = hashlib.blake2b(file_bytes, digest_size=16).digest()
 
-    if resume_text and len(resume_text.strip()) > 50:
-        cleaned_text = clean_text(resume_text)
-        skills = extract_skills(cleaned_text, skills_db)
+    # Same upload as the previous rerun: reuse the result held in session state
+    if st.session_state.get("resume_hash") == file_hash:
+        result = st.session_state["resume_result"]
+    else:
+        # Report each stage as it finishes instead of one opaque spinner
+        with st.status("Analyzing resume...", expanded=True) as status:
+            st.write("Loading models...")
+            load_role_model()
+            load_embedding_model()
+            st.write("Parsing and analyzing resume...")
+            result = analyze_resume(file_hash, file_bytes, uploaded_file.name)
+            status.update(label="Analysis complete", state="complete", expanded=False)
+        st.session_state["resume_hash"] = file_hash
+        st.session_state["resume_result"] = result
+
+    resume_text = result["resume_text"]
 
-        predicted_role, confidence = predict_job_role(cleaned_text)
-        resume_score = calculate_resume_score(skills, cleaned_text)
+    if resume_text and len(resume_text.strip()) > 50:
+        cleaned_text = result["cleaned_text"]
+        skills = result["skills"]
+        predicted_role = result["predicted_role"]
+        confidence = result["confidence"]
+        resume_score = result["resume_score"]
 
         # ================= PROFILE EXTRACTION =================
         profile = extract_profile_info(resume_text)
@@ -80,13 +127,11 @@ if uploaded_file:
         st.subheader("🎯 Target Job Role")
         target_role = st.selectbox(
             "You may change the target role if applying for a different position",
-            ["Data Analyst", "ML Engineer", "Backend Developer", "Software Engineer"],
-            index=["Data Analyst", "ML Engineer", "Backend Developer", "Software Engineer"].index(predicted_role)
-            if predicted_role in ["Data Analyst", "ML Engineer", "Backend Developer", "Software Engineer"]
-            else 0
+            TARGET_ROLES,
+            index=TARGET_ROLE_INDEX.get(predicted_role, 0)
         )
 
-        ats_score, details = hybrid_ats_score(cleaned_text, skills, target_role)
+        ats_score, details = ats_for_role(file_hash, file_bytes, uploaded_file.name, target_role)
 
         # ================= SNAPSHOT =================
         s1, s2, s3 = st.columns(3)
@@ -129,11 +174,7 @@ if uploaded_file:
 
         # ---------- Jobs ----------
         with tab3:
-            jobs = semantic_recommend_jobs_v2(cleaned_text)
-            if jobs:
-                st.dataframe(jobs, use_container_width=True)
-            else:
-                st.warning("No strong semantic job matches found.")
+            render_jobs_tab(file_bytes, uploaded_file.name, file_hash)
 
         # ---------- Resume Coach ----------
         with tab4:
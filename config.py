@@ -2,6 +2,7 @@
 Configuration settings for Resume Analyzer application.
 """
 import os
+import re
 from pathlib import Path
 
 # PROJECT PATHS
@@ -23,6 +24,7 @@ JOB_ROLE_MODEL_PATH = ML_MODELS_DIR / "job_role_model.pkl"
 # Sentence Transformer Model
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 EMBEDDING_CACHE_SIZE = 1000
+EMBEDDING_QUANTIZE = True  # int8 dynamic quantization of Linear layers on CPU
 
 # ============================================
 # DATA FILES
@@ -48,6 +50,7 @@ ACTION_VERBS_FILE = ATS_DIR / "action_verbs.json"
 # Semantic similarity thresholds
 SEMANTIC_SIMILARITY_THRESHOLD = 0.55
 HIGH_SIMILARITY_THRESHOLD = 0.70
+NEAR_DUPLICATE_THRESHOLD = 0.95  # resumes treated as the same for ATS caching
 LOW_SIMILARITY_THRESHOLD = 0.40
 
 # ATS scoring weights
@@ -65,6 +68,10 @@ FAIR_SCORE = 40
 MIN_RESUME_LENGTH = 50  # characters
 MAX_RESUME_LENGTH = 50000  # characters
 MAX_FILE_SIZE_MB = 10
+PDF_PARALLEL_MIN_PAGES = 32  # shorter PDFs (every normal resume) are extracted inline
+PDF_PAGE_CHUNK = 32  # max pages per worker task
+MAX_PDF_WORKERS = min(4, os.cpu_count() or 1)
+PARSER_CACHE_SIZE = 8  # recently read files memoized per parser
 
 # ============================================
 # UI SETTINGS
@@ -74,7 +81,7 @@ APP_ICON = "📄"
 PAGE_LAYOUT = "wide"
 
 # Supported file types
-SUPPORTED_RESUME_FORMATS = ["pdf", "docx", "txt"]
+SUPPORTED_RESUME_FORMATS = ("pdf", "docx", "txt")
 
 # Display settings
 MAX_JOBS_DISPLAY = 5
@@ -84,7 +91,7 @@ MAX_TIPS_DISPLAY = 5
 # ============================================
 # JOB ROLES
 # ============================================
-SUPPORTED_JOB_ROLES = [
+SUPPORTED_JOB_ROLES = (
     "Data Analyst",
     "ML Engineer",
     "Software Engineer",
@@ -94,7 +101,8 @@ SUPPORTED_JOB_ROLES = [
     "Full Stack Developer",
     "Data Scientist",
     "Product Manager"
-]
+)
+SUPPORTED_JOB_ROLES_SET = frozenset(SUPPORTED_JOB_ROLES)  # for membership tests
 
 DEFAULT_JOB_ROLE = "Software Engineer"
 
@@ -118,6 +126,15 @@ LOG_FILE = ROOT_DIR / "app.log"
 # ============================================
 ENABLE_CACHE = True
 CACHE_TTL = 3600  # seconds (1 hour)
+ATS_CACHE_SIZE = 128  # cached ATS analyses (resume + skills + role)
+# Reuse ATS results of near-duplicate resumes (costs an extra embedding per miss;
+# a near-duplicate can still differ in the keywords the ATS score counts)
+ENABLE_NEAR_DUPLICATE_CACHE = False
+DISK_CACHE_DIR = ROOT_DIR / ".cache"  # persistent scoring cache (joblib)
+DISK_CACHE_BYTES_LIMIT = 256 * 1024 * 1024  # oldest-accessed entries are dropped beyond this
+DISK_CACHE_MAX_AGE_DAYS = 7  # entries not accessed for this long are dropped
+DISK_CACHE_TRIM_INTERVAL = 600  # seconds between size/age trims
+REDIS_URL = os.getenv("REDIS_URL")  # e.g. redis://localhost:6379; unset disables Redis
 
 # ============================================
 # VALIDATION RULES
@@ -128,14 +145,20 @@ PHONE_PATTERN = r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
 LINKEDIN_PATTERN = r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+'
 GITHUB_PATTERN = r'(?:https?://)?(?:www\.)?github\.com/[\w-]+'
 
+# Compiled once at import so callers skip the re module's cache lookup
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+PHONE_RE = re.compile(PHONE_PATTERN)
+LINKEDIN_RE = re.compile(LINKEDIN_PATTERN)
+GITHUB_RE = re.compile(GITHUB_PATTERN)
+
 # Required resume sections
-REQUIRED_SECTIONS = ["experience", "education", "skills"]
-OPTIONAL_SECTIONS = ["projects", "certifications", "awards"]
+REQUIRED_SECTIONS = ("experience", "education", "skills")
+OPTIONAL_SECTIONS = ("projects", "certifications", "awards")
 
 # ============================================
 # EXPORT SETTINGS
 # ============================================
-EXPORT_FORMATS = ["pdf", "docx", "txt", "json"]
+EXPORT_FORMATS = ("pdf", "docx", "txt", "json")
 DEFAULT_EXPORT_FORMAT = "pdf"
 
 # ============================================
@@ -157,13 +180,20 @@ SUCCESS_EXPORT = "✅ Resume exported successfully!"
 # ============================================
 # HELPER FUNCTIONS
 # ============================================
+_dirs_ready = False
+
 def ensure_directories():
-    """Create all necessary directories if they don't exist."""
+    """Create all necessary directories if they don't exist (once per process)."""
+    global _dirs_ready
+    if _dirs_ready:
+        return
+
     directories = [
         DATA_DIR, SKILLS_DIR, JOBS_DIR, ATS_DIR, TEMPLATES_DIR, ML_MODELS_DIR
     ]
     for directory in directories:
         directory.mkdir(parents=True, exist_ok=True)
+    _dirs_ready = True
 
 def get_file_path(filename: str, subdirectory: str = "") -> Path:
     """Get absolute file path."""
@@ -173,7 +203,4 @@ def get_file_path(filename: str, subdirectory: str = "") -> Path:
 
 def validate_file_exists(filepath: Path) -> bool:
     """Check if file exists."""
-    return filepath.exists() and filepath.is_file()
-
-# Initialize directories on import
-ensure_directories()
\ No newline at end of file
+    return filepath.exists() and filepath.is_file()
\ No newline at end of file
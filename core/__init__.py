@@ -0,0 +1,46 @@
+from core.pipeline import (
+    load_skills_db,
+    load_role_model,
+    load_embedding_model,
+    load_job_corpus,
+    start_warmup,
+    analyze_resume,
+    embed_resume,
+    ats_for_role,
+    recommend_jobs_for
+)
+
+from core.warmup import warmup
+
+from core.rcache import (
+    get_client,
+    make_key,
+    rcache_get,
+    rcache_set,
+    rcache_memoize
+)
+
+__all__ = [
+    # Cached resources
+    'load_skills_db',
+    'load_role_model',
+    'load_embedding_model',
+    'load_job_corpus',
+    'start_warmup',
+
+    # Cached pipeline
+    'analyze_resume',
+    'embed_resume',
+    'ats_for_role',
+    'recommend_jobs_for',
+
+    # Warmup
+    'warmup',
+
+    # Redis cache
+    'get_client',
+    'make_key',
+    'rcache_get',
+    'rcache_set',
+    'rcache_memoize'
+]
@@ -0,0 +1,118 @@
+import threading
+
+import streamlit as st
+
+from utils.scoring import calculate_resume_score
+from core.rcache import make_key, rcache_memoize
+from core.warmup import warmup
+
+
+# ================= CACHED RESOURCES =================
+# Loaded once per process instead of on every Streamlit rerun.
+# Heavy packages (spaCy, sklearn, torch) are imported inside the loaders
+# so the page renders before anything is uploaded.
+@st.cache_resource(show_spinner=False)
+def load_skills_db():
+    from nlp.skill_extractor import load_skills
+    from nlp.keyword_matcher import ahocorasick, keyword_key, build_automaton
+
+    skills = load_skills()
+    # Build the skill automaton up front so the first upload doesn't pay for it
+    if skills and ahocorasick is not None:
+        build_automaton(keyword_key(skills))
+    return skills
+
+
+@st.cache_resource(show_spinner=False)
+def load_role_model():
+    from ml.predictor import load_model
+    return load_model()
+
+
+@st.cache_resource(show_spinner=False)
+def load_embedding_model():
+    from semantic.embeddings import get_model
+    return get_model()
+
+
+@st.cache_resource(show_spinner=False)
+def load_job_corpus():
+    from semantic.semantic_matcher import get_job_corpus
+    try:
+        return get_job_corpus()
+    except FileNotFoundError:
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def start_warmup() -> threading.Thread:
+    # Once per process, in the background, so the first page still renders immediately
+    thread = threading.Thread(target=warmup, name="resume-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+# ================= CACHED PIPELINE =================
+# Keyed on a compact digest of the upload (file_hash); the raw bytes are passed
+# as _file_bytes, which st.cache_data does not hash, so lookups stay O(1).
+# Redis (when REDIS_URL is set) backs st.cache_data across workers/restarts.
+@st.cache_data(show_spinner=False)
+def analyze_resume(file_hash: bytes, _file_bytes: bytes, filename: str) -> dict:
+    key = make_key("resume", filename.encode('utf-8'), _file_bytes)
+    return rcache_memoize(key, lambda: _analyze_resume(_file_bytes, filename))
+
+
+def _analyze_resume(file_bytes: bytes, filename: str) -> dict:
+    from parsers import extract_text_from_upload
+    from nlp.cleaner import clean_text
+    from nlp.skill_extractor import extract_skills
+    from ml.predictor import predict_job_role
+
+    resume_text = extract_text_from_upload(file_bytes, filename)
+    if not resume_text or len(resume_text.strip()) <= 50:
+        return {"resume_text": resume_text}
+
+    cleaned_text = clean_text(resume_text)
+    skills = extract_skills(cleaned_text, load_skills_db())
+    predicted_role, confidence = predict_job_role(cleaned_text)
+
+    return {
+        "resume_text": resume_text,
+        "cleaned_text": cleaned_text,
+        "skills": skills,
+        "predicted_role": predicted_role,
+        "confidence": confidence,
+        "resume_score": calculate_resume_score(skills, cleaned_text),
+    }
+
+
+@st.cache_data(show_spinner=False)
+def embed_resume(cleaned_text: str):
+    from semantic.embeddings import embed_text
+
+    # Shared by ATS scoring and job matching: one forward pass per resume
+    key = make_key("embed", cleaned_text.encode('utf-8'))
+    return rcache_memoize(key, lambda: embed_text(cleaned_text))
+
+
+@st.cache_data(show_spinner=False)
+def ats_for_role(file_hash: bytes, _file_bytes: bytes, filename: str, target_role: str):
+    from semantic.hybrid_ats import hybrid_ats_score
+
+    # Only this step depends on the selected role
+    result = analyze_resume(file_hash, _file_bytes, filename)
+    cleaned_text = result["cleaned_text"]
+    return hybrid_ats_score(
+        cleaned_text,
+        result["skills"],
+        target_role,
+        resume_vec=embed_resume(cleaned_text)
+    )
+
+
+@st.cache_data(show_spinner=False)
+def recommend_jobs_for(file_hash: bytes, _file_bytes: bytes, filename: str):
+    from semantic.semantic_matcher import semantic_recommend_jobs_v2
+
+    cleaned_text = analyze_resume(file_hash, _file_bytes, filename)["cleaned_text"]
+    return semantic_recommend_jobs_v2(cleaned_text, resume_vec=embed_resume(cleaned_text))
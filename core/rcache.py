@@ -0,0 +1,145 @@
+import hashlib
+import json
+import logging
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from config import REDIS_URL, CACHE_TTL
+
+try:
+    import redis
+except ImportError:  # redis is optional; the cache becomes a no-op
+    redis = None
+
+
+def _to_builtin(value):
+    # numpy scalars (e.g. rounded confidences) are stored as plain numbers
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+try:
+    import orjson
+
+    def _json_dumps(value) -> bytes:
+        return orjson.dumps(value, default=_to_builtin)
+
+    _json_loads = orjson.loads
+except ImportError:  # optional: faster JSON encoding
+    def _json_dumps(value) -> bytes:
+        return json.dumps(value, default=_to_builtin).encode('utf-8')
+
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Payload tags: JSON documents, or raw array bytes behind a small JSON header.
+# Nothing read back from Redis is ever unpickled.
+_JSON = b'J'
+_ARRAY = b'A'
+
+# Shared Redis client (singleton pattern); disabled after a failed connect
+_client = None
+_disabled = False
+
+
+def get_client():
+    """
+    Get the shared Redis client, or None when Redis is not configured/reachable.
+    """
+    global _client, _disabled
+
+    if _disabled or not REDIS_URL or redis is None:
+        return None
+
+    if _client is None:
+        try:
+            client = redis.Redis.from_url(
+                REDIS_URL,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5
+            )
+            client.ping()
+            _client = client
+            logger.info("Connected to Redis cache")
+        except Exception as e:
+            logger.warning(f"Redis unavailable, cross-session cache disabled: {str(e)}")
+            _disabled = True
+            return None
+
+    return _client
+
+
+def make_key(prefix: str, *parts: bytes) -> bytes:
+    """
+    Build a compact cache key from a prefix and the SHA-256 of the given parts.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part)
+    return prefix.encode('utf-8') + b':' + digest.digest()
+
+
+def _encode(value: Any) -> bytes:
+    if isinstance(value, np.ndarray):
+        header = _json_dumps({'dtype': value.dtype.str, 'shape': value.shape})
+        return _ARRAY + len(header).to_bytes(4, 'big') + header + np.ascontiguousarray(value).tobytes()
+    return _JSON + _json_dumps(value)
+
+
+def _decode(payload: bytes) -> Any:
+    tag, body = payload[:1], payload[1:]
+    if tag == _JSON:
+        return _json_loads(body)
+    if tag == _ARRAY:
+        size = int.from_bytes(body[:4], 'big')
+        header = _json_loads(body[4:4 + size])
+        dtype = np.dtype(header['dtype'])
+        if dtype.hasobject:
+            raise ValueError("Object arrays are not cacheable")
+        return np.frombuffer(body[4 + size:], dtype=dtype).reshape(header['shape']).copy()
+    raise ValueError(f"Unknown cache payload tag: {tag!r}")
+
+
+def rcache_get(key: bytes) -> Optional[Any]:
+    """
+    Fetch and decode a cached value; None on miss or error.
+    """
+    client = get_client()
+    if client is None:
+        return None
+
+    try:
+        payload = client.get(key)
+        return _decode(payload) if payload is not None else None
+    except Exception as e:
+        logger.warning(f"Redis get failed: {str(e)}")
+        return None
+
+
+def rcache_set(key: bytes, value: Any, ttl: int = CACHE_TTL) -> None:
+    """
+    Encode and store a value with a TTL (errors are logged, not raised).
+    Supports JSON-compatible values and numpy arrays.
+    """
+    client = get_client()
+    if client is None:
+        return
+
+    try:
+        client.setex(key, ttl, _encode(value))
+    except Exception as e:
+        logger.warning(f"Redis set failed: {str(e)}")
+
+
+def rcache_memoize(key: bytes, compute: Callable[[], Any]) -> Any:
+    """
+    Return the cached value for key, computing and storing it on a miss.
+    """
+    value = rcache_get(key)
+    if value is None:
+        value = compute()
+        rcache_set(key, value)
+    return value
@@ -0,0 +1,63 @@
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+WARMUP_TEXT = "Experienced python developer with sql and machine learning projects"
+
+
+def warmup() -> None:
+    """
+    Load models, build lookup structures and run one dummy pass of each stage.
+    Safe to call repeatedly: every step hits a process-level singleton.
+    """
+    start = time.perf_counter()
+
+    steps = [
+        ("skills automaton", _warm_skills),
+        ("role model", _warm_role_model),
+        ("embedding model", _warm_embeddings),
+        ("job corpus", _warm_job_corpus),
+    ]
+
+    for name, step in steps:
+        try:
+            step()
+        except Exception as e:
+            # A missing model/data file should not stop the remaining steps
+            logger.warning(f"Warmup step '{name}' failed: {str(e)}")
+
+    logger.info(f"Warmup finished in {time.perf_counter() - start:.1f}s")
+
+
+def _warm_skills() -> None:
+    from nlp.skill_extractor import load_skills, extract_skills
+    from nlp.keyword_matcher import count_keywords, keyword_key
+
+    skills = load_skills()
+    extract_skills(WARMUP_TEXT, skills)
+    # Triggers the Numba JIT when the kernel is the active backend
+    count_keywords(WARMUP_TEXT.lower(), keyword_key(["python", "sql"]))
+
+
+def _warm_role_model() -> None:
+    from ml.predictor import predict_job_role
+
+    predict_job_role(WARMUP_TEXT)
+
+
+def _warm_embeddings() -> None:
+    from semantic.embeddings import embed_text
+
+    embed_text(WARMUP_TEXT, use_cache=False)
+
+
+def _warm_job_corpus() -> None:
+    from semantic.semantic_matcher import get_job_corpus
+
+    get_job_corpus()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    warmup()
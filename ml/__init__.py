@@ -12,6 +12,8 @@ from ml.train_model import (
     train_from_scratch,
     load_training_data,
     train_model,
+    create_serving_pipeline,
+    compare_pipelines,
     save_model,
     load_model,
     evaluate_model
@@ -21,7 +23,10 @@ from ml.model_config import (
     JOB_ROLES,
     DEFAULT_ROLE,
     ROLE_KEYWORDS,
-    get_recommended_roles
+    ROLE_KEYWORD_SETS,
+    KEYWORD_TO_ROLES,
+    get_recommended_roles,
+    get_recommended_roles_batch
 )
 
 __all__ = [
@@ -38,6 +43,8 @@ __all__ = [
     'train_from_scratch',
     'load_training_data',
     'train_model',
+    'create_serving_pipeline',
+    'compare_pipelines',
     'save_model',
     'load_model',
     'evaluate_model',
@@ -46,7 +53,10 @@ __all__ = [
     'JOB_ROLES',
     'DEFAULT_ROLE',
     'ROLE_KEYWORDS',
-    'get_recommended_roles'
+    'ROLE_KEYWORD_SETS',
+    'KEYWORD_TO_ROLES',
+    'get_recommended_roles',
+    'get_recommended_roles_batch'
 ]
 
 
@@ -1,6 +1,15 @@
 from pathlib import Path
+from collections import Counter
+from dataclasses import dataclass, asdict
+from typing import Optional
+import numpy as np
 from config import ML_MODELS_DIR, JOB_ROLE_MODEL_PATH, JOBS_DIR
 
+try:
+    from rapidfuzz import process as rf_process, fuzz
+except ImportError:  # optional: typo-tolerant skill matching
+    rf_process = None
+
 # MODEL PATHS
 JOB_ROLE_MODEL = JOB_ROLE_MODEL_PATH
 SKILL_CLASSIFIER_MODEL = ML_MODELS_DIR / "skill_classifier.pkl"
@@ -30,6 +39,25 @@ LOGISTIC_REGRESSION_CONFIG = {
     'class_weight': 'balanced'  # Handle imbalanced classes
 }
 
+# Hashing vectorizer settings (serving pipeline: no vocabulary dict to unpickle,
+# only a fixed-size idf array)
+HASHING_CONFIG = {
+    'n_features': 2 ** 14,
+    'ngram_range': (1, 2),
+    'alternate_sign': False,
+    'norm': None  # TfidfTransformer normalizes after idf weighting
+}
+
+# Train the hashing pipeline instead of the vocabulary-based one
+USE_SERVING_PIPELINE = False
+
+# Max accuracy drop accepted when switching to the serving pipeline
+SERVING_ACCURACY_TOLERANCE = 0.01
+
+# ONNX export is only written if it reproduces sklearn's probabilities
+ONNX_PARITY_SAMPLES = 64  # held-out texts compared on export
+ONNX_PARITY_ATOL = 1e-5
+
 # Random Forest settings (alternative classifier)
 RANDOM_FOREST_CONFIG = {
     'n_estimators': 100,
@@ -45,6 +73,7 @@ RANDOM_FOREST_CONFIG = {
 # ============================================
 MIN_CONFIDENCE_THRESHOLD = 0.3  # Minimum confidence to accept prediction
 TOP_N_PREDICTIONS = 3  # Number of top predictions to return
+FUZZY_MATCH_CUTOFF = 85  # Min rapidfuzz ratio for a misspelt skill to count
 
 # ============================================
 # JOB ROLES
@@ -70,6 +99,7 @@ DEFAULT_ROLE = "Software Engineer"
 TEST_SIZE = 0.2  # Train/test split ratio
 RANDOM_STATE = 42
 CROSS_VALIDATION_FOLDS = 5
+TRAINING_N_JOBS = -1  # parallel cross-validation folds (-1 = all cores)
 
 # ============================================
 # MODEL EVALUATION METRICS
@@ -85,14 +115,24 @@ METRICS_TO_TRACK = [
 # MODEL VERSIONING
 # ============================================
 MODEL_VERSION = "1.0.0"
-MODEL_METADATA = {
-    'version': MODEL_VERSION,
-    'algorithm': 'LogisticRegression',
-    'feature_extraction': 'TF-IDF',
-    'date_created': None,  # Will be set during training
-    'training_samples': None,  # Will be set during training
-    'accuracy': None  # Will be set during training
-}
+
+
+@dataclass(frozen=True, slots=True)
+class ModelMetadata:
+    """Metadata saved alongside a trained model."""
+    version: str = MODEL_VERSION
+    algorithm: str = 'LogisticRegression'
+    feature_extraction: str = 'TF-IDF'
+    date_created: Optional[str] = None  # Will be set during training
+    training_samples: Optional[int] = None  # Will be set during training
+    accuracy: Optional[float] = None  # Will be set during training
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# Dict view of the defaults (kept for existing readers)
+MODEL_METADATA = ModelMetadata().to_dict()
 
 # ============================================
 # FEATURE ENGINEERING
@@ -144,6 +184,28 @@ ROLE_KEYWORDS = {
     ]
 }
 
+# Keyword sets per role, and the inverted keyword -> roles index
+ROLE_KEYWORD_SETS = {role: frozenset(keywords) for role, keywords in ROLE_KEYWORDS.items()}
+
+KEYWORD_TO_ROLES = {}
+for _role, _keywords in ROLE_KEYWORD_SETS.items():
+    for _keyword in _keywords:
+        KEYWORD_TO_ROLES.setdefault(_keyword, []).append(_role)
+del _role, _keywords, _keyword
+
+# Declaration order, used to break score ties deterministically
+_ROLE_ORDER = {role: i for i, role in enumerate(ROLE_KEYWORDS)}
+_ROLE_NAMES = tuple(ROLE_KEYWORDS)
+
+# Keyword ids and the (keyword x role) incidence matrix for batch scoring
+KEYWORD_IDS = {keyword: i for i, keyword in enumerate(KEYWORD_TO_ROLES)}
+_KEYWORDS = tuple(KEYWORD_IDS)
+_ROLE_KEYWORD_MATRIX = np.zeros((len(KEYWORD_IDS), len(_ROLE_NAMES)), dtype=np.int32)
+for _keyword, _roles in KEYWORD_TO_ROLES.items():
+    for _role in _roles:
+        _ROLE_KEYWORD_MATRIX[KEYWORD_IDS[_keyword], _ROLE_ORDER[_role]] = 1
+del _keyword, _roles, _role
+
 # ============================================
 # VALIDATION SETTINGS
 # ============================================
@@ -180,8 +242,9 @@ def validate_training_data(df) -> tuple:
     required_columns = ['job_description', 'job_title']
 
     # Check columns
-    if not all(col in df.columns for col in required_columns):
-        return False, f"Missing required columns: {required_columns}"
+    missing = set(required_columns) - set(df.columns)
+    if missing:
+        return False, f"Missing required columns: {sorted(missing)}"
 
     # Check for empty data
     if len(df) == 0:
@@ -194,26 +257,83 @@ def validate_training_data(df) -> tuple:
     if len(insufficient) > 0:
         return False, f"Insufficient samples for classes: {insufficient.index.tolist()}"
 
-    # Check text length
-    short_texts = df[df['job_description'].str.len() < MIN_JOB_DESC_LENGTH]
-    if len(short_texts) > 0:
-        return False, f"Found {len(short_texts)} job descriptions that are too short"
+    # Check text length (one pass into an int32 array; NaN rows are not counted)
+    descs = df['job_description'].to_numpy(dtype=object)
+    lens = np.fromiter(
+        (len(d) if isinstance(d, str) else MIN_JOB_DESC_LENGTH for d in descs),
+        dtype=np.int32,
+        count=len(descs)
+    )
+    n_short = int((lens < MIN_JOB_DESC_LENGTH).sum())
+    if n_short:
+        return False, f"Found {n_short} job descriptions that are too short"
 
     return True, "Valid"
 
 
+def _fuzzy_keywords(misses: list) -> dict:
+    """
+    Map misspelt skills ("tensrflow") to their closest keyword, if close enough.
+    """
+    if not misses or rf_process is None:
+        return {}
+
+    # Score all misses against all keywords in one batched call
+    scores = rf_process.cdist(
+        misses, _KEYWORDS,
+        scorer=fuzz.ratio,
+        score_cutoff=FUZZY_MATCH_CUTOFF,
+        workers=-1
+    )
+    best = scores.argmax(axis=1)
+
+    return {miss: _KEYWORDS[j] for miss, j, row in zip(misses, best, scores) if row[j] > 0}
+
+
 def get_recommended_roles(skills: list) -> list:
 
-    skill_set = set(s.lower() for s in skills)
-    role_scores = {}
+    skill_set = {s.lower() for s in skills}
+    matched = skill_set.intersection(KEYWORD_TO_ROLES)
+
+    # Typos: canonicalize the misses to their closest keywords
+    matched.update(_fuzzy_keywords(list(skill_set - matched)).values())
+
+    # Walk the matched keywords through the inverted index
+    role_scores = Counter()
+    for keyword in matched:
+        role_scores.update(KEYWORD_TO_ROLES[keyword])
+
+    # Sort by score; ties keep ROLE_KEYWORDS order
+    sorted_roles = sorted(role_scores, key=lambda r: (-role_scores[r], _ROLE_ORDER[r]))
+
+    return sorted_roles[:TOP_N_PREDICTIONS]
+
+
+def get_recommended_roles_batch(skill_lists: list) -> list:
+    """
+    get_recommended_roles for many skill lists with one matrix product.
+    """
+    if not skill_lists:
+        return []
+
+    skill_sets = [{s.lower() for s in skills} for skills in skill_lists]
+
+    # Typos: one fuzzy pass over the distinct misses of the whole batch
+    misses = set().union(*skill_sets) - KEYWORD_IDS.keys()
+    fuzzy = _fuzzy_keywords(sorted(misses))
+
+    # Skill lists -> (N x keywords) bitmap -> (N x roles) match counts
+    bitmap = np.zeros((len(skill_lists), len(KEYWORD_IDS)), dtype=np.int32)
+    for row, skill_set in enumerate(skill_sets):
+        ids = [KEYWORD_IDS[fuzzy.get(s, s)] for s in skill_set if fuzzy.get(s, s) in KEYWORD_IDS]
+        bitmap[row, ids] = 1
 
-    for role, keywords in ROLE_KEYWORDS.items():
-        # Count matching keywords
-        matches = sum(1 for kw in keywords if kw in skill_set)
-        if matches > 0:
-            role_scores[role] = matches
+    scores = bitmap @ _ROLE_KEYWORD_MATRIX
 
-    # Sort by score
-    sorted_roles = sorted(role_scores.items(), key=lambda x: x[1], reverse=True)
+    # Stable sort keeps ROLE_KEYWORDS order on ties, like the single version
+    top = np.argsort(-scores, axis=1, kind='stable')[:, :TOP_N_PREDICTIONS]
 
-    return [role for role, score in sorted_roles[:TOP_N_PREDICTIONS]]
\ No newline at end of file
+    return [
+        [_ROLE_NAMES[r] for r in row_top if row_scores[r] > 0]
+        for row_top, row_scores in zip(top, scores)
+    ]
\ No newline at end of file
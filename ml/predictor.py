@@ -1,8 +1,16 @@
-import pickle
+import sys
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, List, Dict, Optional
 import numpy as np
+import joblib
+from scipy.special import softmax
+
+try:
+    import onnxruntime as ort
+except ImportError:  # optional: ONNX Runtime serving for batches
+    ort = None
 
 from ml.model_config import (
     JOB_ROLE_MODEL,
@@ -38,8 +46,9 @@ def load_model():
         )
 
     try:
-        with open(model_path, 'rb') as f:
-            model_data = pickle.load(f)
+        # mmap the numpy arrays (coef_, idf_) instead of copying them into memory;
+        # joblib.load also reads models saved with plain pickle
+        model_data = joblib.load(model_path, mmap_mode='r')
 
         # Handle both old and new format
         if isinstance(model_data, dict):
@@ -66,6 +75,89 @@ def load_model():
         raise RuntimeError(f"Failed to load model: {str(e)}")
 
 
+@lru_cache(maxsize=1)
+def _class_names() -> Tuple[str, ...]:
+    """
+    Model classes as interned Python strings; index i is role_id i.
+    """
+    model, _ = load_model()
+    return tuple(sys.intern(str(c)) for c in model.classes_)
+
+
+def _predict_proba(clf, features) -> np.ndarray:
+    """
+    Class probabilities for one TF-IDF row.
+    Multinomial LogisticRegression is scored directly as softmax(X @ coef_.T + b),
+    skipping sklearn's per-call input validation; other classifiers use predict_proba.
+    """
+    coef = getattr(clf, 'coef_', None)
+    multinomial = (
+        coef is not None
+        and coef.shape[0] == len(clf.classes_) > 2
+        and getattr(clf, 'multi_class', 'auto') != 'ovr'
+        and getattr(clf, 'solver', '') != 'liblinear'
+    )
+    if not multinomial:
+        return clf.predict_proba(features)[0]
+
+    logits = np.asarray(features @ coef.T).ravel() + clf.intercept_
+    return softmax(logits)
+
+
+@lru_cache(maxsize=1)
+def _onnx_session():
+    """
+    ONNX Runtime session for the exported pipeline, or None if unavailable.
+    Exports older than the joblib model are ignored.
+    """
+    onnx_path = JOB_ROLE_MODEL.with_suffix('.onnx')
+
+    if ort is None or not onnx_path.exists():
+        return None
+    if JOB_ROLE_MODEL.exists() and onnx_path.stat().st_mtime < JOB_ROLE_MODEL.stat().st_mtime:
+        logger.warning(f"Ignoring stale ONNX model: {onnx_path}")
+        return None
+
+    try:
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        return ort.InferenceSession(str(onnx_path), options, providers=['CPUExecutionProvider'])
+    except Exception as e:
+        logger.warning(f"Could not load ONNX model: {str(e)}")
+        return None
+
+
+def _predict_proba_texts(model, texts: List[str]) -> np.ndarray:
+    """
+    Class probabilities for raw texts, via ONNX Runtime when an export exists.
+    """
+    session = _onnx_session()
+    if session is not None:
+        inputs = np.array(texts, dtype=object).reshape(-1, 1)
+        return session.run(None, {'input': inputs})[1]
+
+    return model.predict_proba(texts)
+
+
+@lru_cache(maxsize=128)
+def _score(text: str):
+    """
+    Vectorize text once and score it: returns (tfidf_features, probabilities).
+    Cached so repeated resumes in a session skip TF-IDF and the classifier.
+    Works for both the TF-IDF and the hashing pipeline (all steps but 'clf').
+    """
+    model, _ = load_model()
+
+    features = model[:-1].transform([text])
+    probabilities = _predict_proba(model.named_steps['clf'], features)
+
+    # Shared between callers through the cache, so freeze them
+    features.data.setflags(write=False)
+    probabilities.setflags(write=False)
+
+    return features, probabilities
+
+
 def predict_job_role(
         cleaned_resume_text: str,
         return_top_n: int = 1,
@@ -85,12 +177,12 @@ def predict_job_role(
         # Load model
         model, metadata = load_model()
 
-        # Make prediction
-        prediction = model.predict([cleaned_resume_text])[0]
-        probabilities = model.predict_proba([cleaned_resume_text])[0]
+        # One scoring pass; its argmax is what predict() would return
+        _, probabilities = _score(cleaned_resume_text)
 
-        # Get confidence
-        max_prob_idx = np.argmax(probabilities)
+        # Get prediction and confidence
+        max_prob_idx = int(np.argmax(probabilities))
+        prediction = _class_names()[max_prob_idx]
         confidence = probabilities[max_prob_idx]
 
         # Check confidence threshold
@@ -126,15 +218,20 @@ def predict_top_n_roles(
         model, metadata = load_model()
 
         # Get all probabilities
-        probabilities = model.predict_proba([cleaned_resume_text])[0]
-        classes = model.classes_
+        _, probabilities = _score(cleaned_resume_text)
+        classes = _class_names()
 
-        # Get top N
-        top_indices = np.argsort(probabilities)[::-1][:top_n]
+        # Get top N (partition, then sort only the selected few)
+        k = min(top_n, len(probabilities))
+        if k <= 0:
+            return []
+        part = np.argpartition(-probabilities, k - 1)[:k]
+        top_indices = part[np.argsort(-probabilities[part])]
 
         results = []
         for idx in top_indices:
             results.append({
+                'role_id': int(idx),
                 'role': classes[idx],
                 'confidence': round(probabilities[idx] * 100, 2),
                 'confidence_score': probabilities[idx]
@@ -265,7 +362,8 @@ class JobRolePredictor:
     def __init__(self):
         """Initialize predictor and load model."""
         self.model, self.metadata = load_model()
-        self.classes = list(self.model.classes_)
+        self.classes = _class_names()
+        self.class_to_id = {c: i for i, c in enumerate(self.classes)}
 
     def predict(
             self,
@@ -287,14 +385,33 @@ class JobRolePredictor:
         """
         Predict multiple resumes at once.
         """
-        results = []
-        for text in texts:
-            try:
-                role, confidence = predict_job_role(text)
-                results.append((role, confidence))
-            except Exception as e:
-                logger.error(f"Error predicting batch item: {str(e)}")
-                results.append((DEFAULT_ROLE, 0.0))
+        results = [(DEFAULT_ROLE, 0.0)] * len(texts)
+
+        # Same input rules as predict_job_role, as a validity mask; invalid items keep the default
+        mask = np.fromiter(
+            (isinstance(text, str) and len(text.strip()) >= 10 for text in texts),
+            dtype=bool,
+            count=len(texts)
+        )
+        valid = np.flatnonzero(mask)
+        if len(valid) < len(texts):
+            logger.error(f"Skipping {len(texts) - len(valid)} invalid batch item(s)")
+        if not len(valid):
+            return results
+
+        try:
+            # One TF-IDF transform and one GEMM for the whole batch
+            probabilities = _predict_proba_texts(self.model, [texts[i] for i in valid])
+        except Exception as e:
+            logger.error(f"Error predicting batch: {str(e)}")
+            return results
+
+        best = probabilities.argmax(axis=1)
+        confidences = probabilities[np.arange(len(valid)), best]
+
+        for i, idx, confidence in zip(valid, best, confidences):
+            role = self.classes[idx] if confidence >= MIN_CONFIDENCE_THRESHOLD else DEFAULT_ROLE
+            results[i] = (role, round(confidence * 100, 2))
 
         return results
 
@@ -303,17 +420,26 @@ class JobRolePredictor:
         Get most important features for prediction.
         """
         try:
-            # Get TF-IDF features
-            tfidf = self.model.named_steps['tfidf']
-            features = tfidf.transform([text])
+            # Get TF-IDF features (shared with the prediction for this text)
+            tfidf = self.model.named_steps.get('tfidf')
+            if tfidf is None:
+                # Hashing pipeline has no vocabulary to map features back to
+                return []
+            features, _ = _score(text)
 
             # Get feature names
             feature_names = tfidf.get_feature_names_out()
 
-            # Get top features
-            top_indices = features.toarray()[0].argsort()[-top_n:][::-1]
+            # Get top features from the sparse row's non-zeros (no densifying)
+            row = features.tocsr()
+            indices, values = row.indices, row.data
+            k = min(top_n, len(values))
+            if k <= 0:
+                return []
+            part = np.argpartition(-values, k - 1)[:k]
+            top = part[np.argsort(-values[part])]
 
-            return [(feature_names[i], features[0, i]) for i in top_indices]
+            return [(feature_names[indices[j]], values[j]) for j in top]
 
         except Exception as e:
             logger.error(f"Error getting feature importance: {str(e)}")
@@ -1,33 +1,48 @@
+import hashlib
 import pandas as pd
-import pickle
+import joblib
 import logging
 from datetime import datetime
 from pathlib import Path
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer, TfidfTransformer
 from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.pipeline import Pipeline
 from sklearn.metrics import classification_report, confusion_matrix, accuracy_score
 import numpy as np
 
+try:
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import StringTensorType
+except ImportError:  # optional: ONNX export for serving
+    convert_sklearn = None
+
+try:
+    import onnxruntime as ort
+except ImportError:  # exports are verified with ONNX Runtime before writing
+    ort = None
+
 from ml.model_config import (
     TRAINING_DATA_FILE,
     JOB_ROLE_MODEL,
     TFIDF_CONFIG,
+    HASHING_CONFIG,
+    USE_SERVING_PIPELINE,
+    SERVING_ACCURACY_TOLERANCE,
+    ONNX_PARITY_SAMPLES,
+    ONNX_PARITY_ATOL,
     LOGISTIC_REGRESSION_CONFIG,
     TEST_SIZE,
     RANDOM_STATE,
-    MODEL_METADATA,
+    ModelMetadata,
     validate_training_data,
-    CROSS_VALIDATION_FOLDS
+    CROSS_VALIDATION_FOLDS,
+    TRAINING_N_JOBS
 )
 from config import ensure_directories
 
 logger = logging.getLogger(__name__)
 
-# Ensure directories exist
-ensure_directories()
-
 
 def load_training_data(file_path: Path = TRAINING_DATA_FILE) -> pd.DataFrame:
     """
@@ -56,18 +71,25 @@ def preprocess_data(df: pd.DataFrame) -> tuple:
     """
     Preprocess training data.
     """
-    # Remove duplicates
-    df = df.drop_duplicates(subset=['job_description'])
-
-    # Remove NaN values
-    df = df.dropna(subset=['job_description', 'job_title'])
-
-    # Clean text (basic)
-    df['job_description'] = df['job_description'].str.lower()
-    df['job_description'] = df['job_description'].str.strip()
-
-    X = df['job_description'].values
-    y = df['job_title'].values
+    descs = df['job_description'].to_numpy(dtype=object)
+    titles = df['job_title'].to_numpy(dtype=object)
+
+    # Drop NaN rows, clean text (basic) and remove duplicates in a single scan
+    seen = set()
+    keep = []
+    cleaned = []
+    for i, (desc, title) in enumerate(zip(descs, titles)):
+        if not isinstance(desc, str) or pd.isna(title):
+            continue
+        desc = desc.lower().strip()
+        if desc in seen:
+            continue
+        seen.add(desc)
+        keep.append(i)
+        cleaned.append(desc)
+
+    X = np.array(cleaned, dtype=object)
+    y = titles[keep]
 
     logger.info(f"Preprocessed data: {len(X)} samples, {len(set(y))} classes")
 
@@ -87,12 +109,52 @@ def create_pipeline() -> Pipeline:
     return pipeline
 
 
+def create_serving_pipeline() -> Pipeline:
+    """
+    Create inference-oriented pipeline: hashed n-grams + idf weighting + Logistic Regression.
+    Has no vocabulary, so it loads in constant memory at the cost of hash collisions.
+    """
+    pipeline = Pipeline([
+        ('hash', HashingVectorizer(**HASHING_CONFIG)),
+        ('idf', TfidfTransformer(sublinear_tf=TFIDF_CONFIG['sublinear_tf'])),
+        ('clf', LogisticRegression(**LOGISTIC_REGRESSION_CONFIG))
+    ])
+
+    logger.info("Created serving pipeline: Hashing + IDF + Logistic Regression")
+    return pipeline
+
+
+def compare_pipelines(X_train, y_train, X_test, y_test) -> dict:
+    """
+    Fit both pipelines on the same split and report the serving accuracy delta.
+    """
+    full = create_pipeline().fit(X_train, y_train)
+    serving = create_serving_pipeline().fit(X_train, y_train)
+
+    full_accuracy = full.score(X_test, y_test)
+    serving_accuracy = serving.score(X_test, y_test)
+    delta = full_accuracy - serving_accuracy
+
+    logger.info(
+        f"TF-IDF accuracy: {full_accuracy:.4f}, hashing accuracy: {serving_accuracy:.4f} "
+        f"(delta {delta:+.4f})"
+    )
+
+    return {
+        'tfidf_accuracy': full_accuracy,
+        'serving_accuracy': serving_accuracy,
+        'delta': delta,
+        'within_tolerance': delta <= SERVING_ACCURACY_TOLERANCE
+    }
+
+
 def train_model(
         X_train,
         y_train,
         X_test=None,
         y_test=None,
-        save_path: Path = JOB_ROLE_MODEL
+        save_path: Path = JOB_ROLE_MODEL,
+        serving: bool = USE_SERVING_PIPELINE
 ) -> Pipeline:
     """
     Train job role prediction model.
@@ -100,7 +162,7 @@ def train_model(
     logger.info("Starting model training...")
 
     # Create pipeline
-    pipeline = create_pipeline()
+    pipeline = create_serving_pipeline() if serving else create_pipeline()
 
     # Train model
     pipeline.fit(X_train, y_train)
@@ -126,18 +188,20 @@ def train_model(
         cm = confusion_matrix(y_test, y_pred)
         logger.info(f"Confusion Matrix:\n{cm}")
 
-    # Cross-validation
+    # Cross-validation (each fold refits TF-IDF + LR, so run folds in parallel)
     cv_scores = cross_val_score(
         pipeline,
         X_train,
         y_train,
-        cv=CROSS_VALIDATION_FOLDS
+        cv=CROSS_VALIDATION_FOLDS,
+        n_jobs=TRAINING_N_JOBS
     )
     logger.info(f"Cross-validation scores: {cv_scores}")
     logger.info(f"Mean CV score: {cv_scores.mean():.4f} (+/- {cv_scores.std() * 2:.4f})")
 
-    # Save model
-    save_model(pipeline, save_path, train_accuracy, len(X_train))
+    # Save model (held-out texts, when given, check the ONNX export)
+    parity_texts = X_test if X_test is not None else X_train
+    save_model(pipeline, save_path, train_accuracy, len(X_train), list(parity_texts[:ONNX_PARITY_SAMPLES]))
 
     return pipeline
 
@@ -146,19 +210,22 @@ def save_model(
         model: Pipeline,
         save_path: Path,
         accuracy: float,
-        num_samples: int
+        num_samples: int,
+        sample_texts: list = None
 ) -> None:
     """
     Save trained model to disk.
     """
-    # Ensure directory exists
+    # Ensure directories exist
+    ensure_directories()
     save_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Update metadata
-    metadata = MODEL_METADATA.copy()
-    metadata['date_created'] = datetime.now().isoformat()
-    metadata['training_samples'] = num_samples
-    metadata['accuracy'] = round(accuracy, 4)
+    # Build metadata (stored as a plain dict so loaders need no class)
+    metadata = ModelMetadata(
+        date_created=datetime.now().isoformat(),
+        training_samples=num_samples,
+        accuracy=round(accuracy, 4)
+    ).to_dict()
 
     # Save model with metadata
     model_data = {
@@ -166,12 +233,57 @@ def save_model(
         'metadata': metadata
     }
 
-    with open(save_path, 'wb') as f:
-        pickle.dump(model_data, f)
+    # joblib stores numpy arrays raw so they can be memory-mapped on load
+    joblib.dump(model_data, save_path)
 
     logger.info(f"Model saved to: {save_path}")
     logger.info(f"Model metadata: {metadata}")
 
+    export_onnx(model, save_path.with_suffix('.onnx'), sample_texts)
+
+
+def export_onnx(model: Pipeline, onnx_path: Path, sample_texts: list = None) -> bool:
+    """
+    Export the fitted pipeline to ONNX (strings in, probabilities out).
+    The export is only written if ONNX Runtime reproduces sklearn's
+    probabilities on sample_texts; otherwise any stale export is removed.
+    """
+    if convert_sklearn is None or ort is None or not sample_texts:
+        onnx_path.unlink(missing_ok=True)
+        return False
+
+    try:
+        onx = convert_sklearn(
+            model,
+            initial_types=[('input', StringTensorType([None, 1]))],
+            target_opset=17,
+            # Plain probability tensor instead of a list of {class: prob} dicts
+            options={id(model.named_steps['clf']): {'zipmap': False}}
+        )
+        serialized = onx.SerializeToString()
+
+        # Batches are served from ONNX and single texts from sklearn: both must agree
+        session = ort.InferenceSession(serialized, providers=['CPUExecutionProvider'])
+        inputs = np.array(sample_texts, dtype=object).reshape(-1, 1)
+        onnx_proba = session.run(None, {'input': inputs})[1]
+        sklearn_proba = model.predict_proba(sample_texts)
+
+        if not (np.allclose(onnx_proba, sklearn_proba, atol=ONNX_PARITY_ATOL)
+                and np.array_equal(onnx_proba.argmax(axis=1), sklearn_proba.argmax(axis=1))):
+            max_diff = float(np.abs(onnx_proba - sklearn_proba).max())
+            raise ValueError(f"ONNX probabilities differ from sklearn (max diff {max_diff:.2e})")
+
+        with open(onnx_path, 'wb') as f:
+            f.write(serialized)
+
+        logger.info(f"ONNX model saved to: {onnx_path}")
+        return True
+
+    except Exception as e:
+        logger.warning(f"ONNX export skipped: {str(e)}")
+        onnx_path.unlink(missing_ok=True)
+        return False
+
 
 def load_model(model_path: Path = JOB_ROLE_MODEL) -> tuple:
     """
@@ -181,8 +293,7 @@ def load_model(model_path: Path = JOB_ROLE_MODEL) -> tuple:
         raise FileNotFoundError(f"Model not found: {model_path}")
 
     try:
-        with open(model_path, 'rb') as f:
-            model_data = pickle.load(f)
+        model_data = joblib.load(model_path, mmap_mode='r')
 
         # Handle both old and new format
         if isinstance(model_data, dict):
@@ -218,10 +329,40 @@ def evaluate_model(model: Pipeline, X_test, y_test) -> dict:
     return metrics
 
 
-def train_from_scratch(data_file: Path = TRAINING_DATA_FILE) -> Pipeline:
+def _file_hash(file_path: Path) -> str:
+    """
+    Content hash of a file, read in 1 MiB chunks.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def train_from_scratch(
+        data_file: Path = TRAINING_DATA_FILE,
+        serving: bool = USE_SERVING_PIPELINE,
+        force: bool = False
+) -> Pipeline:
     """
     Complete training workflow from scratch.
+    Skipped (the saved model is returned) when the training data is unchanged.
     """
+    # Training data + pipeline kind fingerprint, stored next to the model
+    hash_file = JOB_ROLE_MODEL.with_suffix('.hash')
+    data_hash = f"{_file_hash(data_file)}:{'hashing' if serving else 'tfidf'}" if data_file.exists() else None
+
+    if (
+            not force
+            and data_hash is not None
+            and JOB_ROLE_MODEL.exists()
+            and hash_file.exists()
+            and hash_file.read_text().strip() == data_hash
+    ):
+        logger.info("Skipping training - data unchanged since the saved model")
+        return load_model()[0]
+
     print("=" * 60)
     print("JOB ROLE PREDICTION MODEL TRAINING")
     print("=" * 60)
@@ -251,7 +392,7 @@ def train_from_scratch(data_file: Path = TRAINING_DATA_FILE) -> Pipeline:
 
     # Train
     print("\n4. Training model...")
-    model = train_model(X_train, y_train, X_test, y_test)
+    model = train_model(X_train, y_train, X_test, y_test, serving=serving)
     print("   ✓ Training completed")
 
     # Final evaluation
@@ -259,6 +400,10 @@ def train_from_scratch(data_file: Path = TRAINING_DATA_FILE) -> Pipeline:
     metrics = evaluate_model(model, X_test, y_test)
     print(f"   ✓ Accuracy: {metrics['accuracy']:.4f}")
 
+    # Remember which data produced the saved model
+    if data_hash is not None:
+        hash_file.write_text(data_hash)
+
     print("\n" + "=" * 60)
     print("TRAINING COMPLETED SUCCESSFULLY!")
     print("=" * 60)
@@ -277,14 +422,19 @@ if __name__ == "__main__":
     )
 
     try:
+        # --force retrains even if the training data is unchanged
+        args = sys.argv[1:]
+        force = '--force' in args
+        args = [a for a in args if a != '--force']
+
         # Check if custom data file provided
-        if len(sys.argv) > 1:
-            data_file = Path(sys.argv[1])
+        if args:
+            data_file = Path(args[0])
         else:
             data_file = TRAINING_DATA_FILE
 
         # Train model
-        model = train_from_scratch(data_file)
+        model = train_from_scratch(data_file, force=force)
 
         print(f"\nModel saved to: {JOB_ROLE_MODEL}")
         print("You can now use the model for predictions!")
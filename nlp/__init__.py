@@ -1,11 +1,14 @@
 from nlp.cleaner import (
     clean_text,
+    clean_texts,
     clean_for_display,
     normalize_text,
     remove_noise,
     extract_sentences,
     get_token_count,
     get_word_frequency,
+    get_nlp_model,
+    init_nlp_worker,
     TextCleaner
 )
 
@@ -46,18 +49,32 @@ from nlp.text_analyzer import (
     detect_first_person,
     analyze_bullet_points,
     get_content_quality_score,
+    get_content_quality_scores,
     TextAnalyzer
 )
 
+from nlp.keyword_matcher import (
+    keyword_key,
+    build_automaton,
+    count_keywords,
+    scan_keywords,
+    find_whole_words,
+    count_whole_words,
+    whole_word_pattern
+)
+
 __all__ = [
     # Cleaner
     'clean_text',
+    'clean_texts',
     'clean_for_display',
     'normalize_text',
     'remove_noise',
     'extract_sentences',
     'get_token_count',
     'get_word_frequency',
+    'get_nlp_model',
+    'init_nlp_worker',
     'TextCleaner',
 
     # Skill Extractor
@@ -95,7 +112,17 @@ __all__ = [
     'detect_first_person',
     'analyze_bullet_points',
     'get_content_quality_score',
+    'get_content_quality_scores',
     'TextAnalyzer',
+
+    # Keyword Matcher
+    'keyword_key',
+    'build_automaton',
+    'count_keywords',
+    'scan_keywords',
+    'find_whole_words',
+    'count_whole_words',
+    'whole_word_pattern',
 ]
 
 
@@ -1,27 +1,86 @@
 import spacy
 import re
+from collections import Counter
+from functools import lru_cache
 from typing import Optional
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
-# Load spaCy model (singleton pattern)
-_nlp_model = None
-
-
-def get_nlp_model():
+# Compiled once at import
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+# Standalone digits (group 1, deleted) or special characters (replaced by a
+# space, keeping important ones). The branches never overlap and replacing a
+# non-word char does not move any \b, so one pass equals the two sequential subs
+_DIGIT_OR_SPECIAL_RE = re.compile(r'\b(\d+)\b|[^\w\s\-\+\#\.\@]')
+_URL_SHORT_RE = re.compile(r'http[s]?://\S+')
+_WS_RE = re.compile(r'\s+')
+_REPEAT_PUNCT_RE = re.compile(r'([.!?]){2,}')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+# ASCII chars matched by _PUNCT_RE, mapped to a space (str.translate needs no regex engine)
+_ASCII_PUNCT_TABLE = str.maketrans({c: ' ' for c in map(chr, range(128)) if _PUNCT_RE.match(c)})
+
+# Resume boilerplate, removed in a single pass
+_NOISE_RE = re.compile(
+    r'page \d+ of \d+'
+    r'|references available upon request'
+    r'|curriculum vitae'
+    r'|resume of'
+    r'|confidential'
+    r'|\bcv\b',
+    re.IGNORECASE
+)
+
+# Components excluded (not loaded at all) per profile:
+# - lemma: lemmas need tok2vec + tagger + attribute_ruler + lemmatizer
+# - ner: entities only need tok2vec + ner
+# - senter: rule-based sentence splits on a blank English tokenizer
+_NLP_PROFILES = {
+    "full": [],
+    "lemma": ["parser", "ner", "senter"],
+    "ner": ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter"],
+    "senter": None,
+}
+
+# Serializes cold loads: lru_cache alone lets concurrent first calls
+# (e.g. the analyzers' thread pool) each load the same model
+_nlp_lock = threading.Lock()
+
+
+def get_nlp_model(profile: str = "full"):
+
+    if profile not in _NLP_PROFILES:
+        raise ValueError(f"Unknown spaCy profile: {profile}")
+
+    with _nlp_lock:
+        return _load_nlp(profile)
+
+
+@lru_cache(maxsize=None)
+def _load_nlp(profile: str):
+
+    # One model per profile per process; failures are not cached, so a later
+    # call retries once the model is installed
+    try:
+        if _NLP_PROFILES[profile] is None:
+            nlp = spacy.blank("en")
+            nlp.add_pipe("sentencizer")
+        else:
+            nlp = spacy.load("en_core_web_sm", exclude=_NLP_PROFILES[profile])
+        logger.info(f"spaCy model loaded successfully ({profile})")
+        return nlp
+    except OSError:
+        logger.error("spaCy model not found. Run: python -m spacy download en_core_web_sm")
+        raise RuntimeError("spaCy model 'en_core_web_sm' not found. Please install it.")
 
-    global _nlp_model
 
-    if _nlp_model is None:
-        try:
-            _nlp_model = spacy.load("en_core_web_sm")
-            logger.info("spaCy model loaded successfully")
-        except OSError:
-            logger.error("spaCy model not found. Run: python -m spacy download en_core_web_sm")
-            raise RuntimeError("spaCy model 'en_core_web_sm' not found. Please install it.")
+def init_nlp_worker(*profiles: str) -> None:
 
-    return _nlp_model
+    # Pool(initializer=init_nlp_worker, initargs=("lemma",)): each worker loads
+    # its models once at start-up instead of on its first task
+    for profile in profiles or ("lemma",):
+        get_nlp_model(profile)
 
 
 def clean_text(text: str, lowercase: bool = True, remove_stopwords: bool = False) -> str:
@@ -34,39 +93,70 @@ def clean_text(text: str, lowercase: bool = True, remove_stopwords: bool = False
         # Basic cleaning first
         text = _basic_clean(text)
 
-        # Process with spaCy
-        nlp = get_nlp_model()
+        # Process with spaCy (lemmatization pipes only)
+        nlp = get_nlp_model("lemma")
         doc = nlp(text)
 
-        # Extract tokens based on options
-        tokens = []
-        for token in doc:
-            # Skip if not alphabetic
-            if not token.is_alpha:
-                continue
+        cleaned = _join_lemmas(doc, lowercase, remove_stopwords)
+        logger.debug(f"Cleaned text: {len(text)} -> {len(cleaned)} characters")
 
-            # Skip stop words if requested
-            if remove_stopwords and token.is_stop:
-                continue
+        return cleaned
 
-            # Use lemma (base form)
-            word = token.lemma_
+    except Exception as e:
+        logger.error(f"Error cleaning text: {str(e)}")
+        # Fallback to basic cleaning
+        return _basic_clean(text)
 
-            # Apply lowercase if requested
-            if lowercase:
-                word = word.lower()
 
-            tokens.append(word)
+def clean_texts(
+        texts: list,
+        lowercase: bool = True,
+        remove_stopwords: bool = False,
+        batch_size: int = 64
+) -> list:
 
-        cleaned = " ".join(tokens)
-        logger.debug(f"Cleaned text: {len(text)} -> {len(cleaned)} characters")
+    # Same as clean_text per item, but streamed through nlp.pipe in batches;
+    # invalid items come back as ""
+    pre = [_basic_clean(t) if t and isinstance(t, str) else "" for t in texts]
 
-        return cleaned
+    try:
+        nlp = get_nlp_model("lemma")
+        docs = nlp.pipe(pre, batch_size=batch_size)
+        return [_join_lemmas(doc, lowercase, remove_stopwords) for doc in docs]
 
     except Exception as e:
-        logger.error(f"Error cleaning text: {str(e)}")
+        logger.error(f"Error cleaning batch: {str(e)}")
         # Fallback to basic cleaning
-        return _basic_clean(text)
+        return pre
+
+
+def _join_lemmas(doc, lowercase: bool, remove_stopwords: bool) -> str:
+
+    # Extract tokens based on options
+    tokens = []
+    for token in doc:
+        # Skip if not alphabetic
+        if not token.is_alpha:
+            continue
+
+        # Skip stop words if requested
+        if remove_stopwords and token.is_stop:
+            continue
+
+        # Use lemma (base form)
+        word = token.lemma_
+
+        # Apply lowercase if requested
+        if lowercase:
+            word = word.lower()
+
+        tokens.append(word)
+
+    return " ".join(tokens)
+
+
+def _digit_or_special(match) -> str:
+    return '' if match.group(1) else ' '
 
 
 def _basic_clean(text: str) -> str:
@@ -75,21 +165,16 @@ def _basic_clean(text: str) -> str:
         return ""
 
     # Remove URLs
-    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    text = _URL_RE.sub('', text)
 
     # Remove email addresses (preserve for extraction)
     # text = re.sub(r'\S+@\S+', '', text)
 
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-
-    # Remove special characters but keep important ones
-    text = re.sub(r'[^\w\s\-\+\#\.\@]', ' ', text)
-
-    # Remove digits only if standalone
-    text = re.sub(r'\b\d+\b', '', text)
+    # Remove special characters (keep important ones) and standalone digits
+    text = _DIGIT_OR_SPECIAL_RE.sub(_digit_or_special, text)
 
-    return text.strip()
+    # Remove extra whitespace
+    return _WS_RE.sub(' ', text).strip()
 
 
 def clean_for_display(text: str) -> str:
@@ -98,15 +183,13 @@ def clean_for_display(text: str) -> str:
         return ""
 
     # Remove URLs
-    text = re.sub(r'http[s]?://\S+', '', text)
+    text = _URL_SHORT_RE.sub('', text)
 
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
+    # Normalize whitespace (split/join also strips the ends)
+    text = " ".join(text.split())
 
     # Remove multiple punctuation
-    text = re.sub(r'([.!?]){2,}', r'\1', text)
-
-    return text.strip()
+    return _REPEAT_PUNCT_RE.sub(r'\1', text)
 
 
 def normalize_text(text: str) -> str:
@@ -114,33 +197,21 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
 
-    # Convert to lowercase
-    text = text.lower()
+    # Convert to lowercase and remove extra whitespace
+    text = " ".join(text.lower().split())
 
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-
-    # Remove punctuation
-    text = re.sub(r'[^\w\s]', ' ', text)
+    # Remove punctuation (translate table for ASCII text, regex otherwise)
+    if text.isascii():
+        text = text.translate(_ASCII_PUNCT_TABLE)
+    else:
+        text = _PUNCT_RE.sub(' ', text)
 
     return text.strip()
 
 
 def remove_noise(text: str) -> str:
 
-    noise_patterns = [
-        r'page \d+ of \d+',
-        r'references available upon request',
-        r'curriculum vitae',
-        r'resume of',
-        r'confidential',
-        r'\bcv\b'
-    ]
-
-    for pattern in noise_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-
-    return text.strip()
+    return _NOISE_RE.sub('', text).strip()
 
 
 def extract_sentences(text: str) -> list:
@@ -149,7 +220,7 @@ def extract_sentences(text: str) -> list:
         return []
 
     try:
-        nlp = get_nlp_model()
+        nlp = get_nlp_model("senter")
         doc = nlp(text)
         return [sent.text.strip() for sent in doc.sents if sent.text.strip()]
     except Exception as e:
@@ -164,9 +235,10 @@ def get_token_count(text: str) -> int:
         return 0
 
     try:
-        nlp = get_nlp_model()
-        doc = nlp(text)
-        return len([token for token in doc if token.is_alpha])
+        # is_alpha is lexical: the tokenizer alone is enough
+        nlp = get_nlp_model("senter")
+        doc = nlp.tokenizer(text)
+        return sum(1 for token in doc if token.is_alpha)
     except Exception as e:
         logger.error(f"Error counting tokens: {str(e)}")
         return len(text.split())
@@ -178,20 +250,16 @@ def get_word_frequency(text: str, top_n: int = 20) -> dict:
         return {}
 
     try:
-        nlp = get_nlp_model()
+        nlp = get_nlp_model("lemma")
         doc = nlp(text.lower())
 
-        # Count words (lemmas)
-        word_freq = {}
-        for token in doc:
-            if token.is_alpha and not token.is_stop and len(token.text) > 2:
-                lemma = token.lemma_
-                word_freq[lemma] = word_freq.get(lemma, 0) + 1
-
-        # Sort by frequency
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+        # Count words (lemmas); most_common selects the top N without a full sort
+        word_freq = Counter(
+            token.lemma_ for token in doc
+            if token.is_alpha and not token.is_stop and len(token.text) > 2
+        )
 
-        return dict(sorted_words[:top_n])
+        return dict(word_freq.most_common(top_n))
 
     except Exception as e:
         logger.error(f"Error getting word frequency: {str(e)}")
@@ -207,15 +275,15 @@ class TextCleaner:
 
         self.lowercase = lowercase
         self.remove_stopwords = remove_stopwords
-        self.nlp = get_nlp_model()
+        self.nlp = get_nlp_model("lemma")
 
     def clean(self, text: str) -> str:
 
         return clean_text(text, self.lowercase, self.remove_stopwords)
 
-    def clean_batch(self, texts: list) -> list:
+    def clean_batch(self, texts: list, batch_size: int = 64) -> list:
 
-        return [self.clean(text) for text in texts]
+        return clean_texts(texts, self.lowercase, self.remove_stopwords, batch_size)
 
 
 # Convenience function for backward compatibility
@@ -1,8 +1,10 @@
+import os
 import re
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
-import spacy
+
+from nlp.cleaner import get_nlp_model
 
 logger = logging.getLogger(__name__)
 
@@ -17,15 +19,37 @@ PATTERNS = {
     'years_exp': r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?\s+(?:experience|exp)',
 }
 
+# Compiled once at import (flags match how each pattern is used)
+_EMAIL_RE = re.compile(PATTERNS['email'])
+_PHONE_RE = re.compile(PATTERNS['phone'])
+_LINKEDIN_RE = re.compile(PATTERNS['linkedin'], re.IGNORECASE)
+_GITHUB_RE = re.compile(PATTERNS['github'], re.IGNORECASE)
+_URL_RE = re.compile(PATTERNS['url'])
+_DATE_RE = re.compile(PATTERNS['date'], re.IGNORECASE)
+_YEARS_EXP_RE = re.compile(PATTERNS['years_exp'], re.IGNORECASE)
+
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# 2-4 words of letters (Unicode-aware), each starting with a letter
+_NAME_WORD = r"[^\W\d_](?:[^\W\d_]|['\-])*"
+_NAME_LINE_RE = re.compile(rf"{_NAME_WORD}(?:\s+{_NAME_WORD}){{1,3}}$")
+
+_DEGREE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(?:bachelor|b\.?s\.?|b\.?a\.?|b\.?tech|b\.?e\.?)\s+(?:of|in)?\s+[\w\s]+',
+    r'\b(?:master|m\.?s\.?|m\.?a\.?|m\.?tech|m\.?e\.?|mba)\s+(?:of|in)?\s+[\w\s]+',
+    r'\b(?:phd|ph\.?d\.?|doctorate)\s+(?:of|in)?\s+[\w\s]+',
+    r'\b(?:associate|a\.?s\.?|a\.?a\.?)\s+(?:of|in)?\s+[\w\s]+'
+))
+
 
 def extract_emails(text: str) -> List[str]:
 
     if not text:
         return []
 
-    emails = re.findall(PATTERNS['email'], text)
-    # Clean and deduplicate
-    emails = list(set(email.lower() for email in emails))
+    emails = _EMAIL_RE.findall(text)
+    # Clean and deduplicate (first-seen order, so [0] is the first in the text)
+    emails = list(dict.fromkeys(email.lower() for email in emails))
 
     logger.debug(f"Found {len(emails)} email(s)")
     return emails
@@ -36,12 +60,12 @@ def extract_phones(text: str) -> List[str]:
     if not text:
         return []
 
-    phones = re.findall(PATTERNS['phone'], text)
+    phones = _PHONE_RE.findall(text)
     # Clean and deduplicate
-    phones = list(set(phone.strip() for phone in phones))
+    phones = list(dict.fromkeys(phone.strip() for phone in phones))
 
     # Filter out numbers that are too short or clearly not phone numbers
-    phones = [p for p in phones if len(re.sub(r'\D', '', p)) >= 10]
+    phones = [p for p in phones if len(_NON_DIGIT_RE.sub('', p)) >= 10]
 
     logger.debug(f"Found {len(phones)} phone number(s)")
     return phones
@@ -52,7 +76,7 @@ def extract_linkedin(text: str) -> Optional[str]:
     if not text:
         return None
 
-    matches = re.findall(PATTERNS['linkedin'], text, re.IGNORECASE)
+    matches = _LINKEDIN_RE.findall(text)
 
     if matches:
         # Return first match, ensure it has https
@@ -69,7 +93,7 @@ def extract_github(text: str) -> Optional[str]:
     if not text:
         return None
 
-    matches = re.findall(PATTERNS['github'], text, re.IGNORECASE)
+    matches = _GITHUB_RE.findall(text)
 
     if matches:
         # Return first match, ensure it has https
@@ -86,48 +110,37 @@ def extract_urls(text: str) -> List[str]:
     if not text:
         return []
 
-    urls = re.findall(PATTERNS['url'], text)
-    return list(set(urls))
+    urls = _URL_RE.findall(text)
+    return list(dict.fromkeys(urls))
 
 
-def extract_name(text: str) -> Optional[str]:
+def extract_name(text: str, doc=None) -> Optional[str]:
 
     if not text:
         return None
 
-    lines = text.strip().split('\n')
-
-    # Look in first 5 lines
-    for line in lines[:5]:
+    # Look in first 5 lines (without splitting the rest of the text)
+    for line in text.strip().split('\n', 5)[:5]:
         line = line.strip()
 
-        # Skip empty lines
-        if not line:
+        # A name is 2-4 alphabetic words (hyphens/apostrophes allowed); this
+        # also rules out lines with an email or phone number
+        if not _NAME_LINE_RE.match(line):
             continue
 
-        # Skip lines with email/phone
-        if '@' in line or re.search(r'\d{3}[-.]?\d{3}[-.]?\d{4}', line):
-            continue
+        # All words should start with capital letter
+        if all(w[0].isupper() for w in line.split()):
+            logger.debug(f"Extracted name: {line}")
+            return line.title()
 
-        # Check if line looks like a name
-        words = line.split()
-
-        # Name should be 2-4 words
-        if 2 <= len(words) <= 4:
-            # All words should start with capital letter
-            if all(w[0].isupper() for w in words if w):
-                # Should be mostly alphabetic
-                if all(w.replace('-', '').replace("'", '').isalpha() for w in words):
-                    logger.debug(f"Extracted name: {line}")
-                    return line.title()
-
-    # Try with spaCy NER
+    # Try with spaCy NER (only the first 500 chars)
     try:
-        import spacy
-        nlp = spacy.load("en_core_web_sm")
-        doc = nlp(text[:500])  # Only first 500 chars
+        if doc is None:
+            doc = get_nlp_model("ner")(text[:500])
 
         for ent in doc.ents:
+            if ent.end_char > 500:
+                break
             if ent.label_ == "PERSON":
                 logger.debug(f"Extracted name via NER: {ent.text}")
                 return ent.text
@@ -142,8 +155,8 @@ def extract_dates(text: str) -> List[str]:
     if not text:
         return []
 
-    dates = re.findall(PATTERNS['date'], text, re.IGNORECASE)
-    return list(set(dates))
+    dates = _DATE_RE.findall(text)
+    return list(dict.fromkeys(dates))
 
 
 def extract_years_of_experience(text: str) -> Optional[int]:
@@ -151,45 +164,32 @@ def extract_years_of_experience(text: str) -> Optional[int]:
     if not text:
         return None
 
-    text_lower = text.lower()
-    matches = re.findall(PATTERNS['years_exp'], text_lower, re.IGNORECASE)
-
-    if matches:
-        # Return the maximum years found
-        years = [int(m) for m in matches]
-        return max(years)
-
-    return None
+    # Case-insensitive pattern: no lowercased copy, no intermediate match list
+    return max((int(m.group(1)) for m in _YEARS_EXP_RE.finditer(text)), default=None)
 
 
-def extract_education_degree(text: str) -> List[str]:
+def extract_education_degree(text: str, text_lower: Optional[str] = None) -> List[str]:
 
     degrees = []
-    text_lower = text.lower()
-
-    degree_patterns = [
-        r'\b(?:bachelor|b\.?s\.?|b\.?a\.?|b\.?tech|b\.?e\.?)\s+(?:of|in)?\s+[\w\s]+',
-        r'\b(?:master|m\.?s\.?|m\.?a\.?|m\.?tech|m\.?e\.?|mba)\s+(?:of|in)?\s+[\w\s]+',
-        r'\b(?:phd|ph\.?d\.?|doctorate)\s+(?:of|in)?\s+[\w\s]+',
-        r'\b(?:associate|a\.?s\.?|a\.?a\.?)\s+(?:of|in)?\s+[\w\s]+'
-    ]
+    if text_lower is None:
+        text_lower = text.lower()
 
-    for pattern in degree_patterns:
-        matches = re.findall(pattern, text_lower, re.IGNORECASE)
+    for pattern in _DEGREE_RES:
+        matches = pattern.findall(text_lower)
         degrees.extend(matches)
 
     # Clean up
     degrees = [d.strip() for d in degrees if d.strip()]
-    return list(set(degrees))
+    return list(dict.fromkeys(degrees))
 
 
-def extract_companies(text: str) -> List[str]:
+def extract_companies(text: str, doc=None) -> List[str]:
 
     companies = []
 
     try:
-        nlp = spacy.load("en_core_web_sm")
-        doc = nlp(text)
+        if doc is None:
+            doc = get_nlp_model("ner")(text)
 
         for ent in doc.ents:
             if ent.label_ == "ORG":
@@ -200,16 +200,16 @@ def extract_companies(text: str) -> List[str]:
     except Exception as e:
         logger.warning(f"Could not extract companies: {str(e)}")
 
-    return list(set(companies))
+    return list(dict.fromkeys(companies))
 
 
-def extract_locations(text: str) -> List[str]:
+def extract_locations(text: str, doc=None) -> List[str]:
 
     locations = []
 
     try:
-        nlp = spacy.load("en_core_web_sm")
-        doc = nlp(text)
+        if doc is None:
+            doc = get_nlp_model("ner")(text)
 
         for ent in doc.ents:
             if ent.label_ in ["GPE", "LOC"]:
@@ -220,13 +220,27 @@ def extract_locations(text: str) -> List[str]:
     except Exception as e:
         logger.warning(f"Could not extract locations: {str(e)}")
 
-    return list(set(locations))
+    return list(dict.fromkeys(locations))
 
 
 def extract_all_entities(text: str) -> Dict[str, any]:
 
+    # One NER pass and one lowercased copy shared by every extractor
+    try:
+        doc = get_nlp_model("ner")(text)
+    except Exception as e:
+        logger.warning(f"Could not run spaCy NER: {str(e)}")
+        doc = None
+
+    return _entities_from_doc(text, doc)
+
+
+def _entities_from_doc(text: str, doc) -> Dict[str, any]:
+
+    text_lower = text.lower()
+
     entities = {
-        'name': extract_name(text),
+        'name': extract_name(text, doc),
         'emails': extract_emails(text),
         'phones': extract_phones(text),
         'linkedin': extract_linkedin(text),
@@ -234,9 +248,9 @@ def extract_all_entities(text: str) -> Dict[str, any]:
         'urls': extract_urls(text),
         'dates': extract_dates(text),
         'years_experience': extract_years_of_experience(text),
-        'degrees': extract_education_degree(text),
-        'companies': extract_companies(text),
-        'locations': extract_locations(text)
+        'degrees': extract_education_degree(text, text_lower),
+        'companies': extract_companies(text, doc) if doc is not None else [],
+        'locations': extract_locations(text, doc) if doc is not None else []
     }
 
     return entities
@@ -246,17 +260,21 @@ class EntityExtractor:
 
     def __init__(self):
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            # Process-wide NER singleton shared with the module-level extractors
+            self.nlp = get_nlp_model("ner")
         except:
             logger.warning("spaCy model not available for entity extraction")
             self.nlp = None
 
     def extract_contact_info(self, text: str) -> Dict[str, any]:
 
+        emails = extract_emails(text)
+        phones = extract_phones(text)
+
         return {
             'name': extract_name(text),
-            'email': extract_emails(text)[0] if extract_emails(text) else None,
-            'phone': extract_phones(text)[0] if extract_phones(text) else None,
+            'email': emails[0] if emails else None,
+            'phone': phones[0] if phones else None,
             'linkedin': extract_linkedin(text),
             'github': extract_github(text)
         }
@@ -265,6 +283,31 @@ class EntityExtractor:
 
         return extract_all_entities(text)
 
+    def extract_profile_batch(
+            self,
+            texts: List[str],
+            n_process: Optional[int] = None,
+            batch_size: int = 32
+    ) -> List[Dict[str, any]]:
+        """
+        extract_profile for many resumes, running NER through nlp.pipe.
+
+        n_process: worker processes for spaCy; defaults to half the CPUs, since
+            more workers than physical cores only adds contention. Use 1 for
+            small batches, where worker start-up dominates.
+        batch_size: texts per batch sent to each worker; ~32-64 suits resumes,
+            larger values only pay off for short texts.
+        """
+        if not self.nlp:
+            return [extract_all_entities(text) for text in texts]
+
+        if n_process is None:
+            n_process = max(1, (os.cpu_count() or 1) // 2)
+
+        # Regex extractors run on each doc's text in the same pass
+        docs = self.nlp.pipe(texts, n_process=n_process, batch_size=batch_size)
+        return [_entities_from_doc(doc.text, doc) for doc in docs]
+
     def extract_named_entities(self, text: str) -> Dict[str, List[str]]:
 
         if not self.nlp:
@@ -278,7 +321,7 @@ class EntityExtractor:
                 entities[ent.label_] = []
             entities[ent.label_].append(ent.text)
 
-        # Deduplicate
-        entities = {k: list(set(v)) for k, v in entities.items()}
+        # Deduplicate (first-seen order)
+        entities = {k: list(dict.fromkeys(v)) for k, v in entities.items()}
 
         return entities
\ No newline at end of file
@@ -0,0 +1,196 @@
+from functools import lru_cache
+from typing import Dict, Iterable, Set, Tuple
+import logging
+import re
+
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:  # fall back to the byte-scan kernel below
+    ahocorasick = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to str.count
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+
+def keyword_key(keywords: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Normalize keywords into a hashable, lowercased cache key.
+    """
+    return tuple(sorted(set(k.lower() for k in keywords if k)))
+
+
+@lru_cache(maxsize=128)
+def build_automaton(keywords: Tuple[str, ...]):
+    """
+    Build (and cache) an Aho-Corasick automaton for lowercased keywords.
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+
+    logger.debug(f"Built keyword automaton with {len(keywords)} keywords")
+    return automaton
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _count_all(text, kw_data, kw_offsets, kw_lens):
+        """Boyer-Moore-Horspool count of each keyword (non-overlapping, like str.count)."""
+        n = text.shape[0]
+        counts = np.zeros(kw_lens.shape[0], dtype=np.int64)
+        shift = np.empty(256, dtype=np.int64)
+
+        for k in range(kw_lens.shape[0]):
+            m = kw_lens[k]
+            off = kw_offsets[k]
+            if m == 0 or m > n:
+                continue
+
+            for c in range(256):
+                shift[c] = m
+            for j in range(m - 1):
+                shift[kw_data[off + j]] = m - 1 - j
+
+            i = 0
+            while i <= n - m:
+                j = m - 1
+                while j >= 0 and text[i + j] == kw_data[off + j]:
+                    j -= 1
+                if j < 0:
+                    counts[k] += 1
+                    i += m
+                else:
+                    i += shift[text[i + m - 1]]
+
+        return counts
+
+
+@lru_cache(maxsize=128)
+def _pack_keywords(keywords: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flatten UTF-8 encoded keywords into (data, offsets, lengths) arrays.
+    """
+    encoded = [k.encode('utf-8') for k in keywords]
+    lens = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    offsets = np.zeros(len(encoded), dtype=np.int64)
+    if len(encoded) > 1:
+        offsets[1:] = np.cumsum(lens)[:-1]
+    data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return data, offsets, lens
+
+
+def count_keywords(text_lower: str, keywords: Tuple[str, ...]) -> Dict[str, int]:
+    """
+    Count occurrences of every keyword in a single pass over the text.
+    Matches of the same keyword do not overlap, like str.count, on every backend.
+    """
+    counts = {}
+    if not keywords or not text_lower:
+        return counts
+
+    if ahocorasick is not None:
+        # The automaton reports every end position; skip overlapping repeats
+        last_end = {}
+        for end, keyword in build_automaton(keywords).iter(text_lower):
+            if end - len(keyword) < last_end.get(keyword, -1):
+                continue
+            counts[keyword] = counts.get(keyword, 0) + 1
+            last_end[keyword] = end
+        return counts
+
+    if njit is not None:
+        # UTF-8 is self-synchronizing, so byte matches are character matches
+        text_u8 = np.frombuffer(text_lower.encode('utf-8'), dtype=np.uint8)
+        hits = _count_all(text_u8, *_pack_keywords(keywords))
+        return {k: int(c) for k, c in zip(keywords, hits) if c > 0}
+
+    for keyword in keywords:
+        count = text_lower.count(keyword)
+        if count > 0:
+            counts[keyword] = count
+    return counts
+
+
+def scan_keywords(text_lower: str, keywords: Tuple[str, ...]) -> Set[str]:
+    """
+    Return the set of keywords that occur anywhere in the text.
+    """
+    return set(count_keywords(text_lower, keywords))
+
+
+@lru_cache(maxsize=8192)
+def whole_word_pattern(keyword: str) -> re.Pattern:
+    """
+    Compile (and cache) r'\bkeyword\b' for a literal keyword.
+    """
+    return re.compile(r'\b' + re.escape(keyword) + r'\b')
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+def _on_word_boundaries(text_lower: str, start: int, end: int, keyword: str) -> bool:
+
+    # \b holds where word-ness changes across the edge of the match
+    before = start > 0 and _is_word_char(text_lower[start - 1])
+    after = end + 1 < len(text_lower) and _is_word_char(text_lower[end + 1])
+    return before != _is_word_char(keyword[0]) and after != _is_word_char(keyword[-1])
+
+
+def find_whole_words(text_lower: str, keywords: Tuple[str, ...]) -> Set[str]:
+    """
+    Return the keywords that occur on word boundaries, matching r'\bkeyword\b'.
+    """
+    found = set()
+    if not keywords or not text_lower:
+        return found
+
+    if ahocorasick is None:
+        for keyword in keywords:
+            if whole_word_pattern(keyword).search(text_lower):
+                found.add(keyword)
+        return found
+
+    for end, keyword in build_automaton(keywords).iter(text_lower):
+        if keyword in found:
+            continue
+        if _on_word_boundaries(text_lower, end - len(keyword) + 1, end, keyword):
+            found.add(keyword)
+
+    return found
+
+
+def count_whole_words(text_lower: str, keywords: Tuple[str, ...]) -> Dict[str, int]:
+    """
+    Count word-boundary occurrences of every keyword, like len(re.findall(r'\bkeyword\b')).
+    """
+    counts = {}
+    if not keywords or not text_lower:
+        return counts
+
+    if ahocorasick is None:
+        for keyword in keywords:
+            count = len(whole_word_pattern(keyword).findall(text_lower))
+            if count > 0:
+                counts[keyword] = count
+        return counts
+
+    # re.findall does not overlap matches of the same keyword
+    last_end = {}
+    for end, keyword in build_automaton(keywords).iter(text_lower):
+        start = end - len(keyword) + 1
+        if start <= last_end.get(keyword, -1):
+            continue
+        if _on_word_boundaries(text_lower, start, end, keyword):
+            counts[keyword] = counts.get(keyword, 0) + 1
+            last_end[keyword] = end
+
+    return counts
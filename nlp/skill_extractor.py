@@ -1,15 +1,50 @@
 import json
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from functools import lru_cache
+from typing import List, Dict, Tuple
 import logging
-import re
 
+from nlp.keyword_matcher import keyword_key, find_whole_words, count_whole_words, whole_word_pattern
 from config import TECHNICAL_SKILLS_FILE, SOFT_SKILLS_FILE, DOMAIN_SKILLS_FILE, SKILLS_LIST_FILE
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional: faster JSON decoding
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
-# Cache for loaded skills
+# Cache for loaded skills (lists for the API, frozensets for membership tests)
 _skills_cache = {}
+_skill_sets = {}
+_skill_keys = {}  # id(list) -> (list, keyword key) for load_skills' cached lists
+
+# Common variations (variant spellings -> canonical skill)
+SKILL_VARIATIONS = {
+    'javascript': ['js', 'javascript'],
+    'typescript': ['ts', 'typescript'],
+    'python': ['python', 'python3', 'py'],
+    'c++': ['c++', 'cpp', 'cplusplus'],
+    'c#': ['c#', 'csharp'],
+    'node.js': ['nodejs', 'node.js', 'node js'],
+    'react.js': ['react', 'reactjs', 'react.js'],
+    'vue.js': ['vue', 'vuejs', 'vue.js'],
+    'angular': ['angular', 'angularjs'],
+    'postgresql': ['postgres', 'postgresql'],
+    'mysql': ['mysql', 'my sql'],
+    'mongodb': ['mongo', 'mongodb'],
+    'docker': ['docker', 'containerization'],
+    'kubernetes': ['k8s', 'kubernetes'],
+    'machine learning': ['ml', 'machine learning'],
+    'artificial intelligence': ['ai', 'artificial intelligence'],
+    'natural language processing': ['nlp', 'natural language processing']
+}
+
+_VARIANT_TO_CANONICAL = {}
+for _canonical, _variants in SKILL_VARIATIONS.items():
+    for _variant in _variants:
+        _VARIANT_TO_CANONICAL.setdefault(_variant, set()).add(_canonical)
 
 
 def load_skills(skills_type: str = "all") -> List[str]:
@@ -36,8 +71,8 @@ def load_skills(skills_type: str = "all") -> List[str]:
         if not skills and SKILLS_LIST_FILE.exists():
             skills = _load_skills_from_txt(SKILLS_LIST_FILE)
 
-        # Remove duplicates and normalize
-        skills = list(set(skill.lower().strip() for skill in skills if skill))
+        # Remove duplicates and normalize (sorted once, so the list is deterministic)
+        skills = sorted(set(skill.lower().strip() for skill in skills if skill))
 
         logger.info(f"Loaded {len(skills)} skills of type '{skills_type}'")
 
@@ -51,6 +86,31 @@ def load_skills(skills_type: str = "all") -> List[str]:
         return []
 
 
+def _load_skill_set(skills_type: str) -> frozenset:
+
+    skill_set = _skill_sets.get(skills_type)
+    if skill_set is None:
+        skill_set = frozenset(load_skills(skills_type))
+        # Only cache alongside a successful (cached) list load
+        if skills_type in _skills_cache:
+            _skill_sets[skills_type] = skill_set
+    return skill_set
+
+
+def _skills_key(skills_db: List[str]) -> Tuple[str, ...]:
+
+    # The cached load_skills lists never change, so their key is built once;
+    # other lists may be mutated by the caller and are keyed on every call
+    cached = _skill_keys.get(id(skills_db))
+    if cached is not None and cached[0] is skills_db:
+        return cached[1]
+
+    key = keyword_key(skills_db)
+    if any(skills_db is skills for skills in _skills_cache.values()):
+        _skill_keys[id(skills_db)] = (skills_db, key)
+    return key
+
+
 def _load_skills_from_file(file_path: Path) -> List[str]:
 
     if not file_path.exists():
@@ -58,8 +118,9 @@ def _load_skills_from_file(file_path: Path) -> List[str]:
         return []
 
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        # Both decoders accept bytes
+        with open(file_path, 'rb') as f:
+            data = _json_loads(f.read())
 
         # Handle different JSON structures
         if isinstance(data, list):
@@ -105,59 +166,37 @@ def extract_skills(text: str, skills_db: List[str] = None, fuzzy: bool = True) -
         return []
 
     text_lower = text.lower()
-    found_skills = set()
 
-    # Exact matching
-    for skill in skills_db:
-        # Use word boundary for exact match
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            found_skills.add(skill)
+    # Exact and variant (fuzzy) word-boundary matching in one automaton pass
+    keywords, skill_set = _match_keywords(_skills_key(skills_db), fuzzy)
+    found = find_whole_words(text_lower, keywords)
 
-    # Fuzzy matching for common variations
+    found_skills = found & skill_set
     if fuzzy:
-        found_skills.update(_fuzzy_skill_match(text_lower, skills_db))
+        for variant in found:
+            found_skills.update(_VARIANT_TO_CANONICAL.get(variant, set()) & skill_set)
 
-    result = sorted(list(found_skills))
+    # Sorting the k found skills beats walking the whole (sorted) skills_db
+    result = sorted(found_skills)
     logger.debug(f"Found {len(result)} skills in text")
 
     return result
 
 
-def _fuzzy_skill_match(text: str, skills_db: List[str]) -> Set[str]:
-
-    matched = set()
-
-    # Common variations
-    variations = {
-        'javascript': ['js', 'javascript'],
-        'typescript': ['ts', 'typescript'],
-        'python': ['python', 'python3', 'py'],
-        'c++': ['c++', 'cpp', 'cplusplus'],
-        'c#': ['c#', 'csharp'],
-        'node.js': ['nodejs', 'node.js', 'node js'],
-        'react.js': ['react', 'reactjs', 'react.js'],
-        'vue.js': ['vue', 'vuejs', 'vue.js'],
-        'angular': ['angular', 'angularjs'],
-        'postgresql': ['postgres', 'postgresql'],
-        'mysql': ['mysql', 'my sql'],
-        'mongodb': ['mongo', 'mongodb'],
-        'docker': ['docker', 'containerization'],
-        'kubernetes': ['k8s', 'kubernetes'],
-        'machine learning': ['ml', 'machine learning'],
-        'artificial intelligence': ['ai', 'artificial intelligence'],
-        'natural language processing': ['nlp', 'natural language processing']
-    }
+@lru_cache(maxsize=32)
+def _match_keywords(skills_key: Tuple[str, ...], fuzzy: bool) -> Tuple[Tuple[str, ...], frozenset]:
 
-    for canonical, variants in variations.items():
-        if canonical in skills_db:
-            for variant in variants:
-                pattern = r'\b' + re.escape(variant) + r'\b'
-                if re.search(pattern, text):
-                    matched.add(canonical)
-                    break
+    # Automaton keywords (skills, plus variants of known skills) and the skill lookup set
+    skill_set = frozenset(skills_key)
+    if not fuzzy:
+        return skills_key, skill_set
 
-    return matched
+    variants = {
+        variant
+        for canonical, variants in SKILL_VARIATIONS.items() if canonical in skill_set
+        for variant in variants
+    }
+    return tuple(sorted(skill_set | variants)), skill_set
 
 
 def categorize_skills(skills: List[str]) -> Dict[str, List[str]]:
@@ -169,9 +208,9 @@ def categorize_skills(skills: List[str]) -> Dict[str, List[str]]:
     }
 
     try:
-        technical_skills = load_skills("technical")
-        soft_skills = load_skills("soft")
-        domain_skills = load_skills("domain")
+        technical_skills = _load_skill_set("technical")
+        soft_skills = _load_skill_set("soft")
+        domain_skills = _load_skill_set("domain")
 
         for skill in skills:
             skill_lower = skill.lower()
@@ -194,16 +233,20 @@ def categorize_skills(skills: List[str]) -> Dict[str, List[str]]:
     return categorized
 
 
-def extract_skill_context(text: str, skill: str, context_window: int = 50) -> List[str]:
+def extract_skill_context(
+        text: str,
+        skill: str,
+        context_window: int = 50,
+        text_lower: str = None
+) -> List[str]:
 
     contexts = []
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     skill_lower = skill.lower()
 
     # Find all occurrences
-    pattern = r'\b' + re.escape(skill_lower) + r'\b'
-
-    for match in re.finditer(pattern, text_lower):
+    for match in whole_word_pattern(skill_lower).finditer(text_lower):
         start = max(0, match.start() - context_window)
         end = min(len(text), match.end() + context_window)
         context = text[start:end].strip()
@@ -217,14 +260,8 @@ def get_skill_frequency(text: str, skills_db: List[str] = None) -> Dict[str, int
     if skills_db is None:
         skills_db = load_skills("all")
 
-    text_lower = text.lower()
-    frequency = {}
-
-    for skill in skills_db:
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        count = len(re.findall(pattern, text_lower))
-        if count > 0:
-            frequency[skill] = count
+    # Word-boundary counts for every skill in one automaton pass
+    frequency = count_whole_words(text.lower(), _skills_key(skills_db))
 
     # Sort by frequency
     return dict(sorted(frequency.items(), key=lambda x: x[1], reverse=True))
@@ -277,8 +314,11 @@ class SkillExtractor:
         skills = self.extract(text)
         result = {}
 
+        # Lowercase once for all skills
+        text_lower = text.lower()
+
         for skill in skills:
-            contexts = extract_skill_context(text, skill, context_window)
+            contexts = extract_skill_context(text, skill, context_window, text_lower)
             if contexts:
                 result[skill] = contexts
 
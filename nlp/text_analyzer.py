@@ -1,7 +1,16 @@
 import re
-from typing import Dict, List, Tuple
+from collections import Counter
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
 import logging
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; batches fall back to the regex path
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 # Action verbs categorized by context
@@ -51,13 +60,141 @@ QUANTIFICATION_PATTERNS = [
 ]
 
 
-def count_action_verbs(text: str) -> Dict[str, int]:
+def _alternation(words) -> re.Pattern:
+    # One r'\b(w1|w2|...)\b' scan instead of one scan per word; longest first
+    # so a shorter word never shadows a longer one at the same position
+    ordered = sorted(set(words), key=len, reverse=True)
+    return re.compile(r'\b(' + '|'.join(map(re.escape, ordered)) + r')\b')
 
-    text_lower = text.lower()
+
+# Compiled once at import
+_ACTION_VERB_RE = _alternation(verb for verbs in ACTION_VERBS.values() for verb in verbs)
+_WEAK_VERB_RE = _alternation(WEAK_VERBS)
+_QUANT_PATTERNS = [re.compile(pattern) for pattern in QUANTIFICATION_PATTERNS]
+_QUANT_SENTENCE_PATTERNS = [
+    re.compile(r'[^.!?]*' + pattern + r'[^.!?]*[.!?]', re.IGNORECASE)
+    for pattern in QUANTIFICATION_PATTERNS
+]
+_PASSIVE_RE = re.compile(r'\b(?:am|is|are|was|were|be|been|being)\s+\w+ed\b', re.IGNORECASE)
+FIRST_PERSON_PRONOUNS = ('i', 'me', 'my', 'mine', 'we', 'us', 'our', 'ours')
+_FIRST_PERSON_RE = _alternation(FIRST_PERSON_PRONOUNS)
+_BULLET_RE = re.compile(r'(?:^|\n)\s*(?:[-•*]|\d+\.)\s+(.+?)(?=\n|$)', re.MULTILINE)
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]')
+
+
+def _split_sentences(text: str) -> List[str]:
+
+    sentences = _SENTENCE_SPLIT_RE.split(text)
+    return [s.strip() for s in sentences if s.strip()]
+
+
+# Batch path: documents become integer-encoded token streams and a jitted
+# kernel counts vocabulary terms. Tokens are \w+ runs, so a term matches
+# exactly where the \b...\b alternations above do.
+_TOKEN_SPLIT_RE = re.compile(r'(\W+)')
+
+
+def _build_term_index():
+    """Assign ids to every vocabulary word and two-word phrase."""
+    words = [verb for verbs in ACTION_VERBS.values() for verb in verbs]
+    words += FIRST_PERSON_PRONOUNS
+    singles = [w for w in WEAK_VERBS if ' ' not in w]
+    phrases = [w.split(' ') for w in WEAK_VERBS if ' ' in w]
+
+    # The kernel handles "first second" phrases whose words are not terms on
+    # their own; otherwise keep to the regex path, which is always exact
+    if any(len(p) != 2 for p in phrases):
+        return None
+    firsts = [p[0] for p in phrases]
+    if len(set(firsts)) != len(firsts) or set(w for p in phrases for w in p) & set(words + singles):
+        return None
+
+    term_ids = {}
+    for term in words + singles + [w for p in phrases for w in p]:
+        term_ids.setdefault(term, len(term_ids))
+
+    pair_second = np.full(len(term_ids), -1, dtype=np.int32)
+    pair_id = np.full(len(term_ids), -1, dtype=np.int32)
+    for first, second in phrases:
+        pair_second[term_ids[first]] = term_ids[second]
+        pair_id[term_ids[first]] = term_ids.setdefault(f"{first} {second}", len(term_ids))
+
+    # The single-space separator gets an id past the count columns
+    space_id = len(term_ids)
+    token_ids = dict(term_ids)
+    token_ids[' '] = space_id
+
+    return term_ids, token_ids, pair_second, pair_id, space_id
+
+
+_TERM_INDEX = _build_term_index() if njit is not None else None
+
+
+if _TERM_INDEX is not None:
+    @njit(parallel=True, cache=True)
+    def _count_terms(ids, doc_offsets, n_terms, pair_second, pair_id, space_id):
+        """Per-document term counts over alternating token/separator ids."""
+        n_docs = doc_offsets.shape[0] - 1
+        out = np.zeros((n_docs, n_terms), dtype=np.int64)
+
+        for d in prange(n_docs):
+            end = doc_offsets[d + 1]
+            # Tokens sit at even offsets from the document start
+            for i in range(doc_offsets[d], end, 2):
+                t = ids[i]
+                if t < 0:
+                    continue
+                out[d, t] += 1
+                s = pair_second[t]
+                if s >= 0 and i + 2 < end and ids[i + 1] == space_id and ids[i + 2] == s:
+                    out[d, pair_id[t]] += 1
+
+        return out
+
+
+def _batch_term_counts(texts_lower: List[str]) -> np.ndarray:
+
+    term_ids, token_ids, pair_second, pair_id, space_id = _TERM_INDEX
+
+    # Tokenize and look up ids in Python; only the counting is jitted
+    encoded = []
+    for text_lower in texts_lower:
+        parts = _TOKEN_SPLIT_RE.split(text_lower)
+        encoded.append(np.fromiter(map(token_ids.get, parts, repeat(-1)), dtype=np.int32, count=len(parts)))
+
+    doc_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([ids.size for ids in encoded], out=doc_offsets[1:])
+
+    return _count_terms(np.concatenate(encoded), doc_offsets, len(term_ids), pair_second, pair_id, space_id)
+
+
+def _verb_stats_from_counts(counts: np.ndarray) -> Tuple[Dict[str, int], List[Tuple[str, int]], int]:
+
+    term_ids = _TERM_INDEX[0]
+
+    action_verbs = {
+        category: sum(1 for verb in verbs if counts[term_ids[verb]] > 0)
+        for category, verbs in ACTION_VERBS.items()
+    }
+    action_verbs['total'] = sum(action_verbs.values())
+
+    weak_verbs = [(verb, int(counts[term_ids[verb]])) for verb in WEAK_VERBS if counts[term_ids[verb]] > 0]
+    first_person = int(sum(counts[term_ids[pronoun]] for pronoun in FIRST_PERSON_PRONOUNS))
+
+    return action_verbs, weak_verbs, first_person
+
+
+def count_action_verbs(text: str, text_lower: Optional[str] = None) -> Dict[str, int]:
+
+    if text_lower is None:
+        text_lower = text.lower()
     counts = {}
 
+    # Distinct verbs present, found in a single pass
+    found = set(_ACTION_VERB_RE.findall(text_lower))
+
     for category, verbs in ACTION_VERBS.items():
-        count = sum(1 for verb in verbs if re.search(r'\b' + verb + r'\b', text_lower))
+        count = sum(1 for verb in verbs if verb in found)
         counts[category] = count
 
     counts['total'] = sum(counts.values())
@@ -66,13 +203,17 @@ def count_action_verbs(text: str) -> Dict[str, int]:
     return counts
 
 
-def detect_weak_verbs(text: str) -> List[Tuple[str, int]]:
+def detect_weak_verbs(text: str, text_lower: Optional[str] = None) -> List[Tuple[str, int]]:
 
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     weak_found = []
 
+    # Occurrences of every weak verb in a single pass
+    occurrences = Counter(_WEAK_VERB_RE.findall(text_lower))
+
     for weak_verb in WEAK_VERBS:
-        count = len(re.findall(r'\b' + re.escape(weak_verb) + r'\b', text_lower))
+        count = occurrences[weak_verb]
         if count > 0:
             weak_found.append((weak_verb, count))
 
@@ -84,21 +225,21 @@ def detect_quantification(text: str) -> List[str]:
 
     quantified = []
 
-    for pattern in QUANTIFICATION_PATTERNS:
-        matches = re.findall(r'[^.!?]*' + pattern + r'[^.!?]*[.!?]', text, re.IGNORECASE)
+    for pattern in _QUANT_SENTENCE_PATTERNS:
+        matches = pattern.findall(text)
         quantified.extend(matches)
 
     logger.debug(f"Found {len(quantified)} quantified statements")
     return quantified
 
 
-def calculate_quantification_score(text: str) -> float:
+def calculate_quantification_score(text: str, sentences: Optional[List[str]] = None) -> float:
 
     quantified = detect_quantification(text)
 
     # Count total bullet points/sentences
-    sentences = re.split(r'[.!?]', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
+    if sentences is None:
+        sentences = _split_sentences(text)
 
     if not sentences:
         return 0.0
@@ -110,28 +251,29 @@ def calculate_quantification_score(text: str) -> float:
     return min(score, 100.0)
 
 
-def analyze_sentence_length(text: str) -> Dict[str, float]:
+def analyze_sentence_length(text: str, sentences: Optional[List[str]] = None) -> Dict[str, float]:
 
-    sentences = re.split(r'[.!?]', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
+    if sentences is None:
+        sentences = _split_sentences(text)
 
     if not sentences:
         return {'average': 0, 'min': 0, 'max': 0, 'count': 0}
 
-    lengths = [len(s.split()) for s in sentences]
+    # split() rather than counting spaces: sentences can span newlines and runs of spaces
+    lengths = np.fromiter((len(s.split()) for s in sentences), dtype=np.int32, count=len(sentences))
 
     return {
-        'average': sum(lengths) / len(lengths),
-        'min': min(lengths),
-        'max': max(lengths),
-        'count': len(sentences)
+        'average': float(lengths.mean()),
+        'min': int(lengths.min()),
+        'max': int(lengths.max()),
+        'count': int(lengths.size)
     }
 
 
-def calculate_readability_score(text: str) -> float:
+def calculate_readability_score(text: str, sentences: Optional[List[str]] = None) -> float:
 
-    sentences = re.split(r'[.!?]', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
+    if sentences is None:
+        sentences = _split_sentences(text)
 
     words = text.split()
 
@@ -151,28 +293,28 @@ def calculate_readability_score(text: str) -> float:
     return min(100, max(0, score))
 
 
-def detect_passive_voice(text: str) -> List[str]:
-
-    # Simple pattern for passive voice (to be + past participle)
-    passive_pattern = r'\b(?:am|is|are|was|were|be|been|being)\s+\w+ed\b'
+def detect_passive_voice(text: str, sentences: Optional[List[str]] = None) -> List[str]:
 
-    sentences = re.split(r'[.!?]', text)
+    # Simple pattern for passive voice (to be + past participle): _PASSIVE_RE
+    # (stripping does not move a word boundary, so stripped sentences match the same)
+    if sentences is None:
+        sentences = _split_sentences(text)
     passive_sentences = []
 
     for sentence in sentences:
-        if re.search(passive_pattern, sentence, re.IGNORECASE):
-            passive_sentences.append(sentence.strip())
+        if _PASSIVE_RE.search(sentence):
+            passive_sentences.append(sentence)
 
     logger.debug(f"Found {len(passive_sentences)} passive voice sentences")
     return passive_sentences
 
 
-def detect_first_person(text: str) -> int:
+def detect_first_person(text: str, text_lower: Optional[str] = None) -> int:
 
-    first_person = ['i', 'me', 'my', 'mine', 'we', 'us', 'our', 'ours']
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
 
-    count = sum(len(re.findall(r'\b' + pronoun + r'\b', text_lower)) for pronoun in first_person)
+    count = len(_FIRST_PERSON_RE.findall(text_lower))
 
     logger.debug(f"Found {count} first-person pronouns")
     return count
@@ -181,8 +323,7 @@ def detect_first_person(text: str) -> int:
 def analyze_bullet_points(text: str) -> Dict[str, any]:
 
     # Detect bullet points (lines starting with -, •, *, or numbers)
-    bullet_pattern = r'(?:^|\n)\s*(?:[-•*]|\d+\.)\s+(.+?)(?=\n|$)'
-    bullets = re.findall(bullet_pattern, text, re.MULTILINE)
+    bullets = _BULLET_RE.findall(text)
 
     if not bullets:
         return {
@@ -199,15 +340,14 @@ def analyze_bullet_points(text: str) -> Dict[str, any]:
 
     for bullet in bullets:
         lengths.append(len(bullet.split()))
+        bullet_lower = bullet.lower()
 
         # Check for action verbs
-        for verbs in ACTION_VERBS.values():
-            if any(re.search(r'\b' + verb + r'\b', bullet.lower()) for verb in verbs):
-                action_verb_count += 1
-                break
+        if _ACTION_VERB_RE.search(bullet_lower):
+            action_verb_count += 1
 
         # Check for quantification
-        if any(re.search(pattern, bullet) for pattern in QUANTIFICATION_PATTERNS):
+        if any(pattern.search(bullet) for pattern in _QUANT_PATTERNS):
             quantified_count += 1
 
     return {
@@ -222,13 +362,40 @@ def analyze_bullet_points(text: str) -> Dict[str, any]:
 
 def get_content_quality_score(text: str) -> Dict[str, any]:
 
+    # Lowercase once for all vocabulary metrics
+    text_lower = text.lower()
+
+    action_verbs = count_action_verbs(text, text_lower)
+    weak_verbs = detect_weak_verbs(text, text_lower)
+    first_person = detect_first_person(text, text_lower)
+
+    return _score_content(text, action_verbs, weak_verbs, first_person)
+
+
+def get_content_quality_scores(texts: List[str]) -> List[Dict[str, any]]:
+
+    if _TERM_INDEX is None or not texts:
+        return [get_content_quality_score(text) for text in texts]
+
+    # Vocabulary counts for the whole batch in one kernel call
+    counts = _batch_term_counts([text.lower() for text in texts])
+
+    return [
+        _score_content(text, *_verb_stats_from_counts(row))
+        for text, row in zip(texts, counts)
+    ]
+
+
+def _score_content(text: str, action_verbs: Dict[str, int], weak_verbs: List[Tuple[str, int]],
+                   first_person: int) -> Dict[str, any]:
+
+    # Split sentences once for all sentence metrics
+    sentences = _split_sentences(text)
+
     # Calculate individual metrics
-    action_verbs = count_action_verbs(text)
-    weak_verbs = detect_weak_verbs(text)
-    quantification_score = calculate_quantification_score(text)
-    readability = calculate_readability_score(text)
-    passive_voice = len(detect_passive_voice(text))
-    first_person = detect_first_person(text)
+    quantification_score = calculate_quantification_score(text, sentences)
+    readability = calculate_readability_score(text, sentences)
+    passive_voice = len(detect_passive_voice(text, sentences))
     bullet_analysis = analyze_bullet_points(text)
 
     # Calculate component scores
@@ -269,10 +436,14 @@ class TextAnalyzer:
     def analyze(self, text: str) -> Dict[str, any]:
         return get_content_quality_score(text)
 
-    def get_suggestions(self, text: str) -> List[str]:
+    def analyze_batch(self, texts: List[str]) -> List[Dict[str, any]]:
+        return get_content_quality_scores(texts)
+
+    def get_suggestions(self, text: str, quality: Dict[str, any] = None) -> List[str]:
 
         suggestions = []
-        quality = get_content_quality_score(text)
+        if quality is None:
+            quality = get_content_quality_score(text)
 
         if quality['action_verbs']['total'] < 5:
             suggestions.append("Add more strong action verbs to describe your achievements")
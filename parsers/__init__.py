@@ -124,15 +124,27 @@ class ResumeParser:
             return {}
 
 
+# Shared parser for the convenience functions (created on first use)
+_default_parser = None
+
+
+def _get_parser() -> ResumeParser:
+
+    global _default_parser
+
+    if _default_parser is None:
+        _default_parser = ResumeParser()
+
+    return _default_parser
+
+
 # Convenience function for direct use
 def extract_text(file_path: Union[str, Path]) -> str:
 
-    parser = ResumeParser()
-    return parser.parse(file_path)
+    return _get_parser().parse(file_path)
 
 
 # Convenience function for uploaded files
 def extract_text_from_upload(file_bytes: bytes, filename: str) -> str:
 
-    parser = ResumeParser()
-    return parser.parse_from_bytes(file_bytes, filename)
\ No newline at end of file
+    return _get_parser().parse_from_bytes(file_bytes, filename)
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 import logging
 
+from config import PARSER_CACHE_SIZE
+
 logger = logging.getLogger(__name__)
 
 
@@ -11,6 +13,8 @@ class BaseParser(ABC):
 
     def __init__(self):
         self.supported_extensions = []
+        # Parsed results keyed by (path, mtime_ns, size); oldest evicted first
+        self._cache: Dict[Tuple[str, int, int], Any] = {}
 
     @abstractmethod
     def parse(self, file_path: Path) -> str:
@@ -34,6 +38,22 @@ class BaseParser(ABC):
 
         return True
 
+    def _cached(self, file_path: Path, load: Callable[[Path], Any]) -> Any:
+
+        stat = file_path.stat()
+        key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+
+        if key in self._cache:
+            return self._cache[key]
+
+        value = load(file_path)
+
+        self._cache[key] = value
+        if len(self._cache) > PARSER_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+
+        return value
+
     def clean_text(self, text: str) -> str:
 
         if not text:
@@ -36,7 +36,7 @@ class DOCXParser(BaseParser):
     def _extract_text_from_docx(self, file_path: Path) -> str:
 
         try:
-            doc = Document(file_path)
+            doc = self._cached(file_path, Document)
             text_parts = []
 
             # Extract from paragraphs
@@ -91,7 +91,7 @@ class DOCXParser(BaseParser):
     def get_paragraph_count(self, file_path: Path) -> int:
 
         try:
-            doc = Document(file_path)
+            doc = self._cached(file_path, Document)
             return len([p for p in doc.paragraphs if p.text.strip()])
         except Exception as e:
             logger.error(f"Error getting paragraph count: {str(e)}")
@@ -102,7 +102,7 @@ class DOCXParser(BaseParser):
         headings = []
 
         try:
-            doc = Document(file_path)
+            doc = self._cached(file_path, Document)
 
             for para in doc.paragraphs:
                 # Check if paragraph is a heading
@@ -121,7 +121,7 @@ class DOCXParser(BaseParser):
         metadata = self.get_file_info(file_path)
 
         try:
-            doc = Document(file_path)
+            doc = self._cached(file_path, Document)
             core_props = doc.core_properties
 
             metadata.update({
@@ -139,8 +139,21 @@ class DOCXParser(BaseParser):
         return metadata
 
 
+# Shared parser for the convenience function (created on first use)
+_default_parser = None
+
+
+def _get_parser() -> DOCXParser:
+
+    global _default_parser
+
+    if _default_parser is None:
+        _default_parser = DOCXParser()
+
+    return _default_parser
+
+
 # Convenience function for direct use
 def extract_text_from_docx(file_path: Path) -> str:
 
-    parser = DOCXParser()
-    return parser.parse(file_path)
\ No newline at end of file
+    return _get_parser().parse(file_path)
\ No newline at end of file
@@ -1,13 +1,121 @@
 import pdfplumber
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List, Union
 from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import logging
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pdfium is optional; fall back to pdfplumber
+    pdfium = None
+
 from parsers.base_parser import BaseParser
+from config import PDF_PARALLEL_MIN_PAGES, PDF_PAGE_CHUNK, MAX_PDF_WORKERS
 
 logger = logging.getLogger(__name__)
 
+# Shared worker pool for long PDFs (created on first use)
+_page_pool = None
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+
+    global _page_pool
+
+    if _page_pool is None:
+        # spawn, not fork: forking the multithreaded server (tornado, warmup and
+        # torch threads) can deadlock the children
+        _page_pool = ProcessPoolExecutor(
+            max_workers=MAX_PDF_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+    return _page_pool
+
+
+def _extract_page_range(source: Union[str, bytes], start: int, end: int, name: str) -> List[str]:
+    """
+    Extract text from pages [start, end) with pdfium (runs in worker processes).
+    """
+    text_parts = []
+    pdf = pdfium.PdfDocument(source)
+
+    try:
+        for page_num in range(start, min(end, len(pdf))):
+            page = pdf[page_num]
+            try:
+                textpage = page.get_textpage()
+                page_text = textpage.get_text_range()
+                textpage.close()
+
+                if page_text:
+                    text_parts.append(page_text)
+                    logger.debug(f"Extracted {len(page_text)} chars from page {page_num + 1}")
+                else:
+                    logger.warning(f"No text found on page {page_num + 1} of {name}")
+
+            except Exception as e:
+                logger.warning(f"Error extracting page {page_num + 1} from {name}: {str(e)}")
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+
+    return text_parts
+
+
+def _extract_page_range_pdfplumber(source: Union[str, bytes], start: int, end: int, name: str) -> List[str]:
+    """
+    Extract text from pages [start, end) with pdfplumber (runs in worker processes).
+    """
+    text_parts = []
+    stream = BytesIO(source) if isinstance(source, bytes) else source
+
+    with pdfplumber.open(stream) as pdf:
+        for page_num, page in enumerate(pdf.pages[start:end], start + 1):
+            try:
+                page_text = page.extract_text()
+
+                if page_text:
+                    text_parts.append(page_text)
+                    logger.debug(f"Extracted {len(page_text)} chars from page {page_num}")
+                else:
+                    logger.warning(f"No text found on page {page_num} of {name}")
+
+            except Exception as e:
+                logger.warning(f"Error extracting page {page_num} from {name}: {str(e)}")
+                continue
+
+    return text_parts
+
+
+def _extract_pages_parallel(extract_range, source: Union[str, bytes], page_count: int, name: str) -> List[str]:
+    """
+    Run extract_range over the whole document, split across the page pool.
+    """
+    # Resumes and other short documents skip pickling the PDF to every worker
+    if page_count < PDF_PARALLEL_MIN_PAGES or MAX_PDF_WORKERS <= 1:
+        return extract_range(source, 0, page_count, name)
+
+    # One contiguous chunk per worker (capped, so huge documents still balance)
+    chunk = min(PDF_PAGE_CHUNK, -(-page_count // MAX_PDF_WORKERS))
+
+    pool = _get_page_pool()
+    futures = [
+        pool.submit(extract_range, source, start, start + chunk, name)
+        for start in range(0, page_count, chunk)
+    ]
+
+    # Collect in submission order so pages stay in document order
+    text_parts = []
+    for future in futures:
+        text_parts.extend(future.result())
+
+    logger.info(f"Extracted {page_count} pages from {name} in {len(futures)} chunks")
+    return text_parts
+
 
 class PDFParser(BaseParser):
     """Parser for PDF documents."""
@@ -22,7 +130,7 @@ class PDFParser(BaseParser):
             raise FileNotFoundError(f"Invalid PDF file: {file_path}")
 
         try:
-            text = self._extract_text_from_pdf(file_path)
+            text = self._cached(file_path, lambda path: self._extract_text_from_pdf(path, path.name))
 
             if not text or len(text.strip()) < 10:
                 raise ValueError("PDF appears to be empty or contains no extractable text")
@@ -33,44 +141,49 @@ class PDFParser(BaseParser):
             logger.error(f"Error parsing PDF {file_path}: {str(e)}")
             raise ValueError(f"Failed to parse PDF: {str(e)}")
 
-    def _extract_text_from_pdf(self, file_path: Path) -> str:
+    def _extract_text_from_pdf(self, source: Union[Path, bytes], name: str = "PDF") -> str:
 
-        text_parts = []
+        # pdfium (C backend) is much faster and lighter; pdfplumber is the fallback
+        if pdfium is not None:
+            try:
+                text = "\n".join(self._extract_pages_pdfium(source, name))
+                # Near-empty output (odd encodings): let pdfplumber have a go
+                if len(text.strip()) >= 10:
+                    return text
+                logger.info(f"pypdfium2 found no text in {name}, retrying with pdfplumber")
+            except Exception as e:
+                logger.warning(f"pypdfium2 failed on {name}, falling back to pdfplumber: {str(e)}")
 
-        with pdfplumber.open(file_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                try:
-                    page_text = page.extract_text()
+        return "\n".join(self._extract_pages_pdfplumber(source, name))
 
-                    if page_text:
-                        text_parts.append(page_text)
-                        logger.debug(f"Extracted {len(page_text)} chars from page {page_num}")
-                    else:
-                        logger.warning(f"No text found on page {page_num}")
+    def _extract_pages_pdfium(self, source: Union[Path, bytes], name: str) -> List[str]:
 
-                except Exception as e:
-                    logger.warning(f"Error extracting page {page_num}: {str(e)}")
-                    continue
+        if isinstance(source, Path):
+            source = str(source)
 
-        return "\n".join(text_parts)
+        pdf = pdfium.PdfDocument(source)
+        try:
+            page_count = len(pdf)
+        finally:
+            pdf.close()
 
-    def parse_from_bytes(self, file_bytes: bytes, filename: str = "resume.pdf") -> str:
+        return _extract_pages_parallel(_extract_page_range, source, page_count, name)
 
-        try:
-            file_stream = BytesIO(file_bytes)
-            text_parts = []
+    def _extract_pages_pdfplumber(self, source: Union[Path, bytes], name: str) -> List[str]:
 
-            with pdfplumber.open(file_stream) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_parts.append(page_text)
-                    except Exception as e:
-                        logger.warning(f"Error extracting page {page_num} from {filename}: {str(e)}")
-                        continue
+        if isinstance(source, Path):
+            source = str(source)
 
-            text = "\n".join(text_parts)
+        stream = BytesIO(source) if isinstance(source, bytes) else source
+        with pdfplumber.open(stream) as pdf:
+            page_count = len(pdf.pages)
+
+        return _extract_pages_parallel(_extract_page_range_pdfplumber, source, page_count, name)
+
+    def parse_from_bytes(self, file_bytes: bytes, filename: str = "resume.pdf") -> str:
+
+        try:
+            text = self._extract_text_from_pdf(file_bytes, filename)
 
             if not text or len(text.strip()) < 10:
                 raise ValueError("PDF appears to be empty or contains no extractable text")
@@ -84,6 +197,13 @@ class PDFParser(BaseParser):
     def get_page_count(self, file_path: Path) -> int:
 
         try:
+            if pdfium is not None:
+                pdf = pdfium.PdfDocument(str(file_path))
+                try:
+                    return len(pdf)
+                finally:
+                    pdf.close()
+
             with pdfplumber.open(file_path) as pdf:
                 return len(pdf.pages)
         except Exception as e:
@@ -95,19 +215,42 @@ class PDFParser(BaseParser):
         metadata = self.get_file_info(file_path)
 
         try:
-            with pdfplumber.open(file_path) as pdf:
-                metadata.update({
-                    "page_count": len(pdf.pages),
-                    "pdf_metadata": pdf.metadata
-                })
+            if pdfium is not None:
+                pdf = pdfium.PdfDocument(str(file_path))
+                try:
+                    metadata.update({
+                        "page_count": len(pdf),
+                        "pdf_metadata": pdf.get_metadata_dict()
+                    })
+                finally:
+                    pdf.close()
+            else:
+                with pdfplumber.open(file_path) as pdf:
+                    metadata.update({
+                        "page_count": len(pdf.pages),
+                        "pdf_metadata": pdf.metadata
+                    })
         except Exception as e:
             logger.warning(f"Could not extract PDF metadata: {str(e)}")
 
         return metadata
 
 
+# Shared parser for the convenience function (created on first use)
+_default_parser = None
+
+
+def _get_parser() -> PDFParser:
+
+    global _default_parser
+
+    if _default_parser is None:
+        _default_parser = PDFParser()
+
+    return _default_parser
+
+
 # Convenience function for direct use
 def extract_text_from_pdf(file_path: Path) -> str:
 
-    parser = PDFParser()
-    return parser.parse(file_path)
\ No newline at end of file
+    return _get_parser().parse(file_path)
\ No newline at end of file
@@ -1,13 +1,35 @@
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 import logging
-import chardet
 
 from parsers.base_parser import BaseParser
 
+try:
+    from charset_normalizer import from_bytes
+except ImportError:  # optional: encoding detection for non-UTF-8/cp1252 files
+    from_bytes = None
+
 logger = logging.getLogger(__name__)
 
 
+def _decode(raw: bytes) -> Tuple[str, str]:
+
+    # Decode from the in-memory bytes; latin-1 never fails so it comes last
+    for encoding in ('utf-8', 'cp1252'):
+        try:
+            return raw.decode(encoding), encoding
+        except UnicodeDecodeError:
+            continue
+
+    if from_bytes is not None:
+        best = from_bytes(raw).best()
+        if best is not None:
+            logger.info(f"Auto-detected encoding: {best.encoding}")
+            return str(best), best.encoding
+
+    return raw.decode('latin-1'), 'latin-1'
+
+
 class TXTParser(BaseParser):
     """Parser for plain text documents."""
 
@@ -34,46 +56,27 @@ class TXTParser(BaseParser):
 
     def _read_text_file(self, file_path: Path) -> str:
 
-        # Try common encodings first
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'ascii']
-
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    text = f.read()
-                logger.debug(f"Successfully read with {encoding} encoding")
-                return text
-            except (UnicodeDecodeError, UnicodeError):
-                continue
-
-        # If all fail, try to auto-detection
-        try:
-            with open(file_path, 'rb') as f:
-                raw_data = f.read()
-
-            detected = chardet.detect(raw_data)
-            encoding = detected['encoding']
+        return self._cached(Path(file_path), self._load_text_file)[0]
 
-            logger.info(f"Auto-detected encoding: {encoding}")
+    def _load_text_file(self, file_path: Path) -> Tuple[str, str]:
 
-            text = raw_data.decode(encoding)
-            return text
+        # Read the file once and try encodings against the buffer
+        with open(file_path, 'rb') as f:
+            raw = f.read()
 
+        try:
+            text, encoding = _decode(raw)
         except Exception as e:
             logger.error(f"All encoding attempts failed: {str(e)}")
             raise ValueError("Could not determine file encoding")
 
+        logger.debug(f"Successfully read with {encoding} encoding")
+        return text, encoding
+
     def parse_from_bytes(self, file_bytes: bytes, filename: str = "resume.txt") -> str:
 
         try:
-            # Try UTF-8 first
-            try:
-                text = file_bytes.decode('utf-8')
-            except UnicodeDecodeError:
-                # Try auto-detection
-                detected = chardet.detect(file_bytes)
-                encoding = detected['encoding']
-                text = file_bytes.decode(encoding)
+            text, _ = _decode(file_bytes)
 
             if not text or len(text.strip()) < 10:
                 raise ValueError("TXT file appears to be empty")
@@ -124,18 +127,27 @@ class TXTParser(BaseParser):
     def _detect_encoding(self, file_path: Path) -> str:
 
         try:
-            with open(file_path, 'rb') as f:
-                raw_data = f.read()
-
-            detected = chardet.detect(raw_data)
-            return detected['encoding']
+            return self._cached(Path(file_path), self._load_text_file)[1]
 
         except Exception:
             return "unknown"
 
 
+# Shared parser for the convenience function (created on first use)
+_default_parser = None
+
+
+def _get_parser() -> TXTParser:
+
+    global _default_parser
+
+    if _default_parser is None:
+        _default_parser = TXTParser()
+
+    return _default_parser
+
+
 # Convenience function for direct use
 def extract_text_from_txt(file_path: Path) -> str:
 
-    parser = TXTParser()
-    return parser.parse(file_path)
\ No newline at end of file
+    return _get_parser().parse(file_path)
\ No newline at end of file
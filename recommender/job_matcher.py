@@ -1,18 +1,77 @@
+import numpy as np
 import pandas as pd
-import pickle
-from sklearn.metrics.pairwise import cosine_similarity
+import hashlib
+import logging
+from functools import lru_cache
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+from ml.predictor import load_model
+from config import DATA_DIR, JOB_ROLE_MODEL_PATH, ENABLE_CACHE, DISK_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+JOBS_FILE = DATA_DIR / "job_descriptions.csv"
+
+
+@lru_cache(maxsize=1)
+def _get_index():
+    # Loaded on first use, not at import; the job side is vectorized only once
+    model, _ = load_model()
+    vectorizer = model[:-1]  # every step but the classifier
+
+    df = pd.read_csv(JOBS_FILE)
+    job_vecs = _load_job_vectors(vectorizer, df["job_description"].tolist())
+    # Unit rows once, so scoring is a plain sparse dot product
+    job_vecs = normalize(job_vecs.tocsr(), norm="l2", copy=False)
+
+    return df, vectorizer, job_vecs
+
+
+def _job_vectors_path():
+    # Keyed by CSV content and the model file it was vectorized with
+    stat = JOB_ROLE_MODEL_PATH.stat()
+    model_key = f"{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8")
+    digest = hashlib.md5(JOBS_FILE.read_bytes() + model_key).hexdigest()
+    return DISK_CACHE_DIR / f"job_tfidf_{digest[:16]}.npz"
+
+
+def _load_job_vectors(vectorizer, job_texts):
+    cache_path = _job_vectors_path() if ENABLE_CACHE else None
+
+    if cache_path is not None and cache_path.exists():
+        job_vecs = sparse.load_npz(cache_path)
+        if job_vecs.shape[0] == len(job_texts):
+            return job_vecs
+
+    job_vecs = vectorizer.transform(job_texts)
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            sparse.save_npz(cache_path, job_vecs)
+        except OSError as e:
+            logger.warning(f"Could not save job vectors: {str(e)}")
+
+    return job_vecs
 
-with open("ml/job_role_model.pkl", "rb") as f:
-    model = pickle.load(f)
 
 def recommend_jobs(cleaned_resume_text, top_n=3) :
-    df = pd.read_csv("data/job_descriptions.csv")
+    df, vectorizer, job_vecs = _get_index()
+
+    # Only the resume is vectorized per call
+    resume_vec = normalize(vectorizer.transform([cleaned_resume_text]), norm="l2", copy=False)
+
+    similarities = (job_vecs @ resume_vec.T).toarray().ravel()
 
-    job_texts = df["job_description"].tolist()
-    resume_vec = model.named_steps["tfidf"].transform([cleaned_resume_text])
-    job_vecs = model.named_steps["tfidf"].transform(job_texts)
+    # Partial top-k selection, then sort only those k
+    k = max(0, min(top_n, similarities.shape[0]))
+    if k == 0:
+        return df.iloc[:0].assign(match_score=[])
 
-    similarities = cosine_similarity(resume_vec, job_vecs)[0]
+    idx = np.argpartition(-similarities, k - 1)[:k]
+    idx = idx[np.argsort(-similarities[idx], kind="stable")]
 
-    df["match_score"] = similarities * 100
-    return df.sort_values(by="match_score", ascending=False).head(top_n)
+    out = df.iloc[idx].copy()
+    out["match_score"] = similarities[idx] * 100
+    return out
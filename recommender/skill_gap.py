@@ -1,11 +1,28 @@
 import json
+from functools import lru_cache
+
+from config import DATA_DIR
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional: faster JSON decoding
+    _json_loads = json.loads
+
+ROLE_SKILLS_FILE = DATA_DIR / "job_required_skills.json"
 
-def find_skill_gaps(predicted_role, candidate_skills) :
-    with open("data/job_required_skills.json", "r") as f :
-        role_skills = json.load(f)
 
-    required = set(role_skills.get(predicted_role, []))
-    present = set(candidate_skills)
+@lru_cache(maxsize=1)
+def _load_role_skills() :
+    # Parsed once; each role's skills pre-indexed as a frozenset
+    with open(ROLE_SKILLS_FILE, "rb") as f :
+        raw = _json_loads(f.read())
+
+    return {role: frozenset(s.lower() for s in skills) for role, skills in raw.items()}
+
+def find_skill_gaps(predicted_role, candidate_skills) :
+    required = _load_role_skills().get(predicted_role, frozenset())
+    present = {s.lower() for s in candidate_skills}
 
     missing = required - present
-    return sorted(missing)
\ No newline at end of file
+    return sorted(missing)
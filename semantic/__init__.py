@@ -17,15 +17,23 @@ from semantic.cache import (
     get_cached_embedding,
     set_cached_embedding,
     clear_cache,
+    clear_disk_cache,
     get_cache_size,
     get_cache_stats,
     cache_info,
     EmbeddingCache
 )
 
+from semantic.ats_cache import (
+    SemanticATSCache,
+    default_ats_cache
+)
+
 from semantic.semantic_ats import (
     semantic_ats_score,
     calculate_skill_match,
+    get_skill_embeddings,
+    precompute_skill_embeddings,
     get_semantic_score_breakdown,
     compare_semantic_match,
     SemanticATSScorer
@@ -37,10 +45,12 @@ from semantic.hybrid_ats import (
     get_available_job_roles,
     compare_ats_scores,
     get_ats_improvement_suggestions,
+    precompute_role_embeddings,
     HybridATSScorer
 )
 
 from semantic.semantic_matcher import (
+    get_job_corpus,
     semantic_recommend_jobs,
     semantic_recommend_jobs_v2
 )
@@ -68,14 +78,21 @@ __all__ = [
     'get_cached_embedding',
     'set_cached_embedding',
     'clear_cache',
+    'clear_disk_cache',
     'get_cache_size',
     'get_cache_stats',
     'cache_info',
     'EmbeddingCache',
 
+    # ATS near-duplicate cache
+    'SemanticATSCache',
+    'default_ats_cache',
+
     # Semantic ATS
     'semantic_ats_score',
     'calculate_skill_match',
+    'get_skill_embeddings',
+    'precompute_skill_embeddings',
     'get_semantic_score_breakdown',
     'compare_semantic_match',
     'SemanticATSScorer',
@@ -86,9 +103,11 @@ __all__ = [
     'get_available_job_roles',
     'compare_ats_scores',
     'get_ats_improvement_suggestions',
+    'precompute_role_embeddings',
     'HybridATSScorer',
 
     # Job Matching
+    'get_job_corpus',
     'semantic_recommend_jobs',
     'semantic_recommend_jobs_v2',
 
@@ -0,0 +1,98 @@
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+import logging
+import numpy as np
+
+from config import ATS_CACHE_SIZE, CACHE_TTL, NEAR_DUPLICATE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticATSCache:
+    """
+    Near-duplicate cache for ATS results.
+    Entries are grouped by an exact key (e.g. role + skills) and matched by
+    inner product of normalized resume embeddings.
+    """
+
+    def __init__(
+            self,
+            max_size: int = ATS_CACHE_SIZE,
+            threshold: float = NEAR_DUPLICATE_THRESHOLD,
+            ttl: int = CACHE_TTL
+    ):
+        """
+        Initialize near-duplicate cache.
+        """
+        self.max_size = max_size
+        self.threshold = threshold
+        self.ttl = ttl
+        self.entries: Dict[Hashable, List[Tuple[np.ndarray, Any, float]]] = {}
+        self.stats = {
+            'hits': 0,
+            'misses': 0
+        }
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        """L2-normalize embedding."""
+        embedding = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm > 0 else embedding
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop entries older than the TTL."""
+        for key in list(self.entries):
+            fresh = [e for e in self.entries[key] if now - e[2] < self.ttl]
+            if fresh:
+                self.entries[key] = fresh
+            else:
+                del self.entries[key]
+
+    def get(self, key: Hashable, embedding: np.ndarray) -> Optional[Any]:
+        """Get cached value for a near-duplicate embedding."""
+        self._evict_expired(time.time())
+
+        candidates = self.entries.get(key)
+        if not candidates:
+            self.stats['misses'] += 1
+            return None
+
+        query = self._normalize(embedding)
+        matrix = np.vstack([e[0] for e in candidates])
+        similarities = matrix @ query
+        best = int(np.argmax(similarities))
+
+        if similarities[best] >= self.threshold:
+            self.stats['hits'] += 1
+            logger.debug(f"Near-duplicate cache hit ({similarities[best]:.3f})")
+            return candidates[best][1]
+
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, key: Hashable, embedding: np.ndarray, value: Any) -> None:
+        """Store value for embedding."""
+        # Remove oldest entry if cache is full
+        if self.size() >= self.max_size:
+            oldest_key = min(self.entries, key=lambda k: self.entries[k][0][2])
+            self.entries[oldest_key].pop(0)
+            if not self.entries[oldest_key]:
+                del self.entries[oldest_key]
+
+        self.entries.setdefault(key, []).append(
+            (self._normalize(embedding), value, time.time())
+        )
+
+    def clear(self) -> None:
+        """Clear cache."""
+        self.entries.clear()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def size(self) -> int:
+        """Get cache size."""
+        return sum(len(v) for v in self.entries.values())
+
+
+# Module-level cache instance
+default_ats_cache = SemanticATSCache()
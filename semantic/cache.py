@@ -1,10 +1,19 @@
 import hashlib
+import time
+from datetime import timedelta
 from typing import Optional, Dict
 import logging
 import numpy as np
 from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from joblib import Memory
 
-from config import EMBEDDING_CACHE_SIZE, ENABLE_CACHE
+from config import (
+    EMBEDDING_CACHE_SIZE, ENABLE_CACHE, DISK_CACHE_DIR,
+    DISK_CACHE_BYTES_LIMIT, DISK_CACHE_MAX_AGE_DAYS, DISK_CACHE_TRIM_INTERVAL,
+    EMBEDDING_MODEL, EMBEDDING_QUANTIZE
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +25,71 @@ _cache_stats = {
     'size': 0
 }
 
+# Disk-backed memoization for expensive scoring calls (survives restarts).
+# Cached functions take text_digest(text) in their key and ignore the raw
+# text, so resumes are never written to disk.
+disk_memory = Memory(str(DISK_CACHE_DIR) if ENABLE_CACHE else None, verbose=0)
+_last_disk_trim = float('-inf')
+
+
+def text_digest(text: str) -> str:
+    """
+    Compact content hash used in place of raw text in cache keys.
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def trim_disk_cache(force: bool = False) -> None:
+    """
+    Keep the persistent scoring cache within its size and age limits.
+    Runs at most once per DISK_CACHE_TRIM_INTERVAL unless forced.
+    """
+    global _last_disk_trim
+
+    now = time.monotonic()
+    if not force and now - _last_disk_trim < DISK_CACHE_TRIM_INTERVAL:
+        return
+    _last_disk_trim = now
+
+    try:
+        disk_memory.reduce_size(
+            bytes_limit=DISK_CACHE_BYTES_LIMIT,
+            age_limit=timedelta(days=DISK_CACHE_MAX_AGE_DAYS)
+        )
+    except Exception as e:
+        logger.warning(f"Could not trim disk cache: {str(e)}")
+
+
+def embedding_fingerprint() -> str:
+    """
+    Identify the embedding model variant vectors were computed with.
+    """
+    return f"{EMBEDDING_MODEL}:{'int8' if EMBEDDING_QUANTIZE else 'fp32'}"
+
+
+@lru_cache(maxsize=16)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    """Content hash of a data file (re-read only when it changes)."""
+    with open(path, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+
+def scoring_fingerprint(*data_files: Path) -> str:
+    """
+    Fingerprint of the model and data files a persisted score depends on.
+    Passed as an argument to disk-cached functions so it is part of the key.
+    """
+    parts = [embedding_fingerprint()]
+
+    for path in data_files:
+        if path.exists():
+            stat = path.stat()
+            parts.append(_file_digest(str(path), stat.st_mtime_ns, stat.st_size))
+        else:
+            parts.append(f"missing:{path.name}")
+
+    return "|".join(parts)
+
 
 def _hash_text(text: str) -> str:
     """
@@ -80,6 +154,12 @@ def clear_cache() -> None:
     logger.info("Cache cleared")
 
 
+def clear_disk_cache() -> None:
+    """Clear the persistent scoring cache."""
+    disk_memory.clear(warn=False)
+    logger.info("Disk cache cleared")
+
+
 def get_cache_size() -> int:
     """
     Get current cache size.
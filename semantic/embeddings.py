@@ -4,15 +4,36 @@ from typing import List, Union, Optional
 import logging
 import hashlib
 import pickle
+import threading
 from pathlib import Path
 
-from config import EMBEDDING_MODEL, EMBEDDING_CACHE_SIZE, ENABLE_CACHE
+from config import EMBEDDING_MODEL, EMBEDDING_CACHE_SIZE, ENABLE_CACHE, EMBEDDING_QUANTIZE
 from semantic.cache import get_cached_embedding, set_cached_embedding, get_cache_stats
 
 logger = logging.getLogger(__name__)
 
 # Global model cache (singleton pattern)
 _model_instance = None
+_model_lock = threading.Lock()
+
+
+def _quantize_model(model: SentenceTransformer) -> SentenceTransformer:
+    """
+    Apply int8 dynamic quantization to the model's Linear layers (CPU only).
+    """
+    if model.device.type != 'cpu':
+        return model
+
+    try:
+        import torch
+        torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+        logger.info("Embedding model quantized to int8")
+    except Exception as e:
+        logger.warning(f"Could not quantize embedding model, using fp32: {str(e)}")
+
+    return model
 
 
 def get_model() -> SentenceTransformer:
@@ -20,13 +41,19 @@ def get_model() -> SentenceTransformer:
     global _model_instance
 
     if _model_instance is None:
-        try:
-            logger.info(f"Loading embedding model: {EMBEDDING_MODEL}")
-            _model_instance = SentenceTransformer(EMBEDDING_MODEL)
-            logger.info("Embedding model loaded successfully")
-        except Exception as e:
-            logger.error(f"Error loading embedding model: {str(e)}")
-            raise RuntimeError(f"Failed to load embedding model: {str(e)}")
+        # Double-checked so concurrent first calls load the model only once
+        with _model_lock:
+            if _model_instance is None:
+                try:
+                    logger.info(f"Loading embedding model: {EMBEDDING_MODEL}")
+                    model = SentenceTransformer(EMBEDDING_MODEL)
+                    if EMBEDDING_QUANTIZE:
+                        model = _quantize_model(model)
+                    _model_instance = model
+                    logger.info("Embedding model loaded successfully")
+                except Exception as e:
+                    logger.error(f"Error loading embedding model: {str(e)}")
+                    raise RuntimeError(f"Failed to load embedding model: {str(e)}")
 
     return _model_instance
 
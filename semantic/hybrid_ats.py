@@ -1,8 +1,10 @@
 import json
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional
 import logging
 
-from semantic.semantic_ats import semantic_ats_score
+import numpy as np
+
+from semantic.semantic_ats import semantic_ats_score, precompute_skill_embeddings
 from config import (
     KEYWORD_WEIGHT,
     SEMANTIC_WEIGHT,
@@ -114,10 +116,12 @@ def hybrid_ats_score(
         resume_skills: List[str],
         job_role: str,
         keyword_weight: float = KEYWORD_WEIGHT,
-        semantic_weight: float = SEMANTIC_WEIGHT
+        semantic_weight: float = SEMANTIC_WEIGHT,
+        resume_vec: Optional[np.ndarray] = None
 ) -> Tuple[int, Dict[str, any]]:
     """
     Calculate hybrid ATS score combining keyword and semantic approaches.
+    Pass a precomputed resume_vec to skip re-embedding the resume.
     """
     # Validate inputs
     if not resume_text or not isinstance(resume_text, str):
@@ -144,7 +148,8 @@ def hybrid_ats_score(
 
         semantic_score, semantic_matches = semantic_ats_score(
             resume_text,
-            weighted_skills
+            weighted_skills,
+            resume_vec=resume_vec
         )
 
         # Combine scores
@@ -210,6 +215,22 @@ def get_available_job_roles() -> List[str]:
         return []
 
 
+def precompute_role_embeddings() -> None:
+    """
+    Embed the core skills of every ATS role in one batch.
+    """
+    try:
+        with open(ATS_JOB_SKILLS_FILE, 'r') as f:
+            ats_data = json.load(f)
+
+        precompute_skill_embeddings([
+            list(role_data.get('core', {}).keys())
+            for role_data in ats_data.values()
+        ])
+    except Exception as e:
+        logger.warning(f"Could not precompute role embeddings: {str(e)}")
+
+
 def compare_ats_scores(
         resume_text: str,
         resume_skills: List[str],
@@ -1,19 +1,58 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Sequence, Optional
 import logging
+import numpy as np
 
 from semantic.embeddings import embed_text, cosine_similarity
 from config import SEMANTIC_SIMILARITY_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
+# Embedding matrices for role skill lists, keyed by the skill tuple
+_skill_matrix_cache: Dict[Tuple[str, ...], np.ndarray] = {}
+
+
+def get_skill_embeddings(skills: Sequence[str]) -> np.ndarray:
+    """
+    Get (and cache) the embedding matrix for a list of skills.
+    """
+    key = tuple(skills)
+    matrix = _skill_matrix_cache.get(key)
+
+    if matrix is None:
+        matrix = np.atleast_2d(embed_text(list(key)))
+        _skill_matrix_cache[key] = matrix
+
+    return matrix
+
+
+def precompute_skill_embeddings(skill_lists: List[Sequence[str]]) -> None:
+    """
+    Embed several skill lists with a single batched model call.
+    """
+    pending = [tuple(s) for s in skill_lists if s and tuple(s) not in _skill_matrix_cache]
+    if not pending:
+        return
+
+    flat = [skill for skills in pending for skill in skills]
+    vectors = np.atleast_2d(embed_text(flat))
+
+    start = 0
+    for skills in pending:
+        _skill_matrix_cache[skills] = vectors[start:start + len(skills)]
+        start += len(skills)
+
+    logger.info(f"Precomputed embeddings for {len(pending)} skill lists ({len(flat)} skills)")
+
 
 def semantic_ats_score(
         resume_text: str,
         weighted_skills: Dict[str, int],
-        threshold: float = SEMANTIC_SIMILARITY_THRESHOLD
+        threshold: float = SEMANTIC_SIMILARITY_THRESHOLD,
+        resume_vec: Optional[np.ndarray] = None
 ) -> Tuple[int, List[Tuple[str, float]]]:
     """
     Calculate ATS score using semantic similarity.
+    Pass a precomputed resume_vec to skip re-embedding the resume.
     """
     # Validate inputs
     if not resume_text or not isinstance(resume_text, str):
@@ -24,8 +63,9 @@ def semantic_ats_score(
         return 0, []
 
     try:
-        # Generate resume embedding
-        resume_vec = embed_text(resume_text)
+        # Generate resume embedding unless the caller already has one
+        if resume_vec is None:
+            resume_vec = embed_text(resume_text)
 
         # Calculate total weight
         total_weight = sum(weighted_skills.values())
@@ -38,13 +78,15 @@ def semantic_ats_score(
         gained = 0
         explanations = []
 
-        # Get skill embeddings
+        # Get skill embeddings (cached per skill list)
         skill_texts = list(weighted_skills.keys())
-        skill_vecs = embed_text(skill_texts)
+        skill_vecs = get_skill_embeddings(skill_texts)
 
-        # Calculate similarities
-        for skill, vec in zip(skill_texts, skill_vecs):
-            sim = cosine_similarity(resume_vec, vec)
+        # Calculate similarities with a single matrix-vector product
+        similarities = skill_vecs @ resume_vec
+
+        for skill, sim in zip(skill_texts, similarities):
+            sim = float(sim)
 
             # Check if similarity meets threshold
             if sim >= threshold:
@@ -1,45 +1,113 @@
 import pandas as pd
-from typing import List, Dict
+import numpy as np
+from typing import List, Dict, Tuple, Optional
+from pathlib import Path
+import hashlib
 import logging
 
-from semantic.embeddings import embed_text, batch_cosine_similarity
-from config import JOBS_DIR
+from semantic.embeddings import embed_text
+from semantic.cache import embedding_fingerprint
+from config import JOBS_DIR, ENABLE_CACHE, DISK_CACHE_DIR
 
 logger = logging.getLogger(__name__)
 
+# On-disk dtype of the job embedding matrix (part of the cache key)
+_STORED_DTYPE = np.float16
 
-def semantic_recommend_jobs(
-        resume_text: str,
-        top_n: int = 5,
-        threshold: float = 0.5
-) -> pd.DataFrame:
+# Global job corpus cache (singleton pattern)
+_job_corpus = None
+
+
+def get_job_corpus() -> Tuple[pd.DataFrame, np.ndarray]:
     """
-    Recommend jobs using semantic similarity.
+    Load job descriptions and their embedding matrix once per process.
     """
-    jobs_file = JOBS_DIR / "job_descriptions.csv"
+    global _job_corpus
 
-    if not jobs_file.exists():
-        logger.warning(f"Job descriptions file not found: {jobs_file}")
-        return pd.DataFrame()
+    if _job_corpus is None:
+        jobs_file = JOBS_DIR / "job_descriptions.csv"
+
+        if not jobs_file.exists():
+            raise FileNotFoundError(f"Job descriptions file not found: {jobs_file}")
 
-    try:
         df = pd.read_csv(jobs_file)
+        job_vecs = _load_job_embeddings(jobs_file, df["job_description"].tolist())
+        _job_corpus = (df, job_vecs)
+        logger.info(f"Loaded embeddings for {len(df)} job descriptions")
+
+    return _job_corpus
+
 
-        # Generate embeddings
-        resume_vec = embed_text(resume_text)
-        job_vecs = embed_text(df["job_description"].tolist())
+def _job_embeddings_path(jobs_file: Path) -> Path:
+    """
+    On-disk location for the job embedding matrix, keyed by CSV content,
+    model variant (name + quantization) and stored dtype.
+    """
+    model_key = f"{embedding_fingerprint()}:{np.dtype(_STORED_DTYPE).name}".encode('utf-8')
+    digest = hashlib.md5(jobs_file.read_bytes() + model_key).hexdigest()
+    return DISK_CACHE_DIR / f"job_embeddings_{digest[:16]}.npy"
 
-        # Calculate similarities
-        similarities = batch_cosine_similarity(resume_vec, job_vecs)
 
-        # Add to dataframe
-        df["semantic_match"] = [round(s * 100, 1) for s in similarities]
+def _load_job_embeddings(jobs_file: Path, descriptions: List[str]) -> np.ndarray:
+    """
+    Load the job embedding matrix from disk, or embed and save it as float16.
+    """
+    cache_path = _job_embeddings_path(jobs_file) if ENABLE_CACHE else None
 
-        # Filter by threshold
-        df = df[df["semantic_match"] >= threshold * 100]
+    if cache_path is not None and cache_path.exists():
+        stored = np.load(cache_path)
+        if stored.shape[0] == len(descriptions):
+            # float16 halves the file; BLAS wants contiguous float32 for the matvec
+            return np.ascontiguousarray(stored, dtype=np.float32)
 
-        # Sort and return top N
-        return df.sort_values("semantic_match", ascending=False).head(top_n)
+    job_vecs = np.ascontiguousarray(np.atleast_2d(embed_text(descriptions)), dtype=np.float32)
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(cache_path, job_vecs.astype(_STORED_DTYPE))
+        except OSError as e:
+            logger.warning(f"Could not save job embeddings: {str(e)}")
+
+    return job_vecs
+
+
+def semantic_recommend_jobs(
+        resume_text: str,
+        top_n: int = 5,
+        threshold: float = 0.5,
+        resume_vec: Optional[np.ndarray] = None
+) -> pd.DataFrame:
+    """
+    Recommend jobs using semantic similarity.
+    Pass a precomputed resume_vec to skip re-embedding the resume.
+    """
+    try:
+        jobs_df, job_vecs = get_job_corpus()
+    except FileNotFoundError as e:
+        logger.warning(str(e))
+        return pd.DataFrame()
+
+    try:
+        # Generate resume embedding unless the caller already has one
+        if resume_vec is None:
+            resume_vec = embed_text(resume_text)
+
+        # Embeddings are normalized, so one matvec gives every cosine similarity
+        similarities = (job_vecs @ resume_vec).astype(np.float64)
+        scores = np.round(similarities * 100, 1)
+
+        # Filter by threshold, then select the top N without sorting everything
+        candidates = np.flatnonzero(scores >= threshold * 100)
+        if len(candidates) > top_n:
+            keep = np.argpartition(-scores[candidates], top_n - 1)[:top_n]
+            candidates = candidates[keep]
+        order = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+        # Only the selected rows are copied, so the cached corpus is never mutated
+        df = jobs_df.iloc[order].copy()
+        df["semantic_match"] = scores[order].tolist()
+        return df
 
     except Exception as e:
         logger.error(f"Error in semantic job matching: {str(e)}")
@@ -49,12 +117,13 @@ def semantic_recommend_jobs(
 def semantic_recommend_jobs_v2(
         resume_text: str,
         top_n: int = 3,
-        threshold: float = 0.5
+        threshold: float = 0.5,
+        resume_vec: Optional[np.ndarray] = None
 ) -> List[Dict]:
     """
     Enhanced semantic job recommendations with explanations.
     """
-    df = semantic_recommend_jobs(resume_text, top_n, threshold)
+    df = semantic_recommend_jobs(resume_text, top_n, threshold, resume_vec)
 
     if df.empty:
         return []
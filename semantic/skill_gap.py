@@ -2,11 +2,43 @@ from typing import List, Tuple, Dict
 import logging
 
 from semantic.embeddings import embed_text, cosine_similarity
+from semantic.cache import disk_memory, scoring_fingerprint, text_digest, trim_disk_cache
 from config import SEMANTIC_SIMILARITY_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
 
+@disk_memory.cache(ignore=['resume_text'])
+def _match_required_skills(
+        resume_text: str,
+        text_hash: str,
+        required_skills: Tuple[str, ...],
+        threshold: float,
+        fingerprint: str
+) -> Tuple[List[Tuple[str, float]], List[str]]:
+    """
+    Split required skills into matched/missing (persistently cached).
+    Keyed on text_hash, not the resume itself; fingerprint identifies the
+    embedding model, so a model change misses.
+    """
+    resume_vec = embed_text(resume_text)
+    skill_vecs = embed_text(list(required_skills))
+
+    matched = []
+    missing = []
+
+    # FIXED BUG: Use required_skills in zip, not resume_vec
+    for skill, vec in zip(required_skills, skill_vecs):
+        sim = cosine_similarity(resume_vec, vec)
+
+        if sim >= threshold:
+            matched.append((skill, round(sim * 100, 1)))
+        else:
+            missing.append(skill)
+
+    return matched, missing
+
+
 def semantic_skill_gap(
         resume_text: str,
         required_skills: List[str],
@@ -19,21 +51,14 @@ def semantic_skill_gap(
         return [], required_skills
 
     try:
-        # Generate embeddings
-        resume_vec = embed_text(resume_text)
-        skill_vecs = embed_text(required_skills)
-
-        matched = []
-        missing = []
-
-        # FIXED BUG: Use required_skills in zip, not resume_vec
-        for skill, vec in zip(required_skills, skill_vecs):
-            sim = cosine_similarity(resume_vec, vec)
-
-            if sim >= threshold:
-                matched.append((skill, round(sim * 100, 1)))
-            else:
-                missing.append(skill)
+        matched, missing = _match_required_skills(
+            resume_text,
+            text_digest(resume_text),
+            tuple(required_skills),
+            threshold,
+            scoring_fingerprint()
+        )
+        trim_disk_cache()
 
         logger.info(
             f"Skill gap analysis: {len(matched)} matched, "
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('spacy')
+pytest.importorskip('sentence_transformers')
+
+from analyzers import ats_analyzer
+from config import NEAR_DUPLICATE_THRESHOLD
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    ats_analyzer.clear_ats_cache()
+    yield
+    ats_analyzer.clear_ats_cache()
+
+
+def test_near_duplicates_do_not_share_scores(monkeypatch):
+    # Both resumes embed to the same vector, far above NEAR_DUPLICATE_THRESHOLD
+    same_vec = np.ones(8, dtype=np.float32)
+    monkeypatch.setattr(ats_analyzer, 'embed_text', lambda text: same_vec)
+    assert NEAR_DUPLICATE_THRESHOLD < 1.0
+
+    def fake_analysis(resume_text, resume_skills, job_role):
+        return {'ats_score': 50 + 10 * resume_text.count('docker')}
+
+    monkeypatch.setattr(ats_analyzer, '_analyze_ats_compatibility', fake_analysis)
+
+    base = "Backend engineer with python, sql and kubernetes experience."
+    first = ats_analyzer.analyze_ats_compatibility(base, ['python'], 'DevOps Engineer')
+    second = ats_analyzer.analyze_ats_compatibility(base + " docker", ['python'], 'DevOps Engineer')
+
+    assert first['ats_score'] == 50
+    assert second['ats_score'] == 60
+
+
+def test_lru_stays_bounded_under_concurrent_use(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(ats_analyzer, 'ATS_CACHE_SIZE', 4)
+    monkeypatch.setattr(ats_analyzer, '_analyze_ats_compatibility',
+                        lambda resume_text, resume_skills, job_role: {'ats_score': len(resume_text)})
+
+    def run(i):
+        text = "resume " * (i % 10 + 1)
+        return ats_analyzer.analyze_ats_compatibility(text, ['python'], 'Data Analyst')['ats_score'] == len(text)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(run, range(2000)))
+
+    assert len(ats_analyzer._ats_cache) <= 4
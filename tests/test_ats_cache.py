@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+# semantic/__init__ loads the embedding model module
+pytest.importorskip('sentence_transformers')
+
+from semantic import ats_cache
+from semantic.ats_cache import SemanticATSCache
+
+
+KEY = (('python', 'sql'), 'Data Analyst')
+
+
+def _unit(angle):
+    # 2-d unit vector; the inner product of two is cos(angle difference)
+    return np.array([np.cos(angle), np.sin(angle)], dtype=np.float32)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ats_cache.time, 'time', lambda: now[0])
+    return now
+
+
+def test_hit_at_or_above_threshold(clock):
+    cache = SemanticATSCache(threshold=0.95)
+    cache.put(KEY, _unit(0.0), {'ats_score': 70})
+
+    # cos(0.1) ~ 0.995, scaled vectors are normalized first
+    assert cache.get(KEY, 3 * _unit(0.1)) == {'ats_score': 70}
+    assert cache.stats['hits'] == 1
+
+
+def test_miss_below_threshold(clock):
+    cache = SemanticATSCache(threshold=0.95)
+    cache.put(KEY, _unit(0.0), {'ats_score': 70})
+
+    # cos(0.5) ~ 0.878
+    assert cache.get(KEY, _unit(0.5)) is None
+    assert cache.stats['misses'] == 1
+
+
+def test_exact_key_is_required(clock):
+    cache = SemanticATSCache(threshold=0.95)
+    cache.put(KEY, _unit(0.0), {'ats_score': 70})
+
+    assert cache.get((('python', 'sql'), 'ML Engineer'), _unit(0.0)) is None
+
+
+def test_best_candidate_wins(clock):
+    cache = SemanticATSCache(threshold=0.9)
+    cache.put(KEY, _unit(0.0), 'first')
+    cache.put(KEY, _unit(0.3), 'second')
+
+    assert cache.get(KEY, _unit(0.28)) == 'second'
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = SemanticATSCache(threshold=0.95, ttl=60)
+    cache.put(KEY, _unit(0.0), {'ats_score': 70})
+
+    clock[0] += 59
+    assert cache.get(KEY, _unit(0.0)) == {'ats_score': 70}
+
+    clock[0] += 1
+    assert cache.get(KEY, _unit(0.0)) is None
+    assert cache.size() == 0
+
+
+def test_oldest_entry_evicted_when_full(clock):
+    cache = SemanticATSCache(max_size=2, threshold=0.95)
+    cache.put(KEY, _unit(0.0), 'a')
+    clock[0] += 1
+    cache.put(KEY, _unit(1.0), 'b')
+    clock[0] += 1
+    cache.put(KEY, _unit(2.0), 'c')
+
+    assert cache.size() == 2
+    assert cache.get(KEY, _unit(0.0)) is None
+    assert cache.get(KEY, _unit(2.0)) == 'c'
@@ -0,0 +1,83 @@
+import re
+
+import pytest
+
+# nlp/__init__ loads spaCy
+pytest.importorskip('spacy')
+
+from nlp import keyword_matcher
+
+
+@pytest.fixture(params=['ahocorasick', 'numba', 'python'])
+def backend(request, monkeypatch):
+    """Run a test against each optional backend."""
+    if request.param == 'ahocorasick' and keyword_matcher.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    if request.param == 'numba' and keyword_matcher.njit is None:
+        pytest.skip("numba not installed")
+
+    if request.param != 'ahocorasick':
+        monkeypatch.setattr(keyword_matcher, 'ahocorasick', None)
+    if request.param == 'python':
+        monkeypatch.setattr(keyword_matcher, 'njit', None)
+    return request.param
+
+
+def test_count_keywords_self_overlapping(backend):
+    keywords = keyword_matcher.keyword_key(['aa', 'aba'])
+    text = "aaaa ababa"
+
+    assert keyword_matcher.count_keywords(text, keywords) == {
+        'aa': text.count('aa'),
+        'aba': text.count('aba'),
+    }
+
+
+KEYWORDS = ['python', 'java', 'javascript', 'sql', 'nosql', 'c++', 'c#', '.net', 'node.js',
+            'ci/cd', 'machine learning', 'r', 'go', 'aa', 'a a']
+FRAGMENTS = ['python', 'java', 'script', 'javascript', 'sql', 'no', 'c++', 'c#', '.net', 'node',
+             '.js', 'ci/cd', 'machine', 'learning', 'r', 'go', 'a', 'aa', ' ', ' ', ', ', '-', '_', '/', '.']
+
+
+def _random_texts(n=300, seed=0):
+    import random
+    rng = random.Random(seed)
+    return [''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 30))) for _ in range(n)]
+
+
+def test_count_keywords_matches_str_count(backend):
+    keywords = keyword_matcher.keyword_key(KEYWORDS)
+    for text in _random_texts():
+        expected = {k: text.count(k) for k in keywords if text.count(k)}
+        assert keyword_matcher.count_keywords(text, keywords) == expected, text
+
+
+def test_scan_keywords_matches_substring(backend):
+    keywords = keyword_matcher.keyword_key(KEYWORDS)
+    for text in _random_texts(seed=1):
+        assert keyword_matcher.scan_keywords(text, keywords) == {k for k in keywords if k in text}, text
+
+
+def test_find_whole_words_matches_regex(backend):
+    keywords = keyword_matcher.keyword_key(KEYWORDS)
+    for text in _random_texts(seed=2):
+        expected = {k for k in keywords if re.search(r'\b' + re.escape(k) + r'\b', text)}
+        assert keyword_matcher.find_whole_words(text, keywords) == expected, text
+
+
+def test_count_whole_words_matches_regex(backend):
+    keywords = keyword_matcher.keyword_key(KEYWORDS)
+    for text in _random_texts(seed=3):
+        expected = {}
+        for k in keywords:
+            n = len(re.findall(r'\b' + re.escape(k) + r'\b', text))
+            if n:
+                expected[k] = n
+        assert keyword_matcher.count_whole_words(text, keywords) == expected, text
+
+
+def test_empty_inputs(backend):
+    assert keyword_matcher.count_keywords("", ('python',)) == {}
+    assert keyword_matcher.count_keywords("python", ()) == {}
+    assert keyword_matcher.find_whole_words("", ('python',)) == set()
+    assert keyword_matcher.count_whole_words("python", ()) == {}
@@ -0,0 +1,38 @@
+import pytest
+
+from ml.model_config import get_recommended_roles, get_recommended_roles_batch
+
+
+SKILL_LISTS = [
+    ['Python', 'pandas', 'numpy', 'statistics'],
+    ['docker', 'kubernetes', 'jenkins'],
+    ['react', 'node.js', 'html'],
+    ['cooking'],
+    [],
+]
+
+
+def test_batch_matches_single():
+    expected = [get_recommended_roles(skills) for skills in SKILL_LISTS]
+    assert get_recommended_roles_batch(SKILL_LISTS) == expected
+
+
+def test_batch_matches_single_on_misspelt_skills():
+    pytest.importorskip('rapidfuzz')
+
+    skill_lists = [
+        ['tensrflow', 'pytorh', 'machine learnng'],
+        ['kuberntes', 'dokcer', 'terraform'],
+        ['Pyhton', 'pandas'],
+        ['tensrflow'],
+    ]
+
+    expected = [get_recommended_roles(skills) for skills in skill_lists]
+    assert get_recommended_roles_batch(skill_lists) == expected
+
+    # The typos really were canonicalized, not just dropped on both paths
+    assert 'DevOps Engineer' in get_recommended_roles_batch([['kuberntes', 'dokcer']])[0]
+
+
+def test_batch_empty():
+    assert get_recommended_roles_batch([]) == []
@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+
+from config import DATA_DIR
+from ml import predictor
+from ml.train_model import export_onnx
+
+
+TEXTS = [
+    "python machine learning models, feature engineering and training pipelines",
+    "sql dashboards, excel reporting and data analysis for business stakeholders",
+    "docker kubernetes ci/cd pipelines and cloud infrastructure automation",
+    "java spring boot rest api services with authentication and databases",
+    "algorithms, data structures and clean code for large software systems",
+    "too short",
+    "",
+]
+
+
+@pytest.fixture
+def fitted_model(monkeypatch):
+    df = pd.read_csv(DATA_DIR / "job_descriptions.csv")
+    X = df["job_description"].str.lower().tolist() * 3
+    y = df["job_title"].tolist() * 3
+
+    model = Pipeline([
+        ('tfidf', TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True)),
+        ('clf', LogisticRegression(max_iter=1000))
+    ]).fit(X, y)
+
+    # Serve this model from the predictor's singletons
+    monkeypatch.setattr(predictor, '_model_cache', model)
+    monkeypatch.setattr(predictor, '_metadata_cache', {})
+    monkeypatch.setattr(predictor, '_onnx_session', lambda: None)
+    predictor._class_names.cache_clear()
+    predictor._score.cache_clear()
+    yield model
+    predictor._class_names.cache_clear()
+    predictor._score.cache_clear()
+
+
+def _single(text):
+    try:
+        return predictor.predict_job_role(text)
+    except ValueError:
+        return predictor.DEFAULT_ROLE, 0.0
+
+
+def test_predict_batch_matches_single(fitted_model):
+    batch = predictor.JobRolePredictor().predict_batch(TEXTS)
+    assert batch == [_single(text) for text in TEXTS]
+
+
+def test_predict_batch_matches_single_with_onnx(fitted_model, monkeypatch, tmp_path):
+    pytest.importorskip('skl2onnx')
+    ort = pytest.importorskip('onnxruntime')
+
+    # The export is refused (and batches stay on sklearn) unless it agrees with
+    # sklearn; either way a text must score the same alone and in a batch
+    onnx_path = tmp_path / "job_role_model.onnx"
+    if export_onnx(fitted_model, onnx_path, TEXTS[:5]):
+        session = ort.InferenceSession(str(onnx_path), providers=['CPUExecutionProvider'])
+        monkeypatch.setattr(predictor, '_onnx_session', lambda: session)
+    else:
+        assert not onnx_path.exists()
+
+    batch = predictor.JobRolePredictor().predict_batch(TEXTS)
+    assert batch == [_single(text) for text in TEXTS]
+
+
+def test_export_onnx_requires_samples(fitted_model, tmp_path):
+    onnx_path = tmp_path / "job_role_model.onnx"
+    onnx_path.write_bytes(b"stale")
+
+    assert not export_onnx(fitted_model, onnx_path, [])
+    assert not onnx_path.exists()
@@ -0,0 +1,105 @@
+import pytest
+
+# core/__init__ imports the Streamlit pipeline
+pytest.importorskip('streamlit')
+
+from core import rcache
+
+
+class FakeRedis:
+    """In-memory stand-in for the few client calls rcache uses."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+
+def test_make_key_is_prefixed_and_stable():
+    key = rcache.make_key("embed", b"resume text")
+
+    assert key.startswith(b"embed:")
+    assert key == rcache.make_key("embed", b"resume text")
+    assert key != rcache.make_key("embed", b"other text")
+    assert key != rcache.make_key("score", b"resume text")
+
+
+def test_memoize_computes_once_with_client(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(rcache, 'get_client', lambda: client)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'score': 42}
+
+    key = rcache.make_key("test", b"a")
+    assert rcache.rcache_memoize(key, compute) == {'score': 42}
+    assert rcache.rcache_memoize(key, compute) == {'score': 42}
+    assert len(calls) == 1
+    assert client.ttls[key] == rcache.CACHE_TTL
+
+
+def test_memoize_without_client_always_computes(monkeypatch):
+    monkeypatch.setattr(rcache, 'get_client', lambda: None)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    key = rcache.make_key("test", b"b")
+    assert rcache.rcache_memoize(key, compute) == 1
+    assert rcache.rcache_memoize(key, compute) == 2
+
+
+def test_client_errors_are_not_raised(monkeypatch):
+    class BrokenRedis:
+        def get(self, key):
+            raise ConnectionError("down")
+
+        def setex(self, key, ttl, value):
+            raise ConnectionError("down")
+
+    monkeypatch.setattr(rcache, 'get_client', lambda: BrokenRedis())
+
+    assert rcache.rcache_get(b"k") is None
+    rcache.rcache_set(b"k", 1)
+    assert rcache.rcache_memoize(b"k", lambda: 7) == 7
+
+
+def test_values_round_trip_without_pickle(monkeypatch):
+    import numpy as np
+
+    client = FakeRedis()
+    monkeypatch.setattr(rcache, 'get_client', lambda: client)
+
+    embedding = np.arange(6, dtype=np.float32).reshape(2, 3)
+    rcache.rcache_set(b"emb", embedding)
+    cached = rcache.rcache_get(b"emb")
+    assert cached.dtype == np.float32 and cached.shape == (2, 3)
+    np.testing.assert_array_equal(cached, embedding)
+
+    result = {'skills': ['python', 'sql'], 'confidence': np.float64(87.5), 'resume_text': 'x'}
+    rcache.rcache_set(b"res", result)
+    assert rcache.rcache_get(b"res") == {'skills': ['python', 'sql'], 'confidence': 87.5, 'resume_text': 'x'}
+    assert client.store[b"res"].startswith(b'J')
+
+
+def test_untrusted_payloads_are_rejected(monkeypatch):
+    import pickle
+
+    client = FakeRedis()
+    client.store[b"evil"] = pickle.dumps({'a': 1})
+    header = b'{"dtype":"|O","shape":[1]}'
+    client.store[b"obj"] = b'A' + len(header).to_bytes(4, 'big') + header + bytes(8)
+    monkeypatch.setattr(rcache, 'get_client', lambda: client)
+
+    assert rcache.rcache_get(b"evil") is None
+    assert rcache.rcache_get(b"obj") is None
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+# semantic/__init__ loads the embedding model module
+pytest.importorskip('sentence_transformers')
+
+from semantic import cache
+
+
+def test_fingerprint_tracks_model_and_quantize(monkeypatch):
+    base = cache.scoring_fingerprint()
+
+    monkeypatch.setattr(cache, 'EMBEDDING_QUANTIZE', not cache.EMBEDDING_QUANTIZE)
+    assert cache.scoring_fingerprint() != base
+
+    monkeypatch.undo()
+    monkeypatch.setattr(cache, 'EMBEDDING_MODEL', 'another-model')
+    assert cache.scoring_fingerprint() != base
+
+
+def test_fingerprint_tracks_data_file(tmp_path):
+    data = tmp_path / "ats_job_skills.json"
+    data.write_text('{"Data Analyst": {"core": ["sql"]}}')
+    before = cache.scoring_fingerprint(data)
+
+    assert cache.scoring_fingerprint(data) == before
+
+    data.write_text('{"Data Analyst": {"core": ["sql", "python"]}}')
+    os.utime(data, ns=(1, 2_000_000_000))
+    assert cache.scoring_fingerprint(data) != before
+
+
+def test_fingerprint_missing_file(tmp_path):
+    assert 'missing:none.json' in cache.scoring_fingerprint(tmp_path / "none.json")
+
+
+def test_job_embeddings_path_tracks_quantize(monkeypatch, tmp_path):
+    from semantic import semantic_matcher
+
+    jobs_file = tmp_path / "job_descriptions.csv"
+    jobs_file.write_text("job_title,job_description\nData Analyst,sql and python\n")
+    before = semantic_matcher._job_embeddings_path(jobs_file)
+
+    monkeypatch.setattr(cache, 'EMBEDDING_QUANTIZE', not cache.EMBEDDING_QUANTIZE)
+    assert semantic_matcher._job_embeddings_path(jobs_file) != before
+
+
+def test_disk_cached_scores_never_store_resume_text(monkeypatch, tmp_path):
+    import numpy as np
+    from joblib import Memory
+    from semantic import skill_gap
+
+    assert skill_gap._match_required_skills.ignore == ['resume_text']
+
+    # Same wrapping as disk_memory, in a throwaway location
+    monkeypatch.setattr(skill_gap, 'embed_text', lambda text: np.ones(4) if isinstance(text, str) else np.ones((len(text), 4)))
+    cached = Memory(str(tmp_path), verbose=0).cache(ignore=['resume_text'])(skill_gap._match_required_skills.func)
+
+    resume = "John Doe, john@example.com, python and sql"
+    cached(resume, cache.text_digest(resume), ('python',), 0.5, cache.scoring_fingerprint())
+
+    stored = b"".join(p.read_bytes() for p in tmp_path.rglob("*") if p.is_file())
+    assert b"john@example.com" not in stored
+    assert cache.text_digest(resume).encode() in stored
+
+
+def test_trim_disk_cache_is_throttled(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cache.disk_memory, 'reduce_size', lambda **kwargs: calls.append(kwargs))
+    monkeypatch.setattr(cache, '_last_disk_trim', float('-inf'))
+
+    cache.trim_disk_cache()
+    cache.trim_disk_cache()
+    assert len(calls) == 1
+    assert calls[0]['bytes_limit'] == cache.DISK_CACHE_BYTES_LIMIT
+
+    cache.trim_disk_cache(force=True)
+    assert len(calls) == 2
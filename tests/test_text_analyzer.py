@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+# nlp/__init__ loads spaCy
+pytest.importorskip('spacy')
+
+from nlp import text_analyzer
+from nlp.text_analyzer import TextAnalyzer
+
+
+FRAGMENTS = ['Led', 'managed', 'designed', 'optimized', 'responsible', 'for', 'Responsible for',
+             'worked on', 'helped', 'with', 'was', 'did', 'I', 'my', 'We', "I'm", 'our',
+             'increased revenue by 25%', 'saved $300', 'python', 'sql', 'responsible_for']
+SEPARATORS = [' ', ' ', '  ', '\n', '. ', ', ', '\n- ', '\n• ', '! ']
+
+
+def _random_texts(n=200, seed=0):
+    rng = random.Random(seed)
+    return [
+        ''.join(rng.choice(FRAGMENTS) + rng.choice(SEPARATORS) for _ in range(rng.randint(0, 40)))
+        for _ in range(n)
+    ]
+
+
+EDGE_CASES = ['', ' ', 'responsible for', 'responsible  for', 'responsible\nfor', 'responsibleFor']
+
+
+def test_analyze_batch_matches_analyze():
+    analyzer = TextAnalyzer()
+    texts = _random_texts() + EDGE_CASES
+
+    assert analyzer.analyze_batch(texts) == [analyzer.analyze(text) for text in texts]
+
+
+def test_analyze_batch_without_numba(monkeypatch):
+    monkeypatch.setattr(text_analyzer, '_TERM_INDEX', None)
+    analyzer = TextAnalyzer()
+    texts = _random_texts(n=50, seed=1)
+
+    assert analyzer.analyze_batch(texts) == [analyzer.analyze(text) for text in texts]
+
+
+def test_analyze_batch_empty():
+    assert TextAnalyzer().analyze_batch([]) == []
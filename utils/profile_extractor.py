@@ -1,5 +1,11 @@
 import re
 
+EMAIL_RE = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+PHONE_RE = re.compile(r"\+?\d[\d\s\-]{8,15}")
+LINKEDIN_RE = re.compile(r"https?://(?:www\.)?linkedin\.com/[^\s]+")
+GITHUB_RE = re.compile(r"https?://(?:www\.)?github\.com/[^\s]+")
+
+
 def extract_profile_info(text) :
     lines = [l.strip() for l in text.split("\n") if l.strip()]
 
@@ -9,32 +15,20 @@ def extract_profile_info(text) :
             name = line.title()
             break
 
-    email_match = re.findall(
-        r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+",
-        text
-    )
-    email = email_match[0] if email_match else "Not Found"
+    email_match = EMAIL_RE.search(text)
+    email = email_match.group(0) if email_match else "Not Found"
 
     # ---------- PHONE ------------
-    phone_match = re.findall(
-        r"\+?\d[\d\s\-]{8,15}",
-        text
-    )
-    phone = phone_match[0] if phone_match else "Not found"
+    phone_match = PHONE_RE.search(text)
+    phone = phone_match.group(0) if phone_match else "Not found"
 
     # ---------- LINKEDIN ----------
-    linkedin_match = re.findall(
-        r"(https?://(www\.)?linkedin\.com/[^\s]+)",
-        text
-    )
-    linkedin = linkedin_match[0][0] if linkedin_match else "Not found"
+    linkedin_match = LINKEDIN_RE.search(text)
+    linkedin = linkedin_match.group(0) if linkedin_match else "Not found"
 
     # ---------- GITHUB ----------
-    github_match = re.findall(
-        r"(https?://(www\.)?github\.com/[^\s]+)",
-        text
-    )
-    github = github_match[0][0] if github_match else "Not found"
+    github_match = GITHUB_RE.search(text)
+    github = github_match.group(0) if github_match else "Not found"
 
     return {
         "name": name,
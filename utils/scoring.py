@@ -1,3 +1,6 @@
+EXPERIENCE_KEYWORDS = ("experience", "project", "internship", "worked", "developed")
+ACHIEVEMENT_KEYWORDS = ("achievement", "certification", "certified", "award")
+
 
 def calculate_resume_score(skills, cleaned_text) :
     score = 0
@@ -14,13 +17,11 @@ def calculate_resume_score(skills, cleaned_text) :
         score += 10
 
     # 3- Experience Indicators(max 20)
-    experience_keywords = ["experience", "project", "internship", "worked", "developed"]
-    exp_hits = sum(1 for k in experience_keywords if k in cleaned_text)
+    exp_hits = sum(k in cleaned_text for k in EXPERIENCE_KEYWORDS)
     score += min(exp_hits*5, 20)
 
     # 4- Certification / achievement keywords (max 10)
-    achievement_keywords = ["achievement", "certification", "certified", "award"]
-    ach_hits = sum(1 for k in achievement_keywords if k in cleaned_text)
+    ach_hits = sum(k in cleaned_text for k in ACHIEVEMENT_KEYWORDS)
     score += min(ach_hits*5, 10)
 
-    return min(score, 100)
\ No newline at end of file
+    return min(score, 100)